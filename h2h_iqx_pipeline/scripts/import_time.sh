@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Show the slowest imports behind the CLI entry point (cumulative microseconds)
+# and fail when the module itself takes longer than BUDGET_US (default 150000).
+# tests/test_import_time.py only checks that no heavy module is imported.
+MODULE="${1:-h2h_pipeline.cli}"
+BUDGET_US="${BUDGET_US:-150000}"
+cd "$(dirname "$0")/.."
+TIMES="$(PYTHONPATH=src python -X importtime -c "import ${MODULE}" 2>&1)"
+echo "${TIMES}" | sort -t'|' -k2 -n | tail -n 25
+TOTAL="$(echo "${TIMES}" | awk -F'|' -v m="${MODULE}" '{gsub(/ /, "", $3)} $3 == m {gsub(/ /, "", $2); print $2}')"
+echo "${MODULE}: ${TOTAL}us (budget ${BUDGET_US}us)"
+[ "${TOTAL}" -le "${BUDGET_US}" ]
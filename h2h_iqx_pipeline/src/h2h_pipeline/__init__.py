@@ -1,5 +1,12 @@
 """H2H to IQX pipeline package."""
 
-from .pipeline import run_pipeline
-
 __all__ = ["run_pipeline"]
+
+
+def __getattr__(name: str):
+    # Imported on first use so lightweight entry points do not pay for pandas.
+    if name == "run_pipeline":
+        from .pipeline import run_pipeline
+
+        return run_pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
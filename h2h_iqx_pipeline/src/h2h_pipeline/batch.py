@@ -0,0 +1,195 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+import copy
+import logging
+import multiprocessing
+import os
+import time
+
+from . import file_discovery
+from .logging_config import ForwardedRecordListener, configure_logging, flush_logging, forward_records
+from .models import BatchMonthResult
+from .pipeline import run_pipeline
+from .utils.dates import month_range, previous_month
+from .utils.mappings import load_yaml_mapping
+
+logger = logging.getLogger(__name__)
+
+RUN_DATE_KEYS = ("output_date", "current_date", "run_date")
+
+
+def plan_batch(months: List[str], input_root: Path, config: Mapping[str, Any]) -> List[List[str]]:
+    """Group months into chains that must run in order.
+
+    A month depends on the month before it when that month is part of the
+    batch and its Combo is not already in the input tree; the two then share
+    a chain and the later month reads the Combo the earlier one exports.
+    Separate chains are independent of each other.
+    """
+    chains: List[List[str]] = []
+    in_batch = set(months)
+    for month in months:
+        prev = previous_month(month)
+        follows_chain = bool(chains) and prev in in_batch and chains[-1][-1] == prev
+        if follows_chain and not _has_previous_combo(month, input_root, config):
+            chains[-1].append(month)
+        else:
+            chains.append([month])
+    return chains
+
+
+def run_batch(
+    start: str,
+    end: str,
+    input_root: Path,
+    config: Mapping[str, Any],
+    workers: int | None = None,
+) -> List[BatchMonthResult]:
+    """Run every month from ``start`` to ``end``, chains in parallel processes.
+
+    Each month writes to ``<output_root>/<month>``. With one worker (or a
+    single chain) everything runs in this process. Worker processes forward
+    their log records to this one, which alone writes ``pipeline.log``.
+    """
+    months = month_range(start, end)
+    chains = plan_batch(months, input_root, config)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(chains)))
+    logger.info(
+        "Batch %s..%s: %s months in %s chains on %s workers", start, end, len(months), len(chains), workers
+    )
+
+    results: List[BatchMonthResult] = []
+    if workers == 1:
+        for chain in chains:
+            results.extend(run_chain(chain, input_root, config))
+    else:
+        # Parse the mapping files once here; forked workers inherit the registry's views.
+        mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
+        for path in mapping_cfg.values():
+            load_yaml_mapping(path)
+        configure_logging(config)
+        log_queue = multiprocessing.Queue()
+        listener = ForwardedRecordListener(log_queue)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_forward_logs, initargs=(log_queue,)
+            ) as executor:
+                futures = [executor.submit(run_chain, chain, input_root, config) for chain in chains]
+                for future in as_completed(futures):
+                    results.extend(future.result())
+        finally:
+            # The workers have exited, so every record they sent is ahead of the stop marker.
+            listener.stop()
+            flush_logging()
+    results.sort(key=lambda item: item.month)
+    return results
+
+
+def run_chain(months: List[str], input_root: Path, config: Mapping[str, Any]) -> List[BatchMonthResult]:
+    """Run dependent months in order, feeding each month's Combo to the next."""
+    results: List[BatchMonthResult] = []
+    previous_combo: Path | None = None
+    failed: str | None = None
+    for idx, month in enumerate(months):
+        depends_on = months[idx - 1] if idx else None
+        result = BatchMonthResult(month=month, depends_on=depends_on)
+        results.append(result)
+        if failed:
+            result.error = f"skipped: {failed} failed"
+            continue
+
+        month_config = month_run_config(config, month, previous_combo)
+        started = time.perf_counter()
+        try:
+            run = run_pipeline(month=month, input_root=input_root, config=month_config)
+        except Exception as exc:
+            logger.exception("Batch month %s failed", month)
+            result.error = str(exc) or exc.__class__.__name__
+            result.seconds = time.perf_counter() - started
+            failed = month
+            continue
+        result.seconds = time.perf_counter() - started
+        result.run_label = run.run_label
+        result.report_path = run.report_path
+        result.combo_path = run.export_paths.get("combo_excel")
+        for span in run.spans:
+            if span.phase == "end":
+                result.stage_seconds[span.stage] = span.wall_seconds or 0.0
+                if span.stage == "dedup":
+                    result.rows_out = span.rows_out
+        previous_combo = result.combo_path
+    return results
+
+
+def month_run_config(
+    config: Mapping[str, Any], month: str, previous_combo: Path | None = None
+) -> Dict[str, Any]:
+    """Copy ``config`` for one batch month with its own output folder and run dates."""
+    month_config = copy.deepcopy(dict(config))
+    run_cfg = dict(month_config.get("run") or {})
+    for key in RUN_DATE_KEYS:
+        run_cfg.pop(key, None)
+    run_cfg["current_month"] = month
+    run_cfg["previous_month"] = previous_month(month)
+    if previous_combo is not None:
+        run_cfg["previous_combo"] = str(previous_combo)
+    else:
+        run_cfg.pop("previous_combo", None)
+    month_config["run"] = run_cfg
+
+    paths_cfg = dict(month_config.get("paths") or {})
+    paths_cfg["output_root"] = str(Path(paths_cfg.get("output_root", "output")) / month)
+    month_config["paths"] = paths_cfg
+    return month_config
+
+
+def format_summary(results: List[BatchMonthResult], wall_seconds: float) -> str:
+    """Render a combined timing table for a batch run."""
+    stages: List[str] = []
+    for result in results:
+        for stage in result.stage_seconds:
+            if stage not in stages:
+                stages.append(stage)
+
+    header = ["month", "label", *stages, "total", "rows", "status"]
+    rows = []
+    for result in results:
+        rows.append(
+            [
+                result.month,
+                result.run_label or "-",
+                *(_seconds(result.stage_seconds.get(stage)) for stage in stages),
+                _seconds(result.seconds),
+                "-" if result.rows_out is None else str(result.rows_out),
+                "ok" if result.ok else result.error or "failed",
+            ]
+        )
+    totals = [sum(r.stage_seconds.get(stage, 0.0) for r in results) for stage in stages]
+    month_total = sum(r.seconds for r in results)
+    rows.append(["total", "", *(_seconds(v) for v in totals), _seconds(month_total), "", ""])
+
+    widths = [max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))]
+    lines = ["  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)).rstrip() for row in [header, *rows]]
+    failed = sum(1 for r in results if not r.ok)
+    lines.append("")
+    lines.append(
+        f"{len(results) - failed}/{len(results)} months succeeded in {wall_seconds:.2f}s wall "
+        f"({month_total:.2f}s of month time)"
+    )
+    return "\n".join(lines)
+
+
+def _forward_logs(log_queue: Any) -> None:
+    forward_records(log_queue.put)
+
+
+def _seconds(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def _has_previous_combo(month: str, input_root: Path, config: Mapping[str, Any]) -> bool:
+    lookup = {**config, "run": {"previous_month": previous_month(month)}}
+    return file_discovery.find_previous_combo(input_root, lookup) is not None
@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping
+
+import threading
+
+# Stage loops call their cancel check once per this many rows. A few thousand
+# rows of openpyxl parsing or per-row formatting take well under a second.
+CHECK_EVERY_ROWS = 2000
+
+# Called by stages inside long loops; raises RunCancelled to stop the run.
+CancelCheck = Callable[[], None]
+
+
+class RunCancelled(Exception):
+    """Raised inside a stage when the run was cancelled.
+
+    ``stage`` names the stage that stopped and ``report_path`` points at the
+    partial QA report once :func:`h2h_pipeline.pipeline.run_pipeline` has
+    written it.
+    """
+
+    def __init__(self, reason: str, stage: str | None = None) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.stage = stage
+        self.report_path: Path | None = None
+
+
+class StageBudgetExceeded(RunCancelled):
+    """Raised when a stage runs longer than its ``execution.stage_budgets`` entry."""
+
+
+class CancelToken:
+    """Thread-safe flag a caller sets to stop a running pipeline.
+
+    Stages check the token between chunks of rows, so a cancel takes effect
+    at the next check rather than immediately. Pass a ``multiprocessing``
+    event as ``event`` to cancel a run in a child process from the parent.
+    """
+
+    def __init__(self, event: Any | None = None) -> None:
+        self._event = event if event is not None else threading.Event()
+        self.reason = "Cancelled by user"
+
+    def cancel(self, reason: str | None = None) -> None:
+        if reason:
+            self.reason = reason
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise RunCancelled(self.reason)
+
+
+def stage_budgets(config: Mapping[str, Any]) -> Dict[str, float]:
+    """Per-stage wall-clock limits in seconds from ``execution.stage_budgets``."""
+    exec_cfg = config.get("execution", {}) if isinstance(config, Mapping) else {}
+    raw = exec_cfg.get("stage_budgets") or {}
+    budgets: Dict[str, float] = {}
+    for stage, seconds in raw.items():
+        if seconds is None:
+            continue
+        try:
+            budgets[str(stage)] = float(seconds)
+        except (TypeError, ValueError):
+            raise ValueError(f"execution.stage_budgets.{stage} must be a number of seconds, got {seconds!r}")
+    return budgets
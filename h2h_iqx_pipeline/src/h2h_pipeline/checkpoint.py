@@ -0,0 +1,248 @@
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+
+from .models import DedupResult, DiscoveryResult, TransformResult, ValidationReport
+
+logger = logging.getLogger(__name__)
+
+# Bump when a stage's output format or logic changes so old checkpoints are ignored.
+CHECKPOINT_VERSION = 1
+
+INGESTION_SECTIONS = ("sources", "date_handling")
+TRANSFORM_SECTIONS = ("iqx_import", "defaults", "date_handling", "run")
+TRANSFORM_MAPPINGS = ("professions", "service_branches")
+DEDUP_MAPPINGS = ("source_priority",)
+# Unfinished checkpoint directories older than this are left over from a crashed run and removed.
+STALE_TMP_SECONDS = 24 * 60 * 60
+
+
+class StageCheckpoint:
+    """Frames plus JSON metadata saved for one stage."""
+
+    def __init__(self, frames: Dict[str, pd.DataFrame], meta: Mapping[str, Any]) -> None:
+        self.frames = frames
+        self.meta = dict(meta)
+
+
+class CheckpointStore:
+    """Stage outputs on disk, keyed by a hash of each stage's inputs.
+
+    Frames are written as Parquet when a Parquet engine is installed and fall
+    back to pickle otherwise (or when a frame has mixed-type columns that
+    Parquet cannot store). Only the latest key per stage is kept; each save
+    writes to its own temporary directory and removes only finished
+    checkpoints, so a concurrent run's save in progress is left alone.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def load(self, stage: str, key: str) -> StageCheckpoint | None:
+        stage_dir = self.root / stage / key
+        manifest_path = stage_dir / "manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        try:
+            frames = {name: _read_frame(stage_dir / filename) for name, filename in manifest["frames"].items()}
+        except Exception as exc:
+            logger.warning("Ignoring unreadable %s checkpoint %s: %s", stage, key, exc)
+            return None
+        logger.info("Resuming %s from checkpoint %s", stage, key[:12])
+        return StageCheckpoint(frames, manifest.get("meta", {}))
+
+    def save(
+        self, stage: str, key: str, frames: Mapping[str, pd.DataFrame], meta: Mapping[str, Any] | None = None
+    ) -> None:
+        stage_root = self.root / stage
+        stage_dir = stage_root / key
+        tmp_dir = stage_root / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True)
+            files = {}
+            for idx, (name, df) in enumerate(frames.items()):
+                files[name] = _write_frame(df, tmp_dir / f"frame_{idx}")
+            manifest = {"version": CHECKPOINT_VERSION, "frames": files, "meta": dict(meta or {})}
+            (tmp_dir / "manifest.json").write_text(json.dumps(manifest, default=str), encoding="utf-8")
+            for old in stage_root.iterdir():
+                if old.name.startswith(".") and not _stale(old):
+                    continue  # another run's save in progress (or this one)
+                shutil.rmtree(old, ignore_errors=True)
+            tmp_dir.rename(stage_dir)
+        except OSError as exc:  # pragma: no cover - best effort
+            logger.warning("Failed to save %s checkpoint: %s", stage, exc)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class MemoryCheckpointStore:
+    """Stage outputs kept in memory for long-running modes (``watch``, ``serve``).
+
+    Same interface and keys as :class:`CheckpointStore`; frames are copied on
+    save and load so callers can never mutate a stored checkpoint.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, tuple[str, StageCheckpoint]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, stage: str, key: str) -> StageCheckpoint | None:
+        with self._lock:
+            entry = self._entries.get(stage)
+        if entry is None or entry[0] != key:
+            return None
+        logger.info("Resuming %s from in-memory checkpoint %s", stage, key[:12])
+        stored = entry[1]
+        return StageCheckpoint({name: df.copy() for name, df in stored.frames.items()}, stored.meta)
+
+    def save(
+        self, stage: str, key: str, frames: Mapping[str, pd.DataFrame], meta: Mapping[str, Any] | None = None
+    ) -> None:
+        # Round-trip meta through JSON so it matches what the on-disk store returns.
+        meta_copy = json.loads(json.dumps(dict(meta or {}), default=str))
+        stored = StageCheckpoint({name: df.copy() for name, df in frames.items()}, meta_copy)
+        with self._lock:
+            self._entries[stage] = (key, stored)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def store_from_config(config: Mapping[str, Any], month: str | None = None) -> CheckpointStore | None:
+    """Return the on-disk store when ``checkpoints.enabled`` is set.
+
+    With ``month`` the store lives in a subdirectory for that month, so runs
+    for different months sharing an output root keep their own checkpoints.
+    """
+    cp_cfg = config.get("checkpoints", {}) if isinstance(config, Mapping) else {}
+    if not cp_cfg.get("enabled"):
+        return None
+    root = cp_cfg.get("dir")
+    if not root:
+        paths_cfg = config.get("paths", {}) if isinstance(config, Mapping) else {}
+        root = Path(paths_cfg.get("output_root", "output")) / ".checkpoints"
+    return CheckpointStore(Path(root) / month if month else Path(root))
+
+
+def _stale(path: Path) -> bool:
+    try:
+        return time.time() - path.stat().st_mtime > STALE_TMP_SECONDS
+    except OSError:
+        return False
+
+
+def ingestion_key(month: str, discovery: DiscoveryResult, config: Mapping[str, Any]) -> str:
+    sources = {name: _file_state(path) for name, path in (discovery.sources or {}).items()}
+    return _digest(
+        "ingestion",
+        month,
+        sources,
+        _file_state(discovery.previous_combo),
+        _sections(config, INGESTION_SECTIONS),
+    )
+
+
+def transform_key(upstream: str, month: str, config: Mapping[str, Any]) -> str:
+    return _digest(
+        "transform",
+        upstream,
+        month,
+        _sections(config, TRANSFORM_SECTIONS),
+        _mapping_digests(config, TRANSFORM_MAPPINGS),
+    )
+
+
+def dedup_key(upstream: str, config: Mapping[str, Any]) -> str:
+    return _digest("dedup", upstream, _mapping_digests(config, DEDUP_MAPPINGS))
+
+
+def encode_transform(result: TransformResult) -> tuple[Dict[str, pd.DataFrame], Dict[str, Any]]:
+    validation = {
+        key: sorted(value) if isinstance(value, set) else value for key, value in asdict(result.validation).items()
+    }
+    return {"combo": result.combo_df}, {"validation": validation}
+
+
+def decode_transform(cp: StageCheckpoint) -> TransformResult:
+    raw = cp.meta.get("validation", {})
+    validation = ValidationReport(
+        missing_profession_mappings=set(raw.get("missing_profession_mappings", [])),
+        missing_service_branch_mappings=set(raw.get("missing_service_branch_mappings", [])),
+        invalid_phones=list(raw.get("invalid_phones", [])),
+        invalid_zips=list(raw.get("invalid_zips", [])),
+        missing_required_columns=set(raw.get("missing_required_columns", [])),
+    )
+    return TransformResult(combo_df=cp.frames["combo"], validation=validation)
+
+
+def encode_dedup(result: DedupResult) -> tuple[Dict[str, pd.DataFrame], Dict[str, Any]]:
+    return {"cleaned": result.cleaned_df, "duplicates": result.duplicates_df}, {"stats": result.stats}
+
+
+def decode_dedup(cp: StageCheckpoint) -> DedupResult:
+    return DedupResult(
+        cleaned_df=cp.frames["cleaned"],
+        duplicates_df=cp.frames["duplicates"],
+        stats=cp.meta.get("stats"),
+    )
+
+
+def _write_frame(df: pd.DataFrame, base: Path) -> str:
+    try:
+        path = base.with_suffix(".parquet")
+        df.to_parquet(path, index=False)
+        return path.name
+    except Exception:
+        path = base.with_suffix(".pkl")
+        df.to_pickle(path)
+        return path.name
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _file_state(path: Path | None) -> list[Any] | None:
+    if path is None:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return [str(path), None, None]
+    return [str(path), stat.st_size, stat.st_mtime_ns]
+
+
+def _mapping_digests(config: Mapping[str, Any], keys: tuple[str, ...]) -> Dict[str, str | None]:
+    mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
+    digests: Dict[str, str | None] = {}
+    for key in keys:
+        path_val = mapping_cfg.get(key)
+        try:
+            digests[key] = hashlib.sha256(Path(path_val).read_bytes()).hexdigest() if path_val else None
+        except OSError:
+            digests[key] = None
+    return digests
+
+
+def _sections(config: Mapping[str, Any], names: tuple[str, ...]) -> Dict[str, Any]:
+    return {name: config.get(name) for name in names} if isinstance(config, Mapping) else {}
+
+
+def _digest(*parts: Any) -> str:
+    payload = json.dumps([CHECKPOINT_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,405 @@
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Mapping
+
+import logging
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from . import dedup, export, ingestion, qa, transform, upload
+from .constants import (
+    CREATE_DATE_COLUMN,
+    DATE_AVAILABLE_COLUMN,
+    DUPLICATE_CLUSTER_COLUMN,
+    END_DATE_COLUMN,
+    KEPT_ROW_COLUMN,
+    MATCHED_ON_COLUMN,
+    SOURCE_COLUMN,
+)
+from .cancellation import CancelCheck
+from .config_loader import compile_plan
+from .dedup import KEY_LABELS
+from .instrumentation import ProgressCallback, StageSpan
+from .models import DedupResult, DiscoveryResult, ExportResult, RunPlan, ValidationReport
+from .utils.dates import resolve_run_date_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET_MB = 256
+# Rough in-memory cost of one source row while a chunk is transformed: about
+# 40 string cells, plus the copies transform makes along the way.
+BYTES_PER_ROW = 4096
+MIN_CHUNK_ROWS = 1000
+
+StageFactory = Callable[..., ContextManager[StageSpan]]
+
+
+def enabled(config: Mapping[str, Any]) -> bool:
+    exec_cfg = config.get("execution", {}) if isinstance(config, Mapping) else {}
+    return str(exec_cfg.get("mode", "memory")).lower() == "chunked"
+
+
+def chunk_rows(config: Mapping[str, Any]) -> int:
+    """Rows per chunk: ``execution.chunk_rows`` if set, else derived from the memory budget."""
+    exec_cfg = config.get("execution", {}) if isinstance(config, Mapping) else {}
+    if exec_cfg.get("chunk_rows"):
+        return max(1, int(exec_cfg["chunk_rows"]))
+    budget_mb = float(exec_cfg.get("memory_budget_mb") or DEFAULT_MEMORY_BUDGET_MB)
+    return max(MIN_CHUNK_ROWS, int(budget_mb * 1024 * 1024 / BYTES_PER_ROW))
+
+
+def run_stages(
+    month: str,
+    discovery: DiscoveryResult,
+    config: Mapping[str, Any],
+    stage: StageFactory,
+    run_plan: RunPlan | None = None,
+) -> tuple[str, ExportResult, Path]:
+    """Run ingestion through QA with only one chunk of full rows in memory at a time.
+
+    Source rows are streamed and filtered in chunks, transformed chunk by
+    chunk, and spilled to a temporary directory. Dedup runs on a compact
+    frame of hashed keys and row ids; full rows are only read back from the
+    spill files while the outputs are written. Returns the run label, the
+    export result, and the QA report path.
+    """
+    exec_cfg = config.get("execution", {}) if isinstance(config, Mapping) else {}
+    if run_plan is None:
+        run_plan = compile_plan(config)
+    rows_per_chunk = chunk_rows(config)
+    spill_root = exec_cfg.get("spill_dir") or None
+    if spill_root:
+        Path(spill_root).mkdir(parents=True, exist_ok=True)
+    logger.info("Chunked execution with %s rows per chunk", rows_per_chunk)
+
+    with tempfile.TemporaryDirectory(prefix="h2h-chunks-", dir=spill_root) as tmp:
+        spill = _Spill(Path(tmp))
+
+        # 2. Ingest source Excel in chunks, spilling each filtered chunk
+        with stage("ingestion") as span:
+            raw_paths: List[Path] = []
+            latest: pd.Timestamp | None = None
+            total = 0
+            chunks = ingestion.stream_sources(
+                discovery, config, rows_per_chunk, span.progress, span.cancel_check, run_plan
+            )
+            for _source_name, chunk in chunks:
+                if chunk.empty:
+                    continue
+                latest = _later(latest, chunk)
+                raw_paths.append(spill.write("raw", chunk))
+                total += len(chunk)
+            span.rows_out = total
+
+        run_label = resolve_run_date_value(config) or (latest.strftime("%Y-%m-%d") if latest is not None else month)
+
+        # 3. Transform each chunk; keep only its dedup keys in memory
+        with stage("transform", rows_in=total) as span:
+            columns, combo_paths, keys, validation = _transform_chunks(
+                month,
+                raw_paths,
+                latest,
+                spill,
+                config,
+                run_plan,
+                lambda done: span.progress(done, total),
+                span.cancel_check,
+            )
+            span.rows_out = len(keys)
+
+        # 4. De-duplicate on keys and row ids only
+        with stage("dedup", rows_in=len(keys)) as span:
+            plan = _plan(keys, run_plan.priority, span.cancel_check, span.progress)
+            span.rows_out = plan.kept_count
+            logger.info(
+                "Dedup completed. In: %s, out: %s, duplicates: %s",
+                len(keys),
+                plan.kept_count,
+                plan.duplicate_count,
+            )
+
+        with stage("delta", rows_in=plan.kept_count):
+            if (config.get("delta") or {}).get("enabled"):
+                logger.warning("Delta mode is not supported in chunked execution; skipping.")
+
+        # 6. Re-read full rows from the spill files and stream the outputs
+        with stage("export", rows_in=plan.kept_count) as span:
+            if ((config.get("export") or {}).get("sqlite") or {}).get("path"):
+                logger.warning("SQLite staging is not supported in chunked execution; skipping.")
+            cleaned_buckets, duplicate_buckets = _bucket_rows(combo_paths, columns, plan, spill, span.cancel_check)
+            row_counts = {"combo": len(keys), "cleaned": plan.kept_count, "duplicates": plan.duplicate_count}
+            export_paths = export.write_chunked_outputs(
+                run_label=run_label,
+                combo_chunks=(spill.read(path).reindex(columns=columns) for path in combo_paths),
+                dedup_chunks=_read_buckets(cleaned_buckets),
+                duplicates_chunks=_read_buckets(duplicate_buckets),
+                row_counts=row_counts,
+                config=config,
+                progress=span.progress,
+                check=span.cancel_check,
+            )
+
+    # 7. Optionally upload the IQX CSV to the bulk import endpoint
+    with stage("upload") as span:
+        upload_result = upload.upload_outputs(export_paths, config=config)
+        if upload_result is not None:
+            span.rows_out = upload_result.rows
+
+    # 8. Generate QA summary report
+    with stage("qa"):
+        empty = pd.DataFrame()
+        report_path = qa.generate_report(
+            run_label=run_label,
+            combo_df=empty,
+            dedup_result=DedupResult(cleaned_df=empty, duplicates_df=empty),
+            export_paths=export_paths,
+            validation=validation,
+            discovery=discovery,
+            counts_before=dict(Counter(keys[SOURCE_COLUMN].astype(str))) if len(keys) else {},
+            counts_after=plan.source_counts(),
+            config=config,
+            upload=upload_result,
+            row_counts=row_counts,
+        )
+    return run_label, export_paths, report_path
+
+
+class _Spill:
+    """Numbered pickle files in the run's temporary spill directory."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.count = 0
+
+    def write(self, kind: str, df: pd.DataFrame) -> Path:
+        self.count += 1
+        path = self.root / f"{kind}_{self.count:06d}.pkl"
+        df.to_pickle(path)
+        return path
+
+    def read(self, path: Path) -> pd.DataFrame:
+        return pd.read_pickle(path)
+
+    def bucket(self, kind: str, key: Any) -> Path:
+        return self.root / f"{kind}_bucket_{key}.pkl"
+
+
+class _ChunkPlan:
+    """Dedup outcome as arrays indexed by global row id.
+
+    Arrays rather than per-row dicts keep the plan at a few bytes per row.
+    Text annotations are stored as codes into :attr:`source_labels` and
+    :attr:`match_labels`.
+    """
+
+    def __init__(self, rows: int) -> None:
+        self.priority = np.zeros(rows, dtype=np.float64)
+        self.kept = np.zeros(rows, dtype=bool)
+        # Duplicate rows only: cluster id, kept row position, and matched-on code
+        self.cluster = np.full(rows, -1, dtype=np.int64)
+        self.kept_position = np.full(rows, -1, dtype=np.int64)
+        self.matched_on = np.zeros(rows, dtype=np.int8)
+        # Kept rows only: code of the formatted Source value
+        self.source = np.full(rows, -1, dtype=np.int32)
+        self.source_labels: List[str] = []
+        self.match_labels: List[str] = ["", *KEY_LABELS.values()]
+
+    @property
+    def kept_count(self) -> int:
+        return int(self.kept.sum())
+
+    @property
+    def duplicate_count(self) -> int:
+        return int((self.cluster >= 0).sum())
+
+    def source_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.source[self.kept], minlength=len(self.source_labels))
+        return {label: int(count) for label, count in zip(self.source_labels, counts) if count}
+
+
+def _transform_chunks(
+    month: str,
+    raw_paths: List[Path],
+    latest: pd.Timestamp | None,
+    spill: _Spill,
+    config: Mapping[str, Any],
+    run_plan: RunPlan,
+    progress: Callable[[int], None],
+    check: CancelCheck | None = None,
+) -> tuple[List[str], List[Path], pd.DataFrame, ValidationReport]:
+    # Dates come from the latest Create Date over all chunks, not each chunk's own.
+    dates_frame = pd.DataFrame({CREATE_DATE_COLUMN: [latest]}) if latest is not None else pd.DataFrame()
+    date_available, end_date = transform.run_dates(month, dates_frame, config)
+
+    validation = ValidationReport()
+    missing_required: set[str] | None = None
+    columns: List[str] = []
+    combo_paths: List[Path] = []
+    key_parts: List[pd.DataFrame] = []
+    offset = 0
+    combo_rows = 0
+    for path in raw_paths:
+        chunk = spill.read(path)
+        path.unlink()
+        result = transform.build_combo(
+            month=month, raw_data={"chunk": chunk}, config=config, check=check, run_plan=run_plan
+        )
+        _merge_validation(validation, result.validation, offset)
+        if len(chunk.columns):
+            found = result.validation.missing_required_columns
+            missing_required = set(found) if missing_required is None else missing_required & found
+        offset += len(chunk)
+        progress(offset)
+
+        combo = result.combo_df
+        combo[DATE_AVAILABLE_COLUMN] = date_available
+        combo[END_DATE_COLUMN] = end_date
+        combo.index = pd.RangeIndex(combo_rows, combo_rows + len(combo))
+        combo_rows += len(combo)
+        columns.extend(col for col in combo.columns if col not in columns)
+        combo_paths.append(spill.write("combo", combo))
+        key_parts.append(_hashed_keys(combo, run_plan.priority))
+
+    validation.missing_required_columns = missing_required or set()
+    if key_parts:
+        keys = pd.concat(key_parts)
+        keys[SOURCE_COLUMN] = keys[SOURCE_COLUMN].astype("category")
+    else:
+        keys = pd.DataFrame(columns=["_row", "_priority", *KEY_LABELS, SOURCE_COLUMN])
+    logger.info("Built Combo chunks with %s rows and %s columns", combo_rows, len(columns))
+    return columns, combo_paths, keys.reset_index(drop=True), validation
+
+
+def _hashed_keys(combo: pd.DataFrame, priority_map: Mapping[str, int]) -> pd.DataFrame:
+    """Reduce a Combo chunk to row ids, priority, source, and 64-bit key hashes (0 = no key).
+
+    Hash collisions are possible in principle but negligible at the row
+    counts this mode targets (about 1 in 10^5 for 10 million distinct keys).
+    """
+    keys = dedup.key_frame(combo, priority_map)
+    hashed = pd.DataFrame({"_row": combo.index.to_numpy(), "_priority": keys["_priority"].to_numpy()})
+    for key_name in KEY_LABELS:
+        values = keys[key_name].to_numpy(dtype=object)
+        codes = pd.util.hash_array(values)
+        codes[codes == 0] = 1  # 0 is reserved for "no key"
+        codes[values == ""] = 0
+        hashed[key_name] = codes
+    if SOURCE_COLUMN in combo.columns:
+        hashed[SOURCE_COLUMN] = combo[SOURCE_COLUMN].to_numpy()
+    else:
+        hashed[SOURCE_COLUMN] = pd.NA
+    return hashed
+
+
+def _plan(
+    keys: pd.DataFrame,
+    priority_map: Mapping[str, int],
+    check: CancelCheck | None = None,
+    progress: ProgressCallback | None = None,
+) -> _ChunkPlan:
+    ordered = keys.sort_values(by="_priority", ascending=False, kind="stable").reset_index(drop=True)
+    plan = dedup.plan_duplicates(ordered, check, progress)
+    row_ids = ordered["_row"].to_numpy(dtype=np.int64)
+
+    result = _ChunkPlan(int(row_ids.max()) + 1 if len(row_ids) else 0)
+    result.priority[row_ids] = ordered["_priority"].to_numpy(dtype=np.float64)
+    kept = np.asarray(plan.kept, dtype=np.int64)
+    result.kept[row_ids[kept]] = True
+    source_codes: Dict[str, int] = {}
+    result.source[row_ids[kept]] = [
+        source_codes.setdefault(dedup.format_sources(plan.sources[idx], priority_map), len(source_codes))
+        for idx in plan.kept
+    ]
+    result.source_labels = list(source_codes)
+
+    duplicates = np.asarray(plan.duplicates, dtype=np.int64)
+    dup_rows = row_ids[duplicates]
+    kept_position = np.full(len(ordered), -1, dtype=np.int64)
+    kept_position[kept] = np.arange(len(kept))
+    match_codes = {label: code for code, label in enumerate(result.match_labels)}
+    result.cluster[dup_rows] = [plan.cluster_of[idx] for idx in plan.duplicates]
+    result.kept_position[dup_rows] = kept_position[[plan.kept_of[idx] for idx in plan.duplicates]]
+    result.matched_on[dup_rows] = [match_codes[plan.matched_on[idx]] for idx in plan.duplicates]
+    return result
+
+
+def _bucket_rows(
+    combo_paths: List[Path], columns: List[str], plan: _ChunkPlan, spill: _Spill, check: CancelCheck | None = None
+) -> tuple[List[Path], List[Path]]:
+    """Split full rows into per-priority bucket files, highest priority first.
+
+    Dedup orders rows by priority (stable), so reading the buckets from the
+    highest priority down, each in row-id order, reproduces the in-memory
+    output order without sorting full rows.
+    """
+    cleaned: Dict[float, Path] = {}
+    duplicates: Dict[float, Path] = {}
+    for path in combo_paths:
+        if check is not None:
+            check()
+        chunk = spill.read(path).reindex(columns=columns)
+        path_rows = chunk.index.to_numpy(dtype=np.int64)
+        priority = plan.priority[path_rows]
+        kept_mask = plan.kept[path_rows]
+
+        kept_rows = chunk.loc[kept_mask].copy()
+        if SOURCE_COLUMN in kept_rows.columns:
+            source_labels = np.asarray(plan.source_labels, dtype=object)
+            kept_rows[SOURCE_COLUMN] = source_labels[plan.source[path_rows[kept_mask]]]
+        dup_rows = chunk.loc[~kept_mask].copy()
+        dup_ids = path_rows[~kept_mask]
+        dup_rows[DUPLICATE_CLUSTER_COLUMN] = plan.cluster[dup_ids]
+        dup_rows[KEPT_ROW_COLUMN] = plan.kept_position[dup_ids]
+        dup_rows[MATCHED_ON_COLUMN] = np.asarray(plan.match_labels, dtype=object)[plan.matched_on[dup_ids]]
+
+        for frame, mask, buckets, kind in (
+            (kept_rows, kept_mask, cleaned, "cleaned"),
+            (dup_rows, ~kept_mask, duplicates, "duplicates"),
+        ):
+            frame_priority = priority[mask]
+            for value in np.unique(frame_priority):
+                bucket = buckets.setdefault(float(value), spill.bucket(kind, len(buckets)))
+                with bucket.open("ab") as handle:
+                    pickle.dump(frame.loc[frame_priority == value], handle, protocol=pickle.HIGHEST_PROTOCOL)
+    return _by_priority(cleaned), _by_priority(duplicates)
+
+
+def _by_priority(buckets: Mapping[float, Path]) -> List[Path]:
+    return [buckets[value] for value in sorted(buckets, reverse=True)]
+
+
+def _read_buckets(paths: List[Path]) -> Iterator[pd.DataFrame]:
+    for path in paths:
+        with path.open("rb") as handle:
+            while True:
+                try:
+                    frame = pickle.load(handle)
+                except EOFError:
+                    break
+                yield frame.reset_index(drop=True)
+
+
+def _merge_validation(target: ValidationReport, chunk: ValidationReport, offset: int) -> None:
+    target.missing_profession_mappings.update(chunk.missing_profession_mappings)
+    target.missing_service_branch_mappings.update(chunk.missing_service_branch_mappings)
+    # Row numbers are positions in the combined source rows, as in the in-memory build.
+    target.invalid_phones.extend(_shift(entry, offset) for entry in chunk.invalid_phones)
+    target.invalid_zips.extend(_shift(entry, offset) for entry in chunk.invalid_zips)
+
+
+def _shift(entry: str, offset: int) -> str:
+    idx, _, raw = entry.partition(":")
+    return f"{int(idx) + offset}:{raw}"
+
+
+def _later(latest: pd.Timestamp | None, chunk: pd.DataFrame) -> pd.Timestamp | None:
+    if CREATE_DATE_COLUMN not in chunk.columns:
+        return latest
+    series = pd.to_datetime(chunk[CREATE_DATE_COLUMN], errors="coerce")
+    if not series.notna().any():
+        return latest
+    candidate = series.max()
+    return candidate if latest is None or candidate > latest else latest
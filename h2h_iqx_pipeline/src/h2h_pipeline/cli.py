@@ -1,8 +1,12 @@
 import argparse
 from pathlib import Path
 
+import os
+import sys
+import time
+
+from .cancellation import RunCancelled
 from .config_loader import load_config
-from .pipeline import run_pipeline
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -30,27 +34,196 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Path to YAML configuration file",
     )
+    run_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report discovered files, row counts, missing mappings and estimated runtime without running",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run the pipeline for a range of months"
+    )
+    batch_parser.add_argument(
+        "--start",
+        required=True,
+        help="First month in YYYY-MM format",
+    )
+    batch_parser.add_argument(
+        "--end",
+        required=True,
+        help="Last month in YYYY-MM format (inclusive)",
+    )
+    batch_parser.add_argument(
+        "--input-root",
+        required=True,
+        type=Path,
+        help="Root directory containing monthly Vet Talents folders",
+    )
+    batch_parser.add_argument(
+        "--config",
+        required=True,
+        type=Path,
+        help="Path to YAML configuration file",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for independent months (default: CPU count)",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="Keep running and re-process a month when its inputs change"
+    )
+    watch_parser.add_argument(
+        "--month",
+        default=None,
+        help="Month to watch in YYYY-MM format (default: run.current_month or the current month)",
+    )
+    watch_parser.add_argument(
+        "--input-root",
+        required=True,
+        type=Path,
+        help="Root directory containing monthly Vet Talents folders",
+    )
+    watch_parser.add_argument(
+        "--config",
+        required=True,
+        type=Path,
+        help="Path to YAML configuration file (reloaded when it changes)",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help="Seconds between polls of the input folder",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve a local HTTP/JSON API that runs the pipeline"
+    )
+    serve_parser.add_argument(
+        "--input-root",
+        required=True,
+        type=Path,
+        help="Default root directory containing monthly Vet Talents folders",
+    )
+    serve_parser.add_argument(
+        "--config",
+        required=True,
+        type=Path,
+        help="Path to YAML configuration file",
+    )
+    serve_parser.add_argument(
+        "--config-dir",
+        type=Path,
+        help="Folder requests may pick config files from (defaults to the folder of --config)",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    serve_parser.add_argument(
+        "--token",
+        default=os.environ.get("H2H_SERVICE_TOKEN"),
+        help="Bearer token clients must send (default: $H2H_SERVICE_TOKEN, else a generated one); "
+        "required with a non-loopback --host",
+    )
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Runs that may execute at the same time",
+    )
+    serve_parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=8,
+        help="Runs that may wait for a worker before requests are rejected",
+    )
 
     return parser
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
+        if args.command == "watch":
+            from .watch import Watcher
+
+            watcher = Watcher(
+                config_path=args.config,
+                input_root=args.input_root,
+                month=args.month,
+                overrides={"paths": {"input_root": str(args.input_root)}},
+                interval=args.interval,
+            )
+            try:
+                watcher.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            return 0
+        if args.command == "serve":
+            from .service import PipelineService, make_server
+
+            service = PipelineService(
+                config_path=args.config,
+                input_root=args.input_root,
+                workers=args.workers,
+                max_queue=args.max_queue,
+                config_dir=args.config_dir,
+            )
+            server = make_server(service, host=args.host, port=args.port, token=args.token)
+            print(f"Serving on http://{args.host}:{server.server_address[1]}")
+            if not args.token:
+                print(f"API token: {server.token}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+                service.shutdown()
+            return 0
         config = load_config(
             args.config,
             overrides={"paths": {"input_root": str(args.input_root)}},
         )
+        # Stage modules are imported per command so --dry-run never loads pandas.
+        if args.command == "batch":
+            from .batch import format_summary, run_batch
+
+            started = time.perf_counter()
+            results = run_batch(
+                start=args.start,
+                end=args.end,
+                input_root=args.input_root,
+                config=config,
+                workers=args.workers,
+            )
+            print(format_summary(results, time.perf_counter() - started))
+            return 0 if all(result.ok for result in results) else 1
+        if args.dry_run:
+            from .estimate import dry_run, format_dry_run
+
+            print(format_dry_run(dry_run(month=args.month, input_root=args.input_root, config=config)))
+            return 0
+        from .pipeline import run_pipeline
+
         run_pipeline(
             month=args.month,
             input_root=args.input_root,
             config=config,
         )
+    except RunCancelled as exc:
+        print(f"Run stopped during {exc.stage}: {exc.reason}", file=sys.stderr)
+        if exc.report_path:
+            print(f"Partial QA report: {exc.report_path}", file=sys.stderr)
+        return 1
     except Exception as exc:  # pragma: no cover - CLI guard
         parser.error(str(exc))
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -1,12 +1,21 @@
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, MutableMapping, Optional
 
-import yaml
+import logging
+
+from .models import RunPlan, SourceSpec
+
+logger = logging.getLogger(__name__)
 
 REQUIRED_ROOT_KEYS = ["paths", "sources", "iqx_import"]
+# Mapping files parsed into the RunPlan (the stages look nothing else up).
+PLAN_MAPPINGS = ("professions", "service_branches", "source_priority")
 
 
 def load_config(path: Path, overrides: Mapping[str, Any] | None = None) -> Mapping[str, Any]:
+    import yaml  # deferred so `cli --help` and argument errors stay fast
+
     with path.open("r", encoding="utf-8") as f:
         cfg = yaml.safe_load(f) or {}
     if not isinstance(cfg, MutableMapping):
@@ -57,6 +66,61 @@ def validate_config(cfg: MutableMapping[str, Any], path: Path) -> None:
             raise FileNotFoundError(f"Mapping file for '{key}' not found: {mp}")
 
 
+def compile_plan(config: Mapping[str, Any]) -> RunPlan:
+    """Compile what the stages read from ``config`` into a read-only :class:`RunPlan`.
+
+    Built once per run by :func:`~h2h_pipeline.pipeline.run_pipeline` and
+    passed to every stage: sources are indexed by name (the first entry wins
+    for a repeated name), the :data:`PLAN_MAPPINGS` files are parsed, source
+    priorities converted to ints, and ``last_import_date_by_source`` parsed
+    to timestamps (invalid dates are logged and skipped).
+    """
+    import pandas as pd  # deferred like yaml: the GUIs import this module at start-up
+
+    from .utils.mappings import load_yaml_mapping
+
+    sources = []
+    codes: Dict[str, Optional[str]] = {}
+    labels: Dict[str, str] = {}
+    for entry in config.get("sources", []) or []:
+        name = entry.get("name")
+        if not name or name in codes:
+            continue
+        spec = SourceSpec(name, entry.get("code"), entry.get("output_label") or entry.get("label") or name)
+        sources.append(spec)
+        codes[name] = spec.code
+        labels[name] = spec.label
+
+    mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
+    # Shared read-only views from the process-wide registry, parsed only when a file changed.
+    mappings = {key: load_yaml_mapping(mapping_cfg.get(key), logger) for key in PLAN_MAPPINGS}
+    priority = {name: int(value) for name, value in mappings["source_priority"].items()}
+
+    date_cfg = config.get("date_handling", {}) if isinstance(config, Mapping) else {}
+    strategy = str(date_cfg.get("last_import_strategy", "")).lower()
+    cutoffs = {}
+    if strategy:
+        for source, value in (date_cfg.get("last_import_date_by_source", {}) or {}).items():
+            parsed = pd.to_datetime(value, errors="coerce")
+            if pd.isna(parsed):
+                logger.warning("Invalid last import date for %s: %s", source, value)
+                continue
+            cutoffs[source] = parsed
+    include_cutoff = date_cfg.get("include_cutoff_date")
+
+    return RunPlan(
+        sources=tuple(sources),
+        source_codes=MappingProxyType(codes),
+        source_labels=MappingProxyType(labels),
+        mappings=MappingProxyType(mappings),
+        priority=MappingProxyType(priority),
+        last_import_strategy=strategy,
+        cutoffs=MappingProxyType(cutoffs),
+        include_cutoff=None if include_cutoff is None else bool(include_cutoff),
+        exclude_previously_imported=bool(date_cfg.get("exclude_previously_imported", True)),
+    )
+
+
 def _resolve_mapping_path(value: str | Path, base_dir: Path) -> str:
     path = Path(value)
     if path.is_absolute():
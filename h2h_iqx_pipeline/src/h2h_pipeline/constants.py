@@ -21,3 +21,19 @@ CLEARANCE_LEVEL_COLUMN = "clearance_level"
 CLEARANCE_AGENCY_COLUMN = "clearance_agency"
 CLEARANCE_STATUS_COLUMN = "clearance_status"
 CLEARANCE_INVESTIGATION_COLUMN = "clearance_investigation"
+
+# Columns every source must provide (after header normalization)
+REQUIRED_COLUMNS = [
+    LAST_NAME_COLUMN,
+    FIRST_NAME_COLUMN,
+    EMAIL_COLUMN,
+    PHONE_COLUMN,
+    ZIP_COLUMN,
+    PROFESSION_COLUMN,
+    SERVICE_BRANCH_COLUMN,
+]
+
+# Columns added to the duplicates report
+DUPLICATE_CLUSTER_COLUMN = "duplicate_cluster_id"
+KEPT_ROW_COLUMN = "kept_row_id"
+MATCHED_ON_COLUMN = "matched_on"
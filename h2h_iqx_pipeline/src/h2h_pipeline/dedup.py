@@ -3,94 +3,71 @@ from typing import Any, Mapping
 import logging
 import pandas as pd
 
-from .constants import EMAIL_COLUMN, FIRST_NAME_COLUMN, LAST_NAME_COLUMN, PHONE_COLUMN, SOURCE_COLUMN, ZIP_COLUMN
-from .models import DedupResult
-from .utils.mappings import load_yaml_mapping
+from .constants import (
+    DUPLICATE_CLUSTER_COLUMN,
+    EMAIL_COLUMN,
+    FIRST_NAME_COLUMN,
+    KEPT_ROW_COLUMN,
+    LAST_NAME_COLUMN,
+    MATCHED_ON_COLUMN,
+    PHONE_COLUMN,
+    SOURCE_COLUMN,
+    ZIP_COLUMN,
+)
+from .cancellation import CHECK_EVERY_ROWS, CancelCheck
+from .config_loader import compile_plan
+from .instrumentation import ProgressCallback
+from .models import DedupPlan, DedupResult, RunPlan
 from .utils.series import combine_keys, digits_only, normalize_series
 
 logger = logging.getLogger(__name__)
 
 
-def remove_duplicates(combo_df: pd.DataFrame, config: Mapping[str, Any]) -> DedupResult:
-    """Remove duplicates prioritizing sources defined in mapping."""
-    if combo_df.empty:
-        return DedupResult(cleaned_df=combo_df.copy(), duplicates_df=combo_df.copy(), stats={"input_rows": 0, "duplicates_removed": 0})
-
-    priority_map = _load_priority(config)
-    working = combo_df.copy()
-    working["_priority"] = working[SOURCE_COLUMN].map(priority_map).fillna(0)
-    working["_norm_email"] = normalize_series(working, EMAIL_COLUMN, lambda v: str(v).strip().lower())
-    working["_norm_phone"] = normalize_series(working, PHONE_COLUMN, digits_only)
-    last = normalize_series(working, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
-    first = normalize_series(working, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
-    zip_code = normalize_series(working, ZIP_COLUMN, lambda v: str(v).strip())
-    working["_norm_name_zip"] = combine_keys([last, first, zip_code])
-
-    working = working.sort_values(by="_priority", ascending=False).reset_index(drop=True)
+KEY_LABELS = {"_norm_email": "email", "_norm_phone": "phone", "_norm_name_zip": "name+zip"}
 
-    parent = list(range(len(working)))
 
-    def find(idx: int) -> int:
-        while parent[idx] != idx:
-            parent[idx] = parent[parent[idx]]
-            idx = parent[idx]
-        return idx
-
-    def union(a: int, b: int) -> None:
-        root_a = find(a)
-        root_b = find(b)
-        if root_a != root_b:
-            parent[root_b] = root_a
+def remove_duplicates(
+    combo_df: pd.DataFrame,
+    config: Mapping[str, Any],
+    check: CancelCheck | None = None,
+    run_plan: RunPlan | None = None,
+    progress: ProgressCallback | None = None,
+) -> DedupResult:
+    """Remove duplicates prioritizing sources defined in mapping.
 
-    key_to_index: dict[str, dict[str, int]] = {"_norm_email": {}, "_norm_phone": {}, "_norm_name_zip": {}}
-    for idx, row in working.iterrows():
-        for key_name in key_to_index:
-            key_val = row[key_name]
-            if not key_val:
-                continue
-            existing = key_to_index[key_name].get(key_val)
-            if existing is None:
-                key_to_index[key_name][key_val] = idx
-            else:
-                union(idx, existing)
-
-    groups: dict[int, list[int]] = {}
-    for idx in range(len(working)):
-        root = find(idx)
-        groups.setdefault(root, []).append(idx)
-
-    kept_indices: list[int] = []
-    duplicate_indices: list[int] = []
-    combined_sources: dict[int, set[str]] = {}
-
-    for indices in groups.values():
-        kept = min(indices)
-        kept_indices.append(kept)
-        combined_sources[kept] = set(working.loc[indices, SOURCE_COLUMN].astype(str))
-        for idx in indices:
-            if idx != kept:
-                duplicate_indices.append(idx)
+    Dropped rows carry their cluster id, the row index of the kept record in
+    the cleaned frame, and the key type that linked them into the cluster.
+    ``check`` and ``progress`` are passed on to :func:`plan_duplicates`. Source priorities
+    come from ``run_plan`` (compiled from ``config`` when not given).
+    """
+    if combo_df.empty:
+        return DedupResult(cleaned_df=combo_df.copy(), duplicates_df=combo_df.copy(), stats={"input_rows": 0, "duplicates_removed": 0})
 
-    kept_indices.sort()
-    duplicate_indices.sort()
+    priority_map = (run_plan if run_plan is not None else compile_plan(config)).priority
+    working = pd.concat([combo_df, key_frame(combo_df, priority_map)], axis=1)
+    # Stable, so rows with equal priority keep their Combo order.
+    working = working.sort_values(by="_priority", ascending=False, kind="stable").reset_index(drop=True)
+    plan = plan_duplicates(working, check, progress)
+    kept_indices = plan.kept
+    duplicate_indices = plan.duplicates
+    kept_position = {kept: pos for pos, kept in enumerate(kept_indices)}
 
     cleaned_df = (
         working.loc[kept_indices]
-        .drop(columns=["_priority", "_norm_email", "_norm_phone", "_norm_name_zip"], errors="ignore")
+        .drop(columns=["_priority", *KEY_LABELS], errors="ignore")
         .reset_index(drop=True)
     )
     duplicates_df = (
         working.loc[duplicate_indices]
-        .drop(columns=["_priority", "_norm_email", "_norm_phone", "_norm_name_zip"], errors="ignore")
+        .drop(columns=["_priority", *KEY_LABELS], errors="ignore")
         .reset_index(drop=True)
     )
+    duplicates_df[DUPLICATE_CLUSTER_COLUMN] = [plan.cluster_of[idx] for idx in duplicate_indices]
+    duplicates_df[KEPT_ROW_COLUMN] = [kept_position[plan.kept_of[idx]] for idx in duplicate_indices]
+    duplicates_df[MATCHED_ON_COLUMN] = [plan.matched_on[idx] for idx in duplicate_indices]
 
     if not cleaned_df.empty and SOURCE_COLUMN in cleaned_df.columns:
-        ordered_sources = []
-        for kept in kept_indices:
-            sources = combined_sources.get(kept, {str(working.at[kept, SOURCE_COLUMN])})
-            ordered_sources.append(_format_sources(sources, priority_map))
-        cleaned_df[SOURCE_COLUMN] = ordered_sources
+        cleaned_df[SOURCE_COLUMN] = [format_sources(plan.sources[kept], priority_map) for kept in kept_indices]
 
     stats = {
         "input_rows": len(combo_df),
@@ -106,13 +83,105 @@ def remove_duplicates(combo_df: pd.DataFrame, config: Mapping[str, Any]) -> Dedu
     return DedupResult(cleaned_df=cleaned_df, duplicates_df=duplicates_df, stats=stats)
 
 
-def _load_priority(config: Mapping[str, Any]) -> Mapping[str, int]:
-    mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
-    path_val = mapping_cfg.get("source_priority")
-    raw = load_yaml_mapping(path_val)
-    return {k: int(v) for k, v in raw.items()}
+def key_frame(df: pd.DataFrame, priority_map: Mapping[str, int]) -> pd.DataFrame:
+    """Return each row's source priority and normalized email, phone, and name+zip keys."""
+    last = normalize_series(df, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    first = normalize_series(df, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    zip_code = normalize_series(df, ZIP_COLUMN, lambda v: str(v).strip())
+    source = df[SOURCE_COLUMN] if SOURCE_COLUMN in df.columns else pd.Series(pd.NA, index=df.index, dtype=object)
+    return pd.DataFrame(
+        {
+            "_priority": source.map(priority_map).fillna(0),
+            "_norm_email": normalize_series(df, EMAIL_COLUMN, lambda v: str(v).strip().lower()),
+            "_norm_phone": normalize_series(df, PHONE_COLUMN, digits_only),
+            "_norm_name_zip": combine_keys([last, first, zip_code]),
+        },
+        index=df.index,
+    )
+
+
+def plan_duplicates(
+    keys: pd.DataFrame, check: CancelCheck | None = None, progress: ProgressCallback | None = None
+) -> DedupPlan:
+    """Cluster rows that share any key; the first row of each cluster is kept.
+
+    ``keys`` holds the key columns from :func:`key_frame` (any hashable values,
+    falsy meaning "no key") plus the Source column, already in priority order.
+    Only positions are returned, so callers can apply the plan to full rows or
+    to a compact key-only representation. ``check`` is called every
+    :data:`~h2h_pipeline.cancellation.CHECK_EVERY_ROWS` rows of each pass,
+    and ``progress`` at the same points with the rows done over all passes.
+    """
+    parent = list(range(len(keys)))
+    rows = len(keys)
+    passes = len(KEY_LABELS) + 1
+
+    def tick(pass_index: int, idx: int) -> None:
+        if check is not None:
+            check()
+        if progress is not None:
+            progress((pass_index * rows + idx) // passes, rows)
+
+    def find(idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def union(a: int, b: int) -> None:
+        root_a = find(a)
+        root_b = find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    # First key that linked each row to another row in its cluster.
+    matched_on: list[str] = [""] * len(keys)
+
+    for pass_index, (key_name, label) in enumerate(KEY_LABELS.items()):
+        index: dict[Any, int] = {}
+        for idx, key_val in enumerate(keys[key_name].to_numpy()):
+            if idx % CHECK_EVERY_ROWS == 0:
+                tick(pass_index, idx)
+            if not key_val:
+                continue
+            existing = index.get(key_val)
+            if existing is None:
+                index[key_val] = idx
+            else:
+                union(idx, existing)
+                if not matched_on[idx]:
+                    matched_on[idx] = label
+                if not matched_on[existing]:
+                    matched_on[existing] = label
+
+    groups: dict[int, list[int]] = {}
+    for idx in range(len(keys)):
+        if idx % CHECK_EVERY_ROWS == 0:
+            tick(passes - 1, idx)
+        groups.setdefault(find(idx), []).append(idx)
+
+    if SOURCE_COLUMN in keys.columns:
+        source_values = keys[SOURCE_COLUMN].astype(str).to_numpy()
+    else:
+        source_values = ["nan"] * len(keys)
+    plan = DedupPlan(matched_on=matched_on)
+    for cluster_id, indices in enumerate(groups.values()):
+        kept = min(indices)
+        plan.kept.append(kept)
+        plan.sources[kept] = {source_values[idx] for idx in indices}
+        for idx in indices:
+            if idx != kept:
+                plan.duplicates.append(idx)
+                plan.cluster_of[idx] = cluster_id
+                plan.kept_of[idx] = kept
+    plan.kept.sort()
+    plan.duplicates.sort()
+    if progress is not None:
+        progress(rows, rows)
+    return plan
 
 
-def _format_sources(sources: set[str], priority_map: Mapping[str, int]) -> str:
+def format_sources(sources: set[str], priority_map: Mapping[str, int]) -> str:
     ordered = sorted(sources, key=lambda s: (-priority_map.get(s, 0), s))
     return " & ".join(ordered)
+
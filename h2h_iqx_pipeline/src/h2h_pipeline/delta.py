@@ -0,0 +1,134 @@
+from pathlib import Path
+from typing import Any, Mapping
+
+import logging
+import pandas as pd
+
+from .constants import DATE_AVAILABLE_COLUMN, END_DATE_COLUMN
+from .models import DeltaResult
+from .utils.series import identity_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IGNORE_COLUMNS = [DATE_AVAILABLE_COLUMN, END_DATE_COLUMN]
+
+
+def compute_run_delta(
+    current_df: pd.DataFrame, raw_data: Mapping[str, pd.DataFrame], config: Mapping[str, Any]
+) -> DeltaResult | None:
+    """Compare this run against the stored snapshot or previous Combo when delta mode is on.
+
+    The previous Combo is only a usable baseline when ingestion kept all
+    current rows: with a ``date_handling.last_import_strategy`` the rows it
+    already holds (or that predate the cutoff) are filtered out first, so
+    they would all show as removed. Only the snapshot is used then.
+    """
+    delta_cfg = config.get("delta", {}) if isinstance(config, Mapping) else {}
+    if not delta_cfg.get("enabled"):
+        return None
+
+    date_cfg = config.get("date_handling", {}) if isinstance(config, Mapping) else {}
+    filtered = bool(str(date_cfg.get("last_import_strategy") or "").strip())
+    baseline_df, baseline = load_baseline(raw_data, delta_cfg, previous_usable=not filtered)
+    if baseline_df is None:
+        logger.warning("Delta mode enabled but no snapshot or previous Combo is available.")
+        baseline_df, baseline = pd.DataFrame(), "none"
+
+    column_order = config.get("iqx_import", {}).get("column_order", [])
+    ignore = delta_cfg.get("ignore_columns", DEFAULT_IGNORE_COLUMNS) or []
+    compare_columns = [c for c in column_order if c not in ignore]
+    return compute_delta(current_df, baseline_df, compare_columns, baseline)
+
+
+def load_baseline(
+    raw_data: Mapping[str, pd.DataFrame], delta_cfg: Mapping[str, Any], previous_usable: bool = True
+) -> tuple[pd.DataFrame | None, str]:
+    """Return the baseline frame and a label describing where it came from.
+
+    The previous Combo is skipped (with a warning) when ``previous_usable``
+    is false.
+    """
+    snapshot = delta_cfg.get("snapshot_path")
+    if snapshot and Path(snapshot).exists():
+        return read_snapshot(Path(snapshot)), str(snapshot)
+    previous = raw_data.get("_previous_combo")
+    if previous is not None:
+        if previous_usable:
+            return previous, "previous Combo"
+        logger.warning(
+            "Delta: not comparing against the previous Combo because the last-import filter already removed "
+            "its rows from this run; set delta.snapshot_path so the next run has a baseline."
+        )
+    return None, "none"
+
+
+def read_snapshot(path: Path) -> pd.DataFrame:
+    if path.suffix.lower() == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str)
+
+
+def compute_delta(
+    current_df: pd.DataFrame,
+    baseline_df: pd.DataFrame,
+    compare_columns: list[str],
+    baseline: str = "baseline",
+) -> DeltaResult:
+    """Hash-join current rows to baseline rows on their identity key.
+
+    Each side is reduced to (key, row fingerprint, position) and joined once,
+    so the cost is linear in the number of rows on both sides.
+    """
+    columns = [c for c in compare_columns if c in current_df.columns or c in baseline_df.columns]
+    current = _fingerprint_frame(current_df, columns)
+    previous = _fingerprint_frame(baseline_df, columns)
+    previous = previous[previous["_key"] != ""].drop_duplicates("_key", keep="first")
+
+    current_keyed = current[current["_key"] != ""]
+    joined = current_keyed.merge(previous, on="_key", how="outer", suffixes=("_cur", "_prev"), indicator=True)
+
+    added_pos = joined.loc[joined["_merge"] == "left_only", "_pos_cur"].astype(int)
+    removed_pos = joined.loc[joined["_merge"] == "right_only", "_pos_prev"].astype(int)
+    both = joined[joined["_merge"] == "both"]
+    changed = both[both["_hash_cur"] != both["_hash_prev"]]
+    changed_pos = changed["_pos_cur"].astype(int)
+
+    # Rows without any identifier cannot be matched, so they count as added.
+    unkeyed_pos = current.loc[current["_key"] == "", "_pos"]
+    added_positions = sorted(set(added_pos) | set(unkeyed_pos))
+
+    result = DeltaResult(
+        added_df=current_df.iloc[added_positions].reset_index(drop=True),
+        removed_df=baseline_df.iloc[sorted(removed_pos)].reset_index(drop=True),
+        changed_df=current_df.iloc[sorted(changed_pos)].reset_index(drop=True),
+        baseline=baseline,
+        unchanged=len(both) - len(changed),
+    )
+    logger.info(
+        "Delta vs %s: added %s, removed %s, changed %s, unchanged %s",
+        baseline,
+        len(result.added_df),
+        len(result.removed_df),
+        len(result.changed_df),
+        result.unchanged,
+    )
+    return result
+
+
+def _fingerprint_frame(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    if df.empty:
+        return pd.DataFrame(
+            {"_key": pd.Series(dtype=str), "_hash": pd.Series(dtype="uint64"), "_pos": pd.Series(dtype=int)}
+        )
+    values = pd.DataFrame(
+        {col: df[col].fillna("").astype(str).str.strip() if col in df.columns else "" for col in columns},
+        index=df.index,
+    )
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy() if columns else 0
+    return pd.DataFrame(
+        {
+            "_key": identity_key(df).to_numpy(),
+            "_hash": hashes,
+            "_pos": range(len(df)),
+        }
+    )
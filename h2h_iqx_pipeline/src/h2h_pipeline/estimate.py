@@ -0,0 +1,208 @@
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+import json
+import logging
+import time
+
+from . import file_discovery
+from .constants import PROFESSION_COLUMN, REQUIRED_COLUMNS, SERVICE_BRANCH_COLUMN
+from .instrumentation import SPANS_FILENAME
+from .models import DryRunReport, SourcePreview, StageEstimate
+from .utils.columns import CANONICAL_COLUMN_MAP, canonical_column
+from .utils.mappings import load_yaml_mapping
+from .utils.xlsx import read_sheet_preview
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("discovery", "ingestion", "transform", "dedup", "delta", "export", "upload", "qa")
+# Stages whose duration scales with the number of source rows.
+ROW_STAGES = ("ingestion", "transform", "dedup", "delta", "export", "upload")
+DEFAULT_SAMPLE_ROWS = 200
+DEFAULT_HISTORY_RUNS = 20
+# Only the tail of the spans file is read; it holds far more than the history window.
+SPANS_TAIL_BYTES = 512 * 1024
+
+
+def dry_run(month: str, input_root: Path, config: Mapping[str, Any]) -> DryRunReport:
+    """Discover inputs and estimate a run without loading any source data.
+
+    Each xlsx contributes only its header row, a small sample of leading rows,
+    and the row count from its ``<dimension>`` element. Missing mappings are
+    checked against the sample, and stage durations are estimated from the
+    throughput recorded in ``pipeline_spans.jsonl``.
+    """
+    started = time.perf_counter()
+    dry_cfg = config.get("dry_run", {}) if isinstance(config, Mapping) else {}
+    sample_rows = max(0, int(dry_cfg.get("sample_rows", DEFAULT_SAMPLE_ROWS)))
+
+    discovery = file_discovery.discover_month_files(month=month, input_root=input_root, config=config)
+    mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
+    professions = load_yaml_mapping(mapping_cfg.get("professions"), logger)
+    service_branches = load_yaml_mapping(mapping_cfg.get("service_branches"), logger)
+
+    report = DryRunReport(discovery=discovery, sample_rows=sample_rows)
+    seen_columns: set[str] = set()
+    for name, path in (discovery.sources or {}).items():
+        preview, sample = _preview_source(name, path, sample_rows)
+        report.sources.append(preview)
+        seen_columns.update(preview.columns)
+        _check_sample(sample, professions, report.validation.missing_profession_mappings, PROFESSION_COLUMN)
+        _check_sample(
+            sample, service_branches, report.validation.missing_service_branch_mappings, SERVICE_BRANCH_COLUMN
+        )
+    if report.sources:
+        report.validation.missing_required_columns = {c for c in REQUIRED_COLUMNS if c not in seen_columns}
+
+    if discovery.previous_combo:
+        try:
+            report.previous_combo_rows = read_sheet_preview(discovery.previous_combo).rows
+        except Exception as exc:
+            logger.warning("Could not read previous Combo %s: %s", discovery.previous_combo, exc)
+
+    paths_cfg = config.get("paths", {}) if isinstance(config, Mapping) else {}
+    spans_path = Path(paths_cfg.get("log_dir", "logs")) / SPANS_FILENAME
+    history = max(1, int(dry_cfg.get("history_runs", DEFAULT_HISTORY_RUNS)))
+    report.estimates, report.history_runs = estimate_stages(report.source_rows, spans_path, config, history)
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def estimate_stages(
+    source_rows: int, spans_path: Path, config: Mapping[str, Any], history: int = DEFAULT_HISTORY_RUNS
+) -> tuple[List[StageEstimate], int]:
+    """Estimate each stage's duration from the last ``history`` recorded runs.
+
+    Row-driven stages use recorded rows per second; the others use their
+    average duration. Source rows are an upper bound for the later stages,
+    since filtering and de-duplication only remove rows.
+    """
+    events = _recent_end_events(spans_path, history)
+    upload_cfg = config.get("upload", {}) if isinstance(config, Mapping) else {}
+    estimates: List[StageEstimate] = []
+    for stage in STAGES:
+        if stage == "upload" and not upload_cfg.get("enabled"):
+            estimates.append(StageEstimate(stage, None, 0.0, "disabled"))
+            continue
+        stage_events = events.get(stage, [])
+        rows = source_rows if stage in ROW_STAGES else None
+        total_rows = sum(_event_rows(e) or 0 for e in stage_events)
+        total_seconds = sum(float(e.get("wall_seconds") or 0.0) for e in stage_events)
+        if rows is not None and total_rows and total_seconds:
+            rate = total_rows / total_seconds
+            estimates.append(StageEstimate(stage, rows, rows / rate, f"{rate:,.0f} rows/s"))
+        elif stage_events:
+            estimates.append(
+                StageEstimate(stage, rows, total_seconds / len(stage_events), f"average of {len(stage_events)} runs")
+            )
+        else:
+            estimates.append(StageEstimate(stage, rows, None, "no history"))
+    runs = len({e.get("run_id") for stage_events in events.values() for e in stage_events})
+    return estimates, runs
+
+
+def format_dry_run(report: DryRunReport) -> str:
+    discovery = report.discovery
+    lines = [f"Dry run for {discovery.month} (input root: {discovery.input_root})"]
+    lines.append(f"Month folder: {discovery.month_dir if discovery.month_dir else 'not found'}")
+    lines.append("Sources:")
+    if not report.sources:
+        lines.append("  - none found")
+    for source in report.sources:
+        if source.error:
+            lines.append(f"  - {source.name}: {source.path.name} (unreadable: {source.error})")
+            continue
+        rows = "unknown" if source.rows is None else f"{source.rows:,}"
+        lines.append(f"  - {source.name}: {source.path.name} ({rows} rows, {source.row_count_basis})")
+        lines.append(f"    Columns: {', '.join(source.columns) if source.columns else 'none'}")
+        if source.unrecognized_columns:
+            lines.append(f"    Unrecognized headers: {', '.join(source.unrecognized_columns)}")
+    if discovery.missing_sources:
+        lines.append(f"Missing sources: {', '.join(discovery.missing_sources)}")
+    if discovery.previous_combo:
+        rows = "unknown" if report.previous_combo_rows is None else f"{report.previous_combo_rows:,}"
+        lines.append(f"Previous Combo: {discovery.previous_combo} ({rows} rows)")
+    else:
+        lines.append("Previous Combo: none")
+    lines.append(f"Total source rows: {report.source_rows:,}")
+
+    validation = report.validation
+    lines.append(f"Mapping check (first {report.sample_rows} rows per source):")
+    lines.append(f"  Missing profession mappings: {_listing(validation.missing_profession_mappings)}")
+    lines.append(f"  Missing service branch mappings: {_listing(validation.missing_service_branch_mappings)}")
+    lines.append(f"  Missing required columns: {_listing(validation.missing_required_columns)}")
+
+    lines.append(f"Estimated runtime (from {report.history_runs} recorded runs):")
+    width = max(len(stage) for stage in STAGES)
+    for estimate in report.estimates:
+        seconds = "?" if estimate.seconds is None else f"{estimate.seconds:.2f}s"
+        lines.append(f"  {estimate.stage.ljust(width)}  {seconds:>8}  ({estimate.basis})")
+    total = report.estimated_seconds
+    lines.append(f"  {'total'.ljust(width)}  {'?' if total is None else f'{total:.2f}s':>8}")
+    lines.append(f"Dry run finished in {report.elapsed_seconds:.2f}s")
+    return "\n".join(lines)
+
+
+def _preview_source(name: str, path: Path, sample_rows: int) -> tuple[SourcePreview, List[Dict[str, str]]]:
+    try:
+        sheet = read_sheet_preview(path, sample_rows)
+    except Exception as exc:
+        logger.warning("Could not read header of %s: %s", path, exc)
+        return SourcePreview(name=name, path=path, rows=None, error=str(exc)), []
+    columns = [canonical_column(header) for header in sheet.header]
+    known = set(CANONICAL_COLUMN_MAP.values())
+    preview = SourcePreview(
+        name=name,
+        path=path,
+        rows=sheet.rows,
+        columns=columns,
+        unrecognized_columns=[h for h, c in zip(sheet.header, columns) if h == c and c not in known],
+        row_count_basis=sheet.row_count_basis,
+    )
+    sample = [dict(zip(columns, row)) for row in sheet.sample]
+    return preview, sample
+
+
+def _check_sample(
+    sample: List[Dict[str, str]], mapping: Mapping[str, Any], missing: set[str], column: str
+) -> None:
+    for row in sample:
+        key = str(row.get(column, "")).strip()
+        if key and key not in mapping:
+            missing.add(key)
+
+
+def _recent_end_events(spans_path: Path, history: int) -> Dict[str, List[Dict[str, Any]]]:
+    try:
+        with spans_path.open("rb") as handle:
+            handle.seek(0, 2)
+            size = handle.tell()
+            handle.seek(max(0, size - SPANS_TAIL_BYTES))
+            tail = handle.read().decode("utf-8", errors="replace")
+    except OSError:
+        return {}
+    lines = tail.splitlines()
+    if size > SPANS_TAIL_BYTES and lines:
+        lines = lines[1:]  # the first line may be cut in half
+
+    events: Dict[str, List[Dict[str, Any]]] = {}
+    for line in reversed(lines):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if event.get("phase") != "end" or event.get("error") or event.get("cached"):
+            continue
+        stage_events = events.setdefault(str(event.get("stage")), [])
+        if len(stage_events) < history:
+            stage_events.append(event)
+    return events
+
+
+def _event_rows(event: Mapping[str, Any]) -> int | None:
+    rows = event.get("rows_in")
+    return rows if rows is not None else event.get("rows_out")
+
+
+def _listing(values: set[str]) -> str:
+    return ", ".join(sorted(values)) if values else "none"
@@ -1,43 +1,568 @@
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping
 
+import hashlib
+import json
 import logging
 import pandas as pd
 
+from . import preview, sqlite_sink
+from .cancellation import CHECK_EVERY_ROWS, CancelCheck, RunCancelled
+from .constants import DUPLICATE_CLUSTER_COLUMN, KEPT_ROW_COLUMN, MATCHED_ON_COLUMN
+from .instrumentation import ProgressCallback
+from .models import DeltaResult, ExportResult, SqliteLoadStats
 from .utils.io_helpers import ensure_dir
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_FILENAME = ".export_manifest.json"
+MANIFEST_VERSION = 1
+# Sheet row limit of xlsx, header included.
+EXCEL_MAX_ROWS = 1_048_576
+REPORT_COLUMNS = [DUPLICATE_CLUSTER_COLUMN, KEPT_ROW_COLUMN, MATCHED_ON_COLUMN]
+# to_excel styles the header row before pandas 3.
+PANDAS_STYLES_HEADER = int(pd.__version__.split(".")[0]) < 3
+
 
 def write_outputs(
-    run_label: str, combo_df: pd.DataFrame, dedup_df: pd.DataFrame, config: Mapping[str, Any]
-) -> Dict[str, Path]:
+    run_label: str,
+    combo_df: pd.DataFrame,
+    dedup_df: pd.DataFrame,
+    config: Mapping[str, Any],
+    delta: DeltaResult | None = None,
+    duplicates_df: pd.DataFrame | None = None,
+    progress: ProgressCallback | None = None,
+    check: CancelCheck | None = None,
+) -> ExportResult:
     """Write Combo, duplicates-removed, and IQX CSV outputs.
 
     Uses naming patterns from config. If writing fails, logs the error and
-    continues so the prototype remains runnable.
+    continues so the prototype remains runnable. Sinks whose projected frame
+    fingerprint matches the manifest in ``output_root`` (and whose file is
+    still on disk, untouched) are skipped and reported in ``skipped``. When a
+    delta is supplied, the added/removed/changed rows are written as separate
+    CSVs and the current rows are stored as the next delta snapshot. When
+    ``export.sqlite.path`` is set the deduplicated rows are also bulk loaded
+    into that SQLite staging database. Dropped duplicates, when supplied, are
+    written as a CSV report with their cluster and matching key. ``progress``
+    is called with the rows written (or skipped) so far after each sink.
+    With a ``check`` callback, Excel and CSV files are written in slices
+    through the streaming writers so a cancel stops between slices; a
+    half-written CSV is removed and the manifest is left untouched. Unless
+    ``export.preview`` is false, the Combo and duplicates-removed frames are
+    also saved as Arrow snapshots for the GUI preview (see :mod:`preview`).
     """
     paths_cfg = config.get("paths", {}) if isinstance(config, Mapping) else {}
     output_root = ensure_dir(Path(paths_cfg.get("output_root", "output")))
+    export_cfg = config.get("export", {}) if isinstance(config, Mapping) else {}
+    skip_unchanged = bool(export_cfg.get("skip_unchanged", True))
 
     column_order = config.get("iqx_import", {}).get("column_order", [])
     combo_excel_df = _reorder_columns(combo_df, column_order, keep_extra=True)
     dedup_excel_df = _reorder_columns(dedup_df, column_order, keep_extra=True)
     dedup_csv_df = _reorder_columns(dedup_df, column_order, keep_extra=False)
 
-    combo_pattern = config.get("combo_files", {}).get("excel_pattern", "Combo {date}.xlsx")
-    combo_excel = output_root / combo_pattern.format(date=run_label)
+    combo_excel, dedup_excel, iqx_csv, dup_csv = _output_paths(run_label, output_root, config)
+
+    manifest = _load_manifest(output_root) if skip_unchanged else {}
+    result = ExportResult()
+
+    sinks = [
+        ("combo_excel", combo_excel_df, combo_excel, "Combo", _safe_write_excel),
+        ("dedup_excel", dedup_excel_df, dedup_excel, "Combo Dups Removed", _safe_write_excel),
+        ("iqx_csv", dedup_csv_df, iqx_csv, "IQX CSV", _safe_write_csv),
+    ]
+    if duplicates_df is not None and export_cfg.get("duplicates_report", True):
+        dup_df = _reorder_columns(duplicates_df, REPORT_COLUMNS + list(column_order), keep_extra=True)
+        sinks.append(("duplicates_csv", dup_df, dup_csv, "Duplicates report", _safe_write_csv))
+    if delta is not None:
+        sinks.extend(_delta_sinks(run_label, dedup_df, delta, column_order, output_root, config))
+    if check is not None:
+        sinks = [(key, df, path, label, _interruptible(writer, check)) for key, df, path, label, writer in sinks]
+    total = sum(len(sink[1]) for sink in sinks)
+    done = 0
+    for key, df, path, label, writer in sinks:
+        result.paths[key] = path
+        _write_sink(key, df, path, label, writer, manifest, result, skip_unchanged)
+        done += len(df)
+        if progress:
+            progress(done, total)
+
+    if export_cfg.get("preview", True):
+        if check is not None:
+            check()
+        previews = (
+            ("combo", combo_excel_df, combo_excel, "Combo"),
+            ("dedup", dedup_excel_df, dedup_excel, "Combo Dups Removed"),
+        )
+        for key, df, output_path, label in previews:
+            path = preview.snapshot_path(output_path)
+            # An unchanged output keeps the snapshot written with it.
+            if (f"{key}_excel" in result.skipped and path.exists()) or _safe_write_preview(df, path, label):
+                result.previews[key] = path
+
+    sqlite_cfg = export_cfg.get("sqlite") or {}
+    if sqlite_cfg.get("path"):
+        result.sqlite = _write_sqlite(run_label, dedup_excel_df, sqlite_cfg, manifest, result, skip_unchanged)
+
+    if skip_unchanged:
+        _save_manifest(output_root, manifest)
+
+    return result
+
+
+def write_chunked_outputs(
+    run_label: str,
+    combo_chunks: Iterable[pd.DataFrame],
+    dedup_chunks: Iterable[pd.DataFrame],
+    duplicates_chunks: Iterable[pd.DataFrame],
+    row_counts: Mapping[str, int],
+    config: Mapping[str, Any],
+    progress: ProgressCallback | None = None,
+    check: CancelCheck | None = None,
+) -> ExportResult:
+    """Stream the Combo, duplicates-removed, IQX CSV, and duplicates outputs chunk by chunk.
+
+    Used by the chunked execution mode, so no output is ever held in memory
+    whole. Every chunk of one output must have the same columns. Excel
+    outputs are written with openpyxl's write-only mode and skipped with a
+    warning when ``row_counts`` exceeds the sheet row limit. Nothing is
+    fingerprinted: files are always rewritten and dropped from the manifest.
+    ``progress`` is called with the rows written so far after each chunk;
+    ``check`` is called between slices of each chunk. Preview snapshots are
+    streamed alongside the two Excel outputs.
+    """
+    paths_cfg = config.get("paths", {}) if isinstance(config, Mapping) else {}
+    output_root = ensure_dir(Path(paths_cfg.get("output_root", "output")))
+    export_cfg = config.get("export", {}) if isinstance(config, Mapping) else {}
+    column_order = list(config.get("iqx_import", {}).get("column_order", []))
+    combo_excel, dedup_excel, iqx_csv, dup_csv = _output_paths(run_label, output_root, config)
+    result = ExportResult()
+    duplicates_report = bool(export_cfg.get("duplicates_report", True))
+    total = (
+        row_counts.get("combo", 0)
+        + 2 * row_counts.get("cleaned", 0)
+        + (row_counts.get("duplicates", 0) if duplicates_report else 0)
+    )
+    done = 0
+
+    def advance(rows: int) -> None:
+        nonlocal done
+        done += rows
+        if progress:
+            progress(done, total)
+
+    with_preview = bool(export_cfg.get("preview", True))
+    combo_out = _ExcelStream(combo_excel, "Combo", row_counts.get("combo", 0))
+    combo_preview = _PreviewStream(preview.snapshot_path(combo_excel), "Combo")
+    try:
+        for chunk in combo_chunks:
+            for part in _slices(chunk, check):
+                part = _reorder_columns(part, column_order, keep_extra=True)
+                combo_out.append(part)
+                if with_preview:
+                    combo_preview.append(part)
+            advance(len(chunk))
+    except RunCancelled:
+        combo_preview.discard()
+        raise
+    if combo_out.close():
+        result.paths["combo_excel"] = combo_excel
+    if with_preview and combo_preview.close():
+        result.previews["combo"] = combo_preview.path
+
+    dedup_out = _ExcelStream(dedup_excel, "Combo Dups Removed", row_counts.get("cleaned", 0))
+    dedup_preview = _PreviewStream(preview.snapshot_path(dedup_excel), "Combo Dups Removed")
+    csv_out = _CsvStream(iqx_csv, "IQX CSV")
+    try:
+        for chunk in dedup_chunks:
+            for part in _slices(chunk, check):
+                excel_part = _reorder_columns(part, column_order, keep_extra=True)
+                dedup_out.append(excel_part)
+                if with_preview:
+                    dedup_preview.append(excel_part)
+                csv_out.append(_reorder_columns(part, column_order, keep_extra=False))
+            advance(2 * len(chunk))
+    except RunCancelled:
+        csv_out.discard()
+        dedup_preview.discard()
+        raise
+    if dedup_out.close():
+        result.paths["dedup_excel"] = dedup_excel
+    if with_preview and dedup_preview.close():
+        result.previews["dedup"] = dedup_preview.path
+    if csv_out.close():
+        result.paths["iqx_csv"] = iqx_csv
+
+    if duplicates_report:
+        dup_out = _CsvStream(dup_csv, "Duplicates report")
+        try:
+            for chunk in duplicates_chunks:
+                for part in _slices(chunk, check):
+                    dup_out.append(_reorder_columns(part, REPORT_COLUMNS + column_order, keep_extra=True))
+                advance(len(chunk))
+        except RunCancelled:
+            dup_out.discard()
+            raise
+        if dup_out.close():
+            result.paths["duplicates_csv"] = dup_csv
+
+    if bool(export_cfg.get("skip_unchanged", True)):
+        manifest = _load_manifest(output_root)
+        for path in (combo_excel, dedup_excel, iqx_csv, dup_csv):
+            manifest.pop(path.name, None)
+        _save_manifest(output_root, manifest)
+    return result
+
+
+class _ExcelStream:
+    """Append frames to a single-sheet workbook without keeping its rows in memory."""
+
+    def __init__(self, path: Path, label: str, rows: int) -> None:
+        self.path = path
+        self.label = label
+        self.workbook = None
+        self.sheet = None
+        self.failed = False
+        if rows + 1 > EXCEL_MAX_ROWS:
+            logger.warning("Skipped %s Excel %s: %s rows exceed the sheet limit", label, path, rows)
+            self.failed = True
+
+    def append(self, df: pd.DataFrame) -> None:
+        if self.failed:
+            return
+        try:
+            if self.workbook is None:
+                import openpyxl
+
+                self.workbook = openpyxl.Workbook(write_only=True)
+                self.sheet = self.workbook.create_sheet("Sheet1")
+                self.sheet.append([_header_cell(self.sheet, col) for col in df.columns])
+            for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+                self.sheet.append(row)
+        except Exception as exc:  # pragma: no cover - placeholder
+            logger.error("Failed to write %s Excel %s: %s", self.label, self.path, exc)
+            self.failed = True
+
+    def close(self) -> bool:
+        if self.failed:
+            return False
+        try:
+            if self.workbook is None:
+                import openpyxl
+
+                self.workbook = openpyxl.Workbook(write_only=True)
+                self.workbook.create_sheet("Sheet1")
+            self.workbook.save(self.path)
+        except Exception as exc:  # pragma: no cover - placeholder
+            logger.error("Failed to write %s Excel %s: %s", self.label, self.path, exc)
+            return False
+        logger.info("Wrote %s to %s", self.label, self.path)
+        return True
+
+    def discard(self) -> None:
+        """Drop the unsaved workbook; an existing file at ``path`` is left as it was."""
+        self.workbook = None
+        self.failed = True
+
+
+def _header_cell(sheet: Any, name: Any) -> Any:
+    # The header to_excel writes, so streamed and in-memory outputs look alike: pandas 2
+    # styles it (bold, thin border, centered), pandas 3 leaves it plain.
+    if not PANDAS_STYLES_HEADER:
+        return str(name)
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    cell = WriteOnlyCell(sheet, value=str(name))
+    cell.font = Font(bold=True)
+    thin = Side(style="thin")
+    cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    cell.alignment = Alignment(horizontal="center", vertical="top")
+    return cell
+
+
+class _PreviewStream:
+    """Write frames to an Arrow IPC preview snapshot for the GUI, chunk by chunk.
+
+    Every column is stored as text (blanks as nulls), the way the preview shows
+    it, so chunks with different dtypes share one schema. The file is written
+    uncompressed next to its final name and moved into place on close, so it
+    can be memory-mapped. Without pyarrow nothing is written.
+    """
+
+    def __init__(self, path: Path, label: str) -> None:
+        self.path = path
+        self.label = label
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.writer = None
+        self.schema = None
+        self.failed = False
+
+    def append(self, df: pd.DataFrame) -> None:
+        if self.failed:
+            return
+        try:
+            import pyarrow as pa
+
+            text = df.astype("string")
+            text.columns = [str(col) for col in text.columns]
+            table = pa.Table.from_pandas(text, preserve_index=False)
+            if self.writer is None:
+                ensure_dir(self.path.parent)
+                self.schema = table.schema.remove_metadata()
+                self.writer = pa.ipc.new_file(str(self.tmp_path), self.schema)
+            self.writer.write_table(table.cast(self.schema))
+        except ImportError:
+            logger.info("pyarrow is not installed; skipped the %s preview", self.label)
+            self.failed = True
+        except Exception as exc:  # pragma: no cover - placeholder
+            logger.error("Failed to write %s preview %s: %s", self.label, self.path, exc)
+            self.discard()
+
+    def close(self) -> bool:
+        if self.failed or self.writer is None:
+            return False
+        try:
+            self.writer.close()
+            self.tmp_path.replace(self.path)
+        except Exception as exc:  # pragma: no cover - placeholder
+            logger.error("Failed to write %s preview %s: %s", self.label, self.path, exc)
+            self.discard()
+            return False
+        return True
+
+    def discard(self) -> None:
+        """Drop the unfinished snapshot; an existing file at ``path`` is left as it was."""
+        if self.writer is not None:
+            try:
+                self.writer.close()
+            except Exception:  # pragma: no cover - already broken
+                pass
+        self.tmp_path.unlink(missing_ok=True)
+        self.failed = True
 
-    dedup_excel = output_root / f"Combo Dups Removed {run_label}.xlsx"
 
-    iqx_pattern = config.get("combo_files", {}).get("csv_pattern", "Bulk Import {date}.csv")
-    iqx_csv = output_root / iqx_pattern.format(date=run_label)
+class _CsvStream:
+    """Append frames to a CSV, writing the header with the first chunk."""
 
-    _safe_write_excel(combo_excel_df, combo_excel, "Combo")
-    _safe_write_excel(dedup_excel_df, dedup_excel, "Combo Dups Removed")
-    _safe_write_csv(dedup_csv_df, iqx_csv, "IQX CSV")
+    def __init__(self, path: Path, label: str) -> None:
+        self.path = path
+        self.label = label
+        self.started = False
+        self.failed = False
 
-    return {"combo_excel": combo_excel, "dedup_excel": dedup_excel, "iqx_csv": iqx_csv}
+    def append(self, df: pd.DataFrame) -> None:
+        if self.failed:
+            return
+        try:
+            df.to_csv(self.path, index=False, mode="a" if self.started else "w", header=not self.started)
+            self.started = True
+        except Exception as exc:  # pragma: no cover - placeholder
+            logger.error("Failed to write %s CSV %s: %s", self.label, self.path, exc)
+            self.failed = True
+
+    def close(self) -> bool:
+        if self.failed:
+            return False
+        if not self.started:
+            self.path.write_text("", encoding="utf-8")
+        logger.info("Wrote %s to %s", self.label, self.path)
+        return True
+
+    def discard(self) -> None:
+        """Remove a partly written file after the run was cancelled."""
+        if self.started:
+            self.path.unlink(missing_ok=True)
+        self.failed = True
+
+
+def _slices(df: pd.DataFrame, check: CancelCheck | None) -> Iterator[pd.DataFrame]:
+    """Yield ``df`` whole, or in checked slices of CHECK_EVERY_ROWS rows when ``check`` is given."""
+    if check is None:
+        yield df
+        return
+    for start in range(0, max(len(df), 1), CHECK_EVERY_ROWS):
+        check()
+        yield df.iloc[start : start + CHECK_EVERY_ROWS]
+
+
+def _interruptible(
+    writer: Callable[[pd.DataFrame, Path, str], bool], check: CancelCheck
+) -> Callable[[pd.DataFrame, Path, str], bool]:
+    """Wrap a ``_safe_write_*`` writer so it streams ``df`` in checked slices."""
+    if writer is _safe_write_excel:
+        open_stream = _ExcelStream
+    elif writer is _safe_write_csv:
+        open_stream = lambda path, label, rows: _CsvStream(path, label)  # noqa: E731
+    else:
+        return writer
+
+    def write(df: pd.DataFrame, path: Path, label: str) -> bool:
+        out = open_stream(path, label, len(df))
+        try:
+            for part in _slices(df, check):
+                out.append(part)
+        except RunCancelled:
+            out.discard()
+            raise
+        return out.close()
+
+    return write
+
+
+def _output_paths(run_label: str, output_root: Path, config: Mapping[str, Any]) -> tuple[Path, Path, Path, Path]:
+    files_cfg = config.get("combo_files", {})
+    combo_pattern = files_cfg.get("excel_pattern", "Combo {date}.xlsx")
+    iqx_pattern = files_cfg.get("csv_pattern", "Bulk Import {date}.csv")
+    dup_pattern = files_cfg.get("duplicates_pattern", "Duplicates Report {date}.csv")
+    return (
+        output_root / combo_pattern.format(date=run_label),
+        output_root / f"Combo Dups Removed {run_label}.xlsx",
+        output_root / iqx_pattern.format(date=run_label),
+        output_root / dup_pattern.format(date=run_label),
+    )
+
+
+def _delta_sinks(
+    run_label: str,
+    dedup_df: pd.DataFrame,
+    delta: DeltaResult,
+    column_order: list[str],
+    output_root: Path,
+    config: Mapping[str, Any],
+) -> list[tuple[str, pd.DataFrame, Path, str, Callable[[pd.DataFrame, Path, str], bool]]]:
+    delta_cfg = config.get("delta", {}) if isinstance(config, Mapping) else {}
+    pattern = delta_cfg.get("file_pattern", "Delta {kind} {date}.csv")
+    sinks = []
+    for kind, df in (("Added", delta.added_df), ("Removed", delta.removed_df), ("Changed", delta.changed_df)):
+        path = output_root / pattern.format(kind=kind, date=run_label)
+        frame = _reorder_columns(df, column_order, keep_extra=True)
+        sinks.append((f"delta_{kind.lower()}", frame, path, f"Delta {kind}", _safe_write_csv))
+
+    snapshot = delta_cfg.get("snapshot_path")
+    if snapshot:
+        snapshot_path = Path(snapshot)
+        ensure_dir(snapshot_path.parent)
+        frame = _reorder_columns(dedup_df, column_order, keep_extra=True)
+        writer = _safe_write_parquet if snapshot_path.suffix.lower() == ".parquet" else _safe_write_csv
+        sinks.append(("delta_snapshot", frame, snapshot_path, "Delta snapshot", writer))
+    return sinks
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Return a fast content hash of a frame's columns and cell values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(str(col) for col in df.columns).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _write_sink(
+    key: str,
+    df: pd.DataFrame,
+    path: Path,
+    label: str,
+    writer: Callable[[pd.DataFrame, Path, str], bool],
+    manifest: Dict[str, Any],
+    result: ExportResult,
+    skip_unchanged: bool,
+) -> None:
+    fingerprint = frame_fingerprint(df) if skip_unchanged else ""
+    if skip_unchanged and _is_unchanged(manifest.get(path.name), path, fingerprint):
+        logger.info("Skipped %s; contents unchanged at %s", label, path)
+        result.skipped.append(key)
+        return
+    if writer(df, path, label) and skip_unchanged:
+        stat = path.stat()
+        manifest[path.name] = {
+            "fingerprint": fingerprint,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+    else:
+        manifest.pop(path.name, None)
+
+
+def _write_sqlite(
+    run_label: str,
+    df: pd.DataFrame,
+    sqlite_cfg: Mapping[str, Any],
+    manifest: Dict[str, Any],
+    result: ExportResult,
+    skip_unchanged: bool,
+) -> SqliteLoadStats | None:
+    db_path = Path(sqlite_cfg["path"])
+    ensure_dir(db_path.parent)
+    mode = str(sqlite_cfg.get("mode", "per_run"))
+    table = sqlite_sink.resolve_table(run_label, mode, sqlite_cfg.get("table"))
+    manifest_key = f"sqlite:{db_path.name}:{table}"
+    result.paths["sqlite"] = db_path
+
+    fingerprint = frame_fingerprint(df) if skip_unchanged else ""
+    entry = manifest.get(manifest_key)
+    if (
+        skip_unchanged
+        and isinstance(entry, Mapping)
+        and entry.get("fingerprint") == fingerprint
+        and sqlite_sink.table_exists(db_path, table)
+    ):
+        logger.info("Skipped SQLite staging; table %s unchanged in %s", table, db_path)
+        result.skipped.append("sqlite")
+        return None
+
+    try:
+        stats = sqlite_sink.load_frame(
+            df,
+            db_path,
+            run_label,
+            mode=mode,
+            table=table,
+            batch_size=int(sqlite_cfg.get("batch_size", sqlite_sink.DEFAULT_BATCH_SIZE)),
+        )
+    except Exception as exc:  # pragma: no cover - placeholder
+        logger.error("Failed to load SQLite staging table %s in %s: %s", table, db_path, exc)
+        manifest.pop(manifest_key, None)
+        return None
+
+    if skip_unchanged:
+        manifest[manifest_key] = {"fingerprint": fingerprint}
+    return stats
+
+
+def _is_unchanged(entry: Any, path: Path, fingerprint: str) -> bool:
+    if not isinstance(entry, Mapping) or entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+
+def _load_manifest(output_root: Path) -> Dict[str, Any]:
+    path = output_root / MANIFEST_FILENAME
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, Mapping) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    files = data.get("files", {})
+    return dict(files) if isinstance(files, Mapping) else {}
+
+
+def _save_manifest(output_root: Path, manifest: Mapping[str, Any]) -> None:
+    path = output_root / MANIFEST_FILENAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "files": manifest}, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+    except OSError as exc:  # pragma: no cover - best effort
+        logger.warning("Failed to write export manifest %s: %s", path, exc)
 
 
 def _reorder_columns(df: pd.DataFrame, column_order: list[str], keep_extra: bool) -> pd.DataFrame:
@@ -53,17 +578,37 @@ def _reorder_columns(df: pd.DataFrame, column_order: list[str], keep_extra: bool
     return out[column_order]
 
 
-def _safe_write_excel(df: pd.DataFrame, path: Path, label: str) -> None:
+def _safe_write_excel(df: pd.DataFrame, path: Path, label: str) -> bool:
     try:
         df.to_excel(path, index=False)
         logger.info("Wrote %s to %s", label, path)
+        return True
     except Exception as exc:  # pragma: no cover - placeholder
         logger.error("Failed to write %s Excel %s: %s", label, path, exc)
+        return False
 
 
-def _safe_write_csv(df: pd.DataFrame, path: Path, label: str) -> None:
+def _safe_write_csv(df: pd.DataFrame, path: Path, label: str) -> bool:
     try:
         df.to_csv(path, index=False)
         logger.info("Wrote %s to %s", label, path)
+        return True
     except Exception as exc:  # pragma: no cover - placeholder
         logger.error("Failed to write %s CSV %s: %s", label, path, exc)
+        return False
+
+
+def _safe_write_parquet(df: pd.DataFrame, path: Path, label: str) -> bool:
+    try:
+        df.to_parquet(path, index=False)
+        logger.info("Wrote %s to %s", label, path)
+        return True
+    except Exception as exc:  # pragma: no cover - placeholder
+        logger.error("Failed to write %s Parquet %s: %s", label, path, exc)
+        return False
+
+
+def _safe_write_preview(df: pd.DataFrame, path: Path, label: str) -> bool:
+    out = _PreviewStream(path, label)
+    out.append(df)
+    return out.close()
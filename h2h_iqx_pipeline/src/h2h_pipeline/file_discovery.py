@@ -13,7 +13,7 @@ def discover_month_files(
     month: str, input_root: Path, config: Mapping[str, Any]
 ) -> DiscoveryResult:
     """Locate the month directory, source files, and prior Combo file."""
-    month_dir = _find_month_dir(input_root, month)
+    month_dir = find_month_dir(input_root, month)
     sources: Dict[str, Path] = {}
     missing_sources: list[str] = []
 
@@ -38,7 +38,7 @@ def discover_month_files(
     else:
         logger.warning("No month directory found for %s under %s", month, input_root)
 
-    previous_combo = _find_previous_combo(input_root, config)
+    previous_combo = find_previous_combo(input_root, config)
 
     logger.info(
         "Discovery completed for %s: %s sources, previous combo: %s",
@@ -57,7 +57,7 @@ def discover_month_files(
     )
 
 
-def _find_month_dir(input_root: Path, month: str) -> Path | None:
+def find_month_dir(input_root: Path, month: str) -> Path | None:
     """Find a month directory, supporting common folder naming conventions."""
     candidates = [
         input_root / month,
@@ -72,14 +72,24 @@ def _find_month_dir(input_root: Path, month: str) -> Path | None:
     return None
 
 
-def _find_previous_combo(input_root: Path, config: Mapping[str, Any]) -> Path | None:
-    """Attempt to locate the prior month's Combo file based on config hints."""
+def find_previous_combo(input_root: Path, config: Mapping[str, Any]) -> Path | None:
+    """Attempt to locate the prior month's Combo file based on config hints.
+
+    An explicit ``run.previous_combo`` path wins over searching the previous
+    month's folder.
+    """
     run_cfg = config.get("run", {}) if isinstance(config, Mapping) else {}
+    explicit = run_cfg.get("previous_combo")
+    if explicit:
+        if Path(explicit).exists():
+            return Path(explicit)
+        logger.warning("Configured previous Combo not found: %s", explicit)
+
     prev_month = run_cfg.get("previous_month")
     if not prev_month:
         return None
 
-    prev_dir = _find_month_dir(input_root, prev_month)
+    prev_dir = find_month_dir(input_root, prev_month)
     if not prev_dir:
         return None
 
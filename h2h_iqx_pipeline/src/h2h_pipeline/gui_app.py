@@ -1,9 +1,11 @@
 import json
+import multiprocessing
 import os
 import queue
 import re
 import sys
 import threading
+import time
 from datetime import date
 from pathlib import Path
 from typing import Any, Mapping
@@ -13,14 +15,23 @@ import tkinter.font as tkfont
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
 
-import yaml
-
+from .cancellation import RunCancelled
 from .config_loader import load_config, normalize_config_paths
-from .pipeline import run_pipeline
+from .instrumentation import format_progress, progress_fraction
+from .log_tail import tail_lines
+from .models import RunResult
+from .process_runner import WarmWorker
+from .run_queue import QueuedJob, RunLane, RunQueue
+from .warmup import start_worker, warm_up
+
+# yaml and the pipeline (pandas) are imported where they are used so the
+# window can appear before the heavy modules load.
 
 
 SETTINGS_PATH = Path.home() / ".h2h_iqx_pipeline_gui.json"
 MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+# Lines of pipeline.log shown when the window opens (runs stream theirs as they go).
+LOG_TAIL_LINES = 200
 
 
 def _resource_path(relative: str) -> Path:
@@ -29,19 +40,19 @@ def _resource_path(relative: str) -> Path:
 
 
 def _load_yaml(path: Path) -> Mapping[str, Any]:
+    import yaml
+
     with path.open("r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
 
 
-def _tail_lines(path: Path, limit: int = 200) -> list[str]:
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-        if len(lines) > limit:
-            lines = lines[-limit:]
-        return [line.rstrip("\n") for line in lines]
-    except FileNotFoundError:
-        return []
+def _saved_log_file(settings: Mapping[str, str]) -> Path | None:
+    """pipeline.log of the last run with the saved folders (the log_dir _run_job sets)."""
+    output_root = settings.get("output_root", "").strip()
+    input_root = settings.get("input_root", "").strip()
+    if not output_root and not input_root:
+        return None
+    return (Path(output_root) if output_root else Path(input_root) / "output") / "logs" / "pipeline.log"
 
 
 class PipelineApp(tk.Tk):
@@ -53,8 +64,12 @@ class PipelineApp(tk.Tk):
 
         self._queue: queue.Queue[tuple[str, Any]] = queue.Queue()
         self._running = False
+        self._runs = RunQueue(self._run_job, on_change=lambda job: self._queue.put(("jobs", job)))
         self._last_output_root: Path | None = None
         self._last_log_file: Path | None = None
+        self._worker: WarmWorker | None = None
+        self._worker_lock = threading.Lock()
+        self._run_started: float | None = None
         self._logo_image: tk.PhotoImage | None = None
         self._icon_image: tk.PhotoImage | None = None
 
@@ -68,14 +83,18 @@ class PipelineApp(tk.Tk):
         self.output_root_var = tk.StringVar(value=settings.get("output_root", ""))
         self.month_var = tk.StringVar(value=settings.get("month", date.today().strftime("%Y-%m")))
         self.status_var = tk.StringVar(value="Idle")
+        self.progress_var = tk.StringVar(value="")
+        self.jobs_var = tk.StringVar(value="")
         self.status_label: ttk.Label | None = None
         self.progress: ttk.Progressbar | None = None
 
         self._build_ui()
+        self._show_saved_log_tail(settings)
         self._prefill_from_config()
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.after(100, self._drain_queue)
+        self._start_warmup(self.config_path_var.get().strip())
 
     def _pick_font(self, candidates: list[str]) -> str:
         available = set(tkfont.families(self))
@@ -312,23 +331,34 @@ class PipelineApp(tk.Tk):
         buttons.columnconfigure(0, weight=1, uniform="actions")
         buttons.columnconfigure(1, weight=1, uniform="actions")
         buttons.columnconfigure(2, weight=1, uniform="actions")
+        buttons.columnconfigure(3, weight=1, uniform="actions")
 
         self.run_button = ttk.Button(buttons, text="Run pipeline", command=self._start_run, style="Accent.TButton")
         self.run_button.grid(row=0, column=0, padx=(0, 8), sticky="ew")
 
+        self.cancel_button = ttk.Button(
+            buttons, text="Cancel all", command=self._cancel_run, state="disabled", style="Secondary.TButton"
+        )
+        self.cancel_button.grid(row=0, column=1, padx=(0, 8), sticky="ew")
+
         self.open_output_button = ttk.Button(
             buttons, text="Open output folder", command=self._open_output, state="disabled", style="Secondary.TButton"
         )
-        self.open_output_button.grid(row=0, column=1, padx=(0, 8), sticky="ew")
+        self.open_output_button.grid(row=0, column=2, padx=(0, 8), sticky="ew")
 
         self.open_log_button = ttk.Button(
             buttons, text="Open log file", command=self._open_log, state="disabled", style="Secondary.TButton"
         )
-        self.open_log_button.grid(row=0, column=2, sticky="ew")
+        self.open_log_button.grid(row=0, column=3, sticky="ew")
 
         row += 1
         self.progress = ttk.Progressbar(left, mode="indeterminate", style="Accent.Horizontal.TProgressbar")
-        self.progress.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(10, 6))
+        self.progress.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(10, 2))
+
+        row += 1
+        ttk.Label(left, textvariable=self.progress_var, style="Card.Subtitle.TLabel").grid(
+            row=row, column=0, columnspan=3, sticky="w", pady=(0, 6)
+        )
 
         row += 1
         status_row = ttk.Frame(left, style="Card.TFrame")
@@ -336,6 +366,9 @@ class PipelineApp(tk.Tk):
         ttk.Label(status_row, text="Status", style="Card.TLabel").grid(row=0, column=0, sticky="w")
         self.status_label = ttk.Label(status_row, textvariable=self.status_var, style="Pill.Idle.TLabel")
         self.status_label.grid(row=0, column=1, sticky="w", padx=(8, 0))
+        ttk.Label(status_row, textvariable=self.jobs_var, style="Card.Subtitle.TLabel").grid(
+            row=0, column=2, sticky="w", padx=(12, 0)
+        )
 
         right = ttk.Frame(main, padding=16, style="Card.TFrame")
         right.grid(row=1, column=1, sticky="nsew")
@@ -430,9 +463,6 @@ class PipelineApp(tk.Tk):
                 self.month_var.set(run_cfg["current_month"])
 
     def _start_run(self) -> None:
-        if self._running:
-            return
-
         config_path = self.config_path_var.get().strip()
         if not config_path:
             messagebox.showerror("Missing config", "Please select a config file.")
@@ -446,31 +476,36 @@ class PipelineApp(tk.Tk):
             messagebox.showerror("Invalid month", "Month must be in YYYY-MM format.")
             return
 
-        self._set_running(True)
-        self._clear_log()
-        self._append_log("Starting pipeline run...")
-
-        thread = threading.Thread(
-            target=self._run_pipeline_worker,
-            args=(config_path, self.input_root_var.get().strip(), self.output_root_var.get().strip(), month),
-            daemon=True,
+        # A run submitted while others are going waits in the queue.
+        if not self._runs.busy:
+            self._clear_log()
+        self._save_settings()
+        job = self._runs.submit(
+            config_path, self.input_root_var.get().strip(), self.output_root_var.get().strip(), month
         )
-        thread.start()
+        self._append_log(f"Queued run {job.id} ({month or 'config month'}, {Path(config_path).name}).")
 
-    def _run_pipeline_worker(
-        self, config_path: str, input_root_raw: str, output_root_raw: str, month_raw: str
-    ) -> None:
+    def _cancel_run(self) -> None:
+        if not self._runs.cancel_all():
+            return
+        self.cancel_button.configure(state="disabled")
+        self._set_status("Cancelling...")
+        self._append_log("Cancelling; running jobs stop at the next check.")
+
+    def _run_job(self, job: QueuedJob, lane: RunLane) -> RunResult:
+        output_root: Path | None = None
+        paths_cfg: dict[str, Any] = {}
         try:
             overrides: dict[str, dict[str, str]] = {"paths": {}}
-            input_root = Path(input_root_raw) if input_root_raw else None
-            output_root = Path(output_root_raw) if output_root_raw else None
+            input_root = Path(job.input_root) if job.input_root else None
+            output_root = Path(job.output_root) if job.output_root else None
 
             if input_root:
                 overrides["paths"]["input_root"] = str(input_root)
             if output_root:
                 overrides["paths"]["output_root"] = str(output_root)
 
-            cfg = load_config(Path(config_path), overrides=overrides if overrides["paths"] else None)
+            cfg = load_config(Path(job.config_path), overrides=overrides if overrides["paths"] else None)
 
             if input_root is None:
                 input_root = Path(cfg["paths"]["input_root"])
@@ -481,48 +516,152 @@ class PipelineApp(tk.Tk):
             paths_cfg["output_root"] = str(output_root)
             paths_cfg["log_dir"] = str(output_root / "logs")
 
-            month = month_raw or cfg.get("run", {}).get("current_month") or date.today().strftime("%Y-%m")
+            month = job.month or cfg.get("run", {}).get("current_month") or date.today().strftime("%Y-%m")
             if not MONTH_PATTERN.match(month):
                 raise ValueError("Month must be in YYYY-MM format.")
+            job.month = month
 
+            self._run_started = time.perf_counter()
             self._queue.put(("status", "Running pipeline..."))
-            self._queue.put(("log", f"Config: {config_path}"))
+            self._queue.put(("log", f"Starting run {job.id}..."))
+            self._queue.put(("log", f"Config: {job.config_path}"))
             self._queue.put(("log", f"Input root: {input_root}"))
             self._queue.put(("log", f"Output root: {output_root}"))
             self._queue.put(("log", f"Month: {month}"))
 
-            run_pipeline(month=month, input_root=input_root, config=cfg)
-
             log_file = Path(paths_cfg["log_dir"]) / "pipeline.log"
-            log_lines = _tail_lines(log_file)
-            self._queue.put(("log", "Pipeline run completed."))
-            if log_lines:
-                self._queue.put(("log", "---- Pipeline log (tail) ----"))
-                for line in log_lines:
-                    self._queue.put(("log", line))
+            result = lane.run(
+                month,
+                input_root,
+                cfg,
+                hooks=[self._queue_stage_event],
+                progress_hooks=[self._queue_stage_event],
+                cancel=job.cancel_token,
+                on_log=lambda line: self._queue.put(("log", line)),
+                log_file=log_file,
+                spare=self._take_worker,
+            )
+
+            self._queue.put(("log", f"Run {job.id} completed."))
 
             self._queue.put(
                 ("done", {"output_root": output_root, "log_file": log_file, "message": "Run complete"})
             )
+            return result
+        except RunCancelled as exc:
+            self._queue.put(("log", f"Run {job.id} stopped: {exc.reason}"))
+            if exc.report_path:
+                self._queue.put(("log", f"Partial QA report: {exc.report_path}"))
+            log_file = Path(paths_cfg["log_dir"]) / "pipeline.log" if paths_cfg.get("log_dir") else None
+            self._queue.put(("done", {"output_root": output_root, "log_file": log_file, "message": "Cancelled"}))
+            raise
         except Exception as exc:
             self._queue.put(("error", str(exc)))
+            raise
+        finally:
+            self._run_started = None
+
+    def _take_worker(self) -> WarmWorker | None:
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        return worker
+
+    def _start_warmup(self, config_path: str, quiet: bool = False) -> None:
+        """Import the pipeline and load the config and mappings on a background thread.
+
+        With the default ``process`` backend this happens in the pipeline
+        process the next run will use. Unless ``quiet``, the status shows
+        "Ready" when done.
+        """
+        thread = threading.Thread(
+            target=self._warmup_worker, args=(config_path, quiet), name="gui-warmup", daemon=True
+        )
+        thread.start()
+
+    def _warmup_worker(self, config_path: str, quiet: bool) -> None:
+        if not quiet:
+            self._queue.put(("status", "Warming up..."))
+        try:
+            worker = start_worker(config_path or None)
+            with self._worker_lock:
+                previous, self._worker = self._worker, worker
+            if previous is not None:
+                previous.close()
+            result = worker.wait_ready() if worker is not None else warm_up(config_path or None)
+        except Exception as exc:
+            self._queue.put(("log", f"Warm-up failed: {exc}"))
+            if not quiet:
+                self._queue.put(("ready", "Idle"))
+            return
+        if quiet:
+            return
+        if result.error:
+            self._queue.put(("log", f"Config check failed: {result.error}"))
+        self._queue.put(("log", f"Ready in {result.seconds:.1f}s ({result.mappings} mapping files loaded)."))
+        self._queue.put(("ready", "Ready"))
+
+    def _queue_stage_event(self, event: Any) -> None:
+        started = self._run_started
+        if started is not None and event.rows_done:
+            self._run_started = None
+            self._queue.put(("log", f"Time to first row: {time.perf_counter() - started:.2f}s"))
+        self._queue.put(("progress", event))
 
     def _drain_queue(self) -> None:
+        # Only the newest stage/progress event is drawn per tick, however many queued up.
+        latest_progress = None
         try:
             while True:
                 kind, payload = self._queue.get_nowait()
-                if kind == "log":
+                if kind == "progress":
+                    latest_progress = payload
+                elif kind == "log":
                     self._append_log(payload)
                 elif kind == "status":
                     self._set_status(payload)
+                elif kind == "ready":
+                    # A run started meanwhile owns the status pill.
+                    if not self._running:
+                        self._set_status(payload)
+                elif kind == "jobs":
+                    self._handle_job(payload)
                 elif kind == "done":
                     self._handle_done(payload)
                 elif kind == "error":
                     self._handle_error(payload)
         except queue.Empty:
             pass
+        if latest_progress is not None and self._running:
+            self._render_progress(latest_progress)
         self.after(100, self._drain_queue)
 
+    def _render_progress(self, event: Any) -> None:
+        self.progress_var.set(format_progress(event))
+        if self.progress is None:
+            return
+        fraction = progress_fraction(event)
+        if fraction is None:
+            if str(self.progress.cget("mode")) != "indeterminate":
+                self.progress.configure(mode="indeterminate", value=0)
+                self.progress.start(12)
+        else:
+            if str(self.progress.cget("mode")) != "determinate":
+                self.progress.stop()
+                self.progress.configure(mode="determinate", maximum=100)
+            self.progress.configure(value=fraction * 100)
+
+    def _handle_job(self, job: QueuedJob) -> None:
+        jobs = self._runs.jobs()
+        counts = {status: sum(1 for j in jobs if j.status == status) for status in ("running", "queued")}
+        finished = len(jobs) - counts["running"] - counts["queued"]
+        self.jobs_var.set(f"{counts['running']} running, {counts['queued']} queued, {finished} finished")
+        running = self._runs.busy
+        if running != self._running:
+            self._set_running(running)
+        if job.done and not running and self._worker is None:
+            # Lane processes end with their lane; have the next one ready before the next run.
+            self._start_warmup(job.config_path, quiet=True)
+
     def _handle_done(self, payload: Mapping[str, Any]) -> None:
         self._set_status(payload.get("message", "Done"))
         self._last_output_root = payload.get("output_root")
@@ -531,26 +670,26 @@ class PipelineApp(tk.Tk):
             self.open_output_button.configure(state="normal")
         if self._last_log_file:
             self.open_log_button.configure(state="normal")
-        self._set_running(False)
-        self._save_settings()
 
     def _handle_error(self, message: str) -> None:
         self._set_status("Error")
         self._append_log(f"ERROR: {message}")
-        self._set_running(False)
         messagebox.showerror("Pipeline error", message)
 
     def _set_running(self, running: bool) -> None:
         self._running = running
-        state = "disabled" if running else "normal"
-        for widget in (self.run_button,):
-            widget.configure(state=state)
+        # Runs submitted while others are going are queued, so the run button stays enabled.
+        self.run_button.configure(text="Queue another run" if running else "Run pipeline")
+        self.cancel_button.configure(state="normal" if running else "disabled")
         if self.progress:
             if running:
+                self.progress_var.set("")
+                self.progress.configure(mode="indeterminate", value=0)
                 self.progress.start(12)
                 self._set_status("Running...")
             else:
                 self.progress.stop()
+                self.progress.configure(value=0)
 
     def _append_log(self, message: str) -> None:
         self.log_box.configure(state="normal")
@@ -558,6 +697,17 @@ class PipelineApp(tk.Tk):
         self.log_box.see("end")
         self.log_box.configure(state="disabled")
 
+    def _show_saved_log_tail(self, settings: Mapping[str, str]) -> None:
+        log_file = _saved_log_file(settings)
+        lines = tail_lines(log_file, LOG_TAIL_LINES) if log_file is not None else []
+        if not lines:
+            return
+        self._last_log_file = log_file
+        self.open_log_button.configure(state="normal")
+        self._append_log("---- Pipeline log (tail) ----")
+        for line in lines:
+            self._append_log(line)
+
     def _clear_log(self) -> None:
         self.log_box.configure(state="normal")
         self.log_box.delete("1.0", "end")
@@ -599,8 +749,10 @@ class PipelineApp(tk.Tk):
             return "Pill.Error.TLabel"
         if "running" in lowered:
             return "Pill.Running.TLabel"
-        if "complete" in lowered or "done" in lowered:
+        if "complete" in lowered or "done" in lowered or "ready" in lowered:
             return "Pill.Done.TLabel"
+        if "cancel" in lowered:
+            return "Pill.Error.TLabel"
         return "Pill.Idle.TLabel"
 
     def _set_status(self, text: str) -> None:
@@ -609,12 +761,18 @@ class PipelineApp(tk.Tk):
             self.status_label.configure(style=self._status_style_for_text(text))
 
     def _on_close(self) -> None:
+        worker = self._take_worker()
+        if worker is not None:
+            worker.close()
         if not self._running:
             self._save_settings()
+        self._runs.cancel_all("Window closed")
         self.destroy()
 
 
 def main() -> None:
+    # Lets a frozen (PyInstaller) build start the pipeline child process.
+    multiprocessing.freeze_support()
     app = PipelineApp()
     app.mainloop()
 
@@ -1,103 +1,190 @@
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Iterator, Mapping, MutableMapping
 
 import logging
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES  # read_excel's default na_values
 
 from .constants import (
     DATE_AVAILABLE_COLUMN,
     CREATE_DATE_COLUMN,
     EMAIL_COLUMN,
-    EXTERNAL_IDENTIFIER_COLUMN,
     FIRST_NAME_COLUMN,
     LAST_NAME_COLUMN,
     PHONE_COLUMN,
-    PROFESSION_COLUMN,
-    SERVICE_BRANCH_COLUMN,
     SOURCE_CODE_COLUMN,
     SOURCE_COLUMN,
     ZIP_COLUMN,
 )
-from .models import DiscoveryResult
+from .cancellation import CHECK_EVERY_ROWS, CancelCheck
+from .config_loader import compile_plan
+from .instrumentation import ProgressCallback
+from .models import DiscoveryResult, RunPlan
+from .utils.columns import canonical_column
 from .utils.series import combine_keys, digits_only, normalize_series
+from .utils.xlsx import sheet_row_count
 
 
 logger = logging.getLogger(__name__)
 
-# Maps normalized column tokens to canonical names
-CANONICAL_COLUMN_MAP = {
-    "record id": EXTERNAL_IDENTIFIER_COLUMN,
-    "record_id": EXTERNAL_IDENTIFIER_COLUMN,
-    "external identifier": EXTERNAL_IDENTIFIER_COLUMN,
-    "external_identifier": EXTERNAL_IDENTIFIER_COLUMN,
-    "last name": LAST_NAME_COLUMN,
-    "lastname": LAST_NAME_COLUMN,
-    "last_name": LAST_NAME_COLUMN,
-    "first name": FIRST_NAME_COLUMN,
-    "firstname": FIRST_NAME_COLUMN,
-    "first_name": FIRST_NAME_COLUMN,
-    "email": EMAIL_COLUMN,
-    "email address": EMAIL_COLUMN,
-    "email_address": EMAIL_COLUMN,
-    "phone": PHONE_COLUMN,
-    "phone number": PHONE_COLUMN,
-    "mobile phone number": PHONE_COLUMN,
-    "phone_number": PHONE_COLUMN,
-    "zip": ZIP_COLUMN,
-    "zipcode": ZIP_COLUMN,
-    "zip code": ZIP_COLUMN,
-    "postal": ZIP_COLUMN,
-    "postal code": ZIP_COLUMN,
-    "profession": PROFESSION_COLUMN,
-    "trade of interest": PROFESSION_COLUMN,
-    "service branch": SERVICE_BRANCH_COLUMN,
-    "branch of service": SERVICE_BRANCH_COLUMN,
-    "service": SERVICE_BRANCH_COLUMN,
-    "create date": CREATE_DATE_COLUMN,
-    "create_date": CREATE_DATE_COLUMN,
-    "source": SOURCE_COLUMN,
-    "external source": SOURCE_COLUMN,
-    "external_source": SOURCE_COLUMN,
-    "external source code": SOURCE_CODE_COLUMN,
-    "external_source_code": SOURCE_CODE_COLUMN,
-}
-
+# Previous Combo columns read by the last-import filter (cutoff dates and keys).
+PREVIOUS_COMBO_COLUMNS = (
+    CREATE_DATE_COLUMN,
+    DATE_AVAILABLE_COLUMN,
+    "Date Available",
+    "Create Date",
+    SOURCE_COLUMN,
+    "Source",
+    EMAIL_COLUMN,
+    PHONE_COLUMN,
+    LAST_NAME_COLUMN,
+    FIRST_NAME_COLUMN,
+    ZIP_COLUMN,
+)
+# Rows per frame when a cancellable load streams a workbook before concatenating it
+# (CHECK_EVERY_ROWS when progress is reported).
+STREAM_READ_ROWS = 50_000
 
 def load_sources(
-    discovery: DiscoveryResult, config: Mapping[str, Any]
+    discovery: DiscoveryResult,
+    config: Mapping[str, Any],
+    cache: MutableMapping[tuple, pd.DataFrame] | None = None,
+    progress: ProgressCallback | None = None,
+    check: CancelCheck | None = None,
+    run_plan: RunPlan | None = None,
 ) -> Dict[str, pd.DataFrame]:
-    """Load source Excel files into DataFrames."""
+    """Load source Excel files into DataFrames.
+
+    When ``cache`` is given, normalized frames are kept in it keyed by file
+    path, size, and modification time, so long-running callers only re-read
+    files that changed. Entries for files not used by this call are dropped.
+    ``progress`` is called with the source rows read so far after each file,
+    and the total from the workbooks' recorded dimensions when all have one.
+    With a ``check`` callback, workbooks are streamed row by row (see
+    :func:`iter_source_chunks`) so a cancel is noticed mid-file, and
+    ``progress`` is then called every :data:`CHECK_EVERY_ROWS` rows; the
+    frames are the same as a ``read_excel`` load. Source codes, labels and cutoffs
+    come from ``run_plan`` (compiled from ``config`` when not given).
+    """
+    if run_plan is None:
+        run_plan = compile_plan(config)
     frames: Dict[str, pd.DataFrame] = {}
+    used_keys: set[tuple] = set()
+    total = expected_rows(discovery) if progress else None
+    done = 0
+
+    def advance(rows: int) -> None:
+        nonlocal done
+        done += rows
+        progress(done, total)
+
+    def read(
+        path: Path,
+        source_name: str,
+        code: str | None,
+        label: str | None,
+        add_source: bool = True,
+        on_rows: Callable[[int], None] | None = None,
+    ):
+        if cache is None:
+            return _read_and_normalize(path, source_name, code, label, add_source, check, on_rows)
+        key = (*_file_state(path), source_name, code, label, add_source)
+        used_keys.add(key)
+        if key not in cache:
+            cache[key] = _read_and_normalize(path, source_name, code, label, add_source, check, on_rows)
+        else:
+            logger.info("Reusing parsed %s from %s", source_name, path.name)
+        return cache[key].copy()
 
     if discovery.sources:
         for source_name, path in discovery.sources.items():
-            code = _lookup_source_code(source_name, config)
-            label = _lookup_source_label(source_name, config)
-            frames[source_name] = _read_and_normalize(path, source_name, code, label)
+            code = run_plan.source_codes.get(source_name)
+            label = run_plan.source_labels.get(source_name)
+            before = done
+            frames[source_name] = read(path, source_name, code, label, on_rows=advance if progress else None)
+            # Rows not reported while streaming (read_excel or cache hit) count once the file is read.
+            unreported = len(frames[source_name]) - (done - before)
+            if progress and unreported:
+                advance(unreported)
     else:
         logger.warning("No source files discovered; continuing with empty data.")
 
     if discovery.previous_combo:
-        frames["_previous_combo"] = _read_and_normalize(
-            discovery.previous_combo, "Previous Combo", None, None, add_source=False
-        )
-
-    frames = _filter_by_last_import(frames, config)
-    return frames
+        frames["_previous_combo"] = read(discovery.previous_combo, "Previous Combo", None, None, add_source=False)
 
+    if cache is not None:
+        for key in [k for k in cache if k not in used_keys]:
+            del cache[key]
 
-def _lookup_source_code(source_name: str, config: Mapping[str, Any]) -> str | None:
-    for entry in config.get("sources", []):
-        if entry.get("name") == source_name:
-            return entry.get("code")
-    return None
+    if check is not None:
+        check()
+    frames = _filter_by_last_import(frames, config, run_plan)
+    return frames
 
 
-def _lookup_source_label(source_name: str, config: Mapping[str, Any]) -> str | None:
-    for entry in config.get("sources", []):
-        if entry.get("name") == source_name:
-            return entry.get("output_label") or entry.get("label") or entry.get("name")
-    return None
+def expected_rows(discovery: DiscoveryResult) -> int | None:
+    """Source data rows from the workbooks' ``<dimension>`` elements; None when any is unknown."""
+    total = 0
+    for path in (discovery.sources or {}).values():
+        try:
+            rows = sheet_row_count(path)
+        except Exception:
+            return None
+        if rows is None:
+            return None
+        total += rows
+    return total
+
+
+def stream_sources(
+    discovery: DiscoveryResult,
+    config: Mapping[str, Any],
+    chunk_rows: int,
+    progress: ProgressCallback | None = None,
+    check: CancelCheck | None = None,
+    run_plan: RunPlan | None = None,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """Chunked counterpart of :func:`load_sources` for inputs larger than memory.
+
+    Yields ``(source_name, frame)`` chunks with the last-import filter already
+    applied. Only the columns the filter needs are kept from the previous Combo.
+    ``progress`` is called with the rows read so far (before filtering) per chunk;
+    ``check`` is passed on to :func:`iter_source_chunks`.
+    """
+    if run_plan is None:
+        run_plan = compile_plan(config)
+    previous_df = None
+    if discovery.previous_combo:
+        parts = [
+            chunk[[col for col in PREVIOUS_COMBO_COLUMNS if col in chunk.columns]]
+            for chunk in iter_source_chunks(
+                discovery.previous_combo, "Previous Combo", None, None, chunk_rows, False, check=check
+            )
+        ]
+        previous_df = pd.concat(parts) if parts else None
+    import_filter = build_import_filter(previous_df, config, run_plan)
+    del previous_df
+
+    if not discovery.sources:
+        logger.warning("No source files discovered; continuing with empty data.")
+    total = expected_rows(discovery) if progress else None
+    done = 0
+    for source_name, path in (discovery.sources or {}).items():
+        code = run_plan.source_codes.get(source_name)
+        label = run_plan.source_labels.get(source_name)
+        for chunk in iter_source_chunks(path, source_name, code, label, chunk_rows, check=check):
+            if progress:
+                done += len(chunk)
+                progress(done, total)
+            yield source_name, chunk if import_filter is None else import_filter.apply(source_name, chunk)
+
+
+def _file_state(path: Path) -> tuple:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), stat.st_size, stat.st_mtime_ns)
 
 
 def _read_and_normalize(
@@ -106,16 +193,134 @@ def _read_and_normalize(
     source_code: str | None,
     source_label: str | None,
     add_source: bool = True,
+    check: CancelCheck | None = None,
+    on_rows: Callable[[int], None] | None = None,
 ) -> pd.DataFrame:
     if not path.exists():
         logger.warning("Expected source file missing: %s", path)
         return _empty_df()
+    if check is not None:
+        # read_excel cannot be interrupted; the streaming reader checks between rows.
+        chunk_rows = STREAM_READ_ROWS if on_rows is None else CHECK_EVERY_ROWS
+        chunks = []
+        for chunk in iter_source_chunks(path, source_name, source_code, source_label, chunk_rows, add_source, check):
+            chunks.append(chunk)
+            if on_rows is not None:
+                on_rows(len(chunk))
+        return pd.concat(chunks) if chunks else _empty_df()
     try:
         df = pd.read_excel(path, dtype=str)
     except Exception as exc:  # pragma: no cover - safety
         logger.error("Failed to read %s: %s", path, exc)
         return _empty_df()
 
+    return _normalize_frame(df, source_name, source_code, source_label, add_source)
+
+
+def iter_source_chunks(
+    path: Path,
+    source_name: str,
+    source_code: str | None,
+    source_label: str | None,
+    chunk_rows: int,
+    add_source: bool = True,
+    check: CancelCheck | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream a source workbook as normalized frames of at most ``chunk_rows`` rows.
+
+    Cells are read with openpyxl in read-only mode and converted the way
+    ``read_excel(dtype=str)`` converts them, so each chunk matches the same
+    rows of a full :func:`load_sources` read. Chunk indexes continue across
+    chunks. ``check`` is called every :data:`CHECK_EVERY_ROWS` sheet rows.
+    """
+    if not path.exists():
+        logger.warning("Expected source file missing: %s", path)
+        return
+    import openpyxl
+
+    try:
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    except Exception as exc:  # pragma: no cover - safety
+        logger.error("Failed to read %s: %s", path, exc)
+        return
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = _chunk_header(next(rows, ()))
+        offset = 0
+        batch: list[list[Any]] = []
+        blank_run = 0
+        for position, row in enumerate(rows):
+            if check is not None and position % CHECK_EVERY_ROWS == 0:
+                check()
+            values = [_cell_text(value) for value in row[: len(header)]]
+            if all(value is None for value in values):
+                # read_excel drops trailing blank rows only, so hold blanks until a data row follows.
+                blank_run += 1
+                continue
+            batch.extend([] for _ in range(blank_run))
+            blank_run = 0
+            batch.append(values)
+            if len(batch) >= chunk_rows:
+                yield _chunk_frame(batch, header, offset, source_name, source_code, source_label, add_source)
+                offset += len(batch)
+                batch = []
+        if batch:
+            yield _chunk_frame(batch, header, offset, source_name, source_code, source_label, add_source)
+    finally:
+        workbook.close()
+
+
+def _chunk_header(values: tuple) -> list[str]:
+    header: list[str] = []
+    seen: Dict[str, int] = {}
+    for idx, value in enumerate(values):
+        name = f"Unnamed: {idx}" if value is None else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    while header and header[-1].startswith("Unnamed: "):
+        header.pop()
+    return header
+
+
+def _cell_text(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _chunk_frame(
+    batch: list[list[Any]],
+    header: list[str],
+    offset: int,
+    source_name: str,
+    source_code: str | None,
+    source_label: str | None,
+    add_source: bool,
+) -> pd.DataFrame:
+    for row in batch:
+        row.extend([None] * (len(header) - len(row)))
+    df = pd.DataFrame(batch, columns=header, dtype=object)
+    # Same as read_excel(dtype=str): cells as strings, and blank cells or pandas' default NA
+    # strings ("NA", "N/A", "null", ...) missing (astype alone turns None into "None" on pandas 2).
+    text = df.astype(str)
+    df = text.where(df.notna() & ~text.isin(STR_NA_VALUES))
+    df.index = pd.RangeIndex(offset, offset + len(df))
+    return _normalize_frame(df, source_name, source_code, source_label, add_source)
+
+
+def _normalize_frame(
+    df: pd.DataFrame,
+    source_name: str,
+    source_code: str | None,
+    source_label: str | None,
+    add_source: bool = True,
+) -> pd.DataFrame:
     df = _normalize_columns(df)
 
     # Add metadata columns
@@ -130,94 +335,102 @@ def _read_and_normalize(
 
 
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    renamed: Dict[str, str] = {}
-    for col in df.columns:
-        key = _normalize_token(col)
-        canonical = CANONICAL_COLUMN_MAP.get(key, col)
-        renamed[col] = canonical
+    renamed: Dict[str, str] = {col: canonical_column(col) for col in df.columns}
     return df.rename(columns=renamed)
 
 
-def _normalize_token(text: str) -> str:
-    return text.strip().lower().replace("-", " ").replace("_", " ")
-
-
 def _empty_df() -> pd.DataFrame:
     return pd.DataFrame()
 
 
 def _filter_by_last_import(
-    frames: Dict[str, pd.DataFrame], config: Mapping[str, Any]
+    frames: Dict[str, pd.DataFrame], config: Mapping[str, Any], run_plan: RunPlan
 ) -> Dict[str, pd.DataFrame]:
-    date_cfg = config.get("date_handling", {}) if isinstance(config, Mapping) else {}
-    strategy = str(date_cfg.get("last_import_strategy", "")).lower()
-    if not strategy:
+    import_filter = build_import_filter(frames.get("_previous_combo"), config, run_plan)
+    if import_filter is None:
         return frames
+    return {
+        name: df if name.startswith("_previous") else import_filter.apply(name, df) for name, df in frames.items()
+    }
+
+
+class ImportFilter:
+    """Last-import cutoffs and previous Combo keys, applied one source frame at a time."""
+
+    def __init__(
+        self,
+        cutoffs: Mapping[str, pd.Timestamp],
+        include_cutoff: bool,
+        labels_by_source: Mapping[str, str],
+        previous_keys: tuple[set, set, set] | None,
+    ) -> None:
+        self.cutoffs = dict(cutoffs)
+        self.include_cutoff = include_cutoff
+        self.labels_by_source = dict(labels_by_source)
+        self.previous_keys = previous_keys
+
+    def apply(self, source_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        label = self.labels_by_source.get(source_name)
+        cutoff = (
+            self.cutoffs.get(source_name)
+            or (self.cutoffs.get(label) if label else None)
+            or self.cutoffs.get("_all")
+        )
+        if cutoff is not None and CREATE_DATE_COLUMN in df.columns:
+            series = pd.to_datetime(df[CREATE_DATE_COLUMN], errors="coerce")
+            series_date = series.dt.date
+            cutoff_date = cutoff.date()
+            if self.include_cutoff:
+                mask = series_date.isna() | (series_date >= cutoff_date)
+            else:
+                mask = series_date.isna() | (series_date > cutoff_date)
+            dropped = (~mask).sum()
+            if dropped:
+                logger.info("Filtered %s rows from %s before %s", dropped, source_name, cutoff.date())
+            df = df.loc[mask].copy()
+
+        if self.previous_keys is not None:
+            df = _exclude_previous_keys(source_name, df, self.previous_keys)
+        return df
+
+
+def build_import_filter(
+    previous_df: pd.DataFrame | None, config: Mapping[str, Any], run_plan: RunPlan | None = None
+) -> ImportFilter | None:
+    """Resolve last-import cutoffs (and previous Combo keys) once for all source frames.
+
+    Configured cutoffs come already parsed from ``run_plan`` (compiled from
+    ``config`` when not given). Returns None when no filtering applies.
+    """
+    if run_plan is None:
+        run_plan = compile_plan(config)
+    strategy = run_plan.last_import_strategy
+    if not strategy:
+        return None
 
-    cutoff_by_source: Dict[str, Any] = {}
     if strategy == "from_config":
-        cutoff_by_source = date_cfg.get("last_import_date_by_source", {}) or {}
+        cutoffs: Mapping[str, pd.Timestamp] = run_plan.cutoffs
     elif strategy == "from_combo_file":
-        cutoff_by_source = _cutoffs_from_previous_combo(frames.get("_previous_combo"))
-        if not cutoff_by_source:
-            fallback = date_cfg.get("last_import_date_by_source", {}) or {}
-            if fallback:
-                logger.warning("Falling back to configured last_import_date_by_source.")
-                cutoff_by_source = fallback
+        cutoffs = _cutoffs_from_previous_combo(previous_df)
+        if not cutoffs and run_plan.cutoffs:
+            logger.warning("Falling back to configured last_import_date_by_source.")
+            cutoffs = run_plan.cutoffs
     else:
         logger.warning("Unknown last_import_strategy '%s'; skipping filter.", strategy)
-        return frames
+        return None
 
-    parsed_cutoffs = {}
-    for source, value in cutoff_by_source.items():
-        parsed = pd.to_datetime(value, errors="coerce")
-        if pd.isna(parsed):
-            logger.warning("Invalid last import date for %s: %s", source, value)
-            continue
-        parsed_cutoffs[source] = parsed
+    if not cutoffs:
+        return None
 
-    if not parsed_cutoffs:
-        return frames
-
-    default_cutoff = parsed_cutoffs.get("_all")
-
-    previous_df = frames.get("_previous_combo")
-    include_cutoff = date_cfg.get("include_cutoff_date")
+    include_cutoff = run_plan.include_cutoff
     if include_cutoff is None:
-        include_cutoff = previous_df is not None and date_cfg.get("exclude_previously_imported", True)
-
-    labels_by_source = {
-        entry.get("name"): entry.get("output_label") or entry.get("label") or entry.get("name")
-        for entry in config.get("sources", [])
-        if entry.get("name")
-    }
-
-    filtered: Dict[str, pd.DataFrame] = {}
-    for source_name, df in frames.items():
-        if source_name.startswith("_previous"):
-            filtered[source_name] = df
-            continue
-        label = labels_by_source.get(source_name)
-        cutoff = parsed_cutoffs.get(source_name) or (parsed_cutoffs.get(label) if label else None) or default_cutoff
-        if cutoff is None or CREATE_DATE_COLUMN not in df.columns:
-            filtered[source_name] = df
-            continue
-        series = pd.to_datetime(df[CREATE_DATE_COLUMN], errors="coerce")
-        series_date = series.dt.date
-        cutoff_date = cutoff.date()
-        if include_cutoff:
-            mask = series_date.isna() | (series_date >= cutoff_date)
-        else:
-            mask = series_date.isna() | (series_date > cutoff_date)
-        dropped = (~mask).sum()
-        if dropped:
-            logger.info("Filtered %s rows from %s before %s", dropped, source_name, cutoff.date())
-        filtered[source_name] = df.loc[mask].copy()
+        include_cutoff = previous_df is not None and run_plan.exclude_previously_imported
 
-    if date_cfg.get("exclude_previously_imported", True):
-        filtered = _filter_previously_imported(filtered)
+    previous_keys = None
+    if run_plan.exclude_previously_imported and previous_df is not None and not previous_df.empty:
+        previous_keys = _previous_keys(previous_df)
 
-    return filtered
+    return ImportFilter(cutoffs, bool(include_cutoff), run_plan.source_labels, previous_keys)
 
 
 def _cutoffs_from_previous_combo(previous_df: pd.DataFrame | None) -> Dict[str, Any]:
@@ -249,34 +462,27 @@ def _cutoffs_from_previous_combo(previous_df: pd.DataFrame | None) -> Dict[str,
     return {}
 
 
-def _filter_previously_imported(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
-    previous_df = frames.get("_previous_combo")
-    if previous_df is None or previous_df.empty:
-        return frames
-
+def _previous_keys(previous_df: pd.DataFrame) -> tuple[set, set, set]:
     prev_email = set(normalize_series(previous_df, EMAIL_COLUMN, lambda v: str(v).strip().lower()))
     prev_phone = set(normalize_series(previous_df, PHONE_COLUMN, digits_only))
     last = normalize_series(previous_df, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
     first = normalize_series(previous_df, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
     zip_code = normalize_series(previous_df, ZIP_COLUMN, lambda v: str(v).strip())
     prev_name_zip = set(combine_keys([last, first, zip_code]))
-
-    filtered: Dict[str, pd.DataFrame] = {"_previous_combo": previous_df}
-    for source_name, df in frames.items():
-        if source_name.startswith("_previous"):
-            continue
-        email = normalize_series(df, EMAIL_COLUMN, lambda v: str(v).strip().lower())
-        phone = normalize_series(df, PHONE_COLUMN, digits_only)
-        last = normalize_series(df, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
-        first = normalize_series(df, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
-        zip_code = normalize_series(df, ZIP_COLUMN, lambda v: str(v).strip())
-        name_zip = combine_keys([last, first, zip_code])
-
-        mask = (~email.isin(prev_email)) & (~phone.isin(prev_phone)) & (~name_zip.isin(prev_name_zip))
-        dropped = (~mask).sum()
-        if dropped:
-            logger.info("Excluded %s rows from %s already in previous combo", dropped, source_name)
-        filtered[source_name] = df.loc[mask].copy()
-
-    return filtered
-
+    return prev_email, prev_phone, prev_name_zip
+
+
+def _exclude_previous_keys(source_name: str, df: pd.DataFrame, previous_keys: tuple[set, set, set]) -> pd.DataFrame:
+    prev_email, prev_phone, prev_name_zip = previous_keys
+    email = normalize_series(df, EMAIL_COLUMN, lambda v: str(v).strip().lower())
+    phone = normalize_series(df, PHONE_COLUMN, digits_only)
+    last = normalize_series(df, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    first = normalize_series(df, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    zip_code = normalize_series(df, ZIP_COLUMN, lambda v: str(v).strip())
+    name_zip = combine_keys([last, first, zip_code])
+
+    mask = (~email.isin(prev_email)) & (~phone.isin(prev_phone)) & (~name_zip.isin(prev_name_zip))
+    dropped = (~mask).sum()
+    if dropped:
+        logger.info("Excluded %s rows from %s already in previous combo", dropped, source_name)
+    return df.loc[mask].copy()
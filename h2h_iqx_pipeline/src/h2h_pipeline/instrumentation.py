@@ -0,0 +1,305 @@
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
+
+import json
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+
+from .cancellation import CancelCheck, CancelToken, RunCancelled, StageBudgetExceeded, stage_budgets
+from .logging_config import log_context
+from .models import StageEvent
+
+try:  # pragma: no cover - not available on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+StageHook = Callable[[StageEvent], None]
+# Called by stages with (rows done, total rows or None); see StageSpan.progress.
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+SPANS_FILENAME = "pipeline_spans.jsonl"
+DEFAULT_PROGRESS_INTERVAL = 0.25
+
+# tracemalloc is process-wide: runs sharing a process (service jobs) share one trace,
+# which is stopped only when the last run that needed it closes and only if we started it.
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_started = False
+
+
+class StageSpan:
+    """Mutable handle for the stage being timed; set ``rows_out`` before it ends.
+
+    Set ``cached`` when the stage output was restored from a checkpoint, and
+    call :meth:`progress` while the stage works through its rows. Long loops
+    pass :attr:`cancel_check` down so the run's cancel token and the stage's
+    time budget are honoured between chunks.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rows_in: int | None,
+        reporter: Callable[..., None] | None = None,
+        cancel: CancelToken | None = None,
+        budget: float | None = None,
+    ) -> None:
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out: int | None = None
+        self.cached = False
+        self.started = time.perf_counter()
+        self.last_progress = 0.0
+        self.budget = budget
+        self._reporter = reporter
+        self._cancel = cancel
+
+    @property
+    def cancel_check(self) -> CancelCheck | None:
+        """:meth:`check` when a cancel token or time budget applies, else None."""
+        if self._cancel is None and self.budget is None:
+            return None
+        return self.check
+
+    def check(self) -> None:
+        """Raise :class:`RunCancelled` if the run was cancelled or the budget is spent."""
+        if self._cancel is not None and self._cancel.cancelled:
+            raise RunCancelled(self._cancel.reason, self.name)
+        if self.budget is not None and time.perf_counter() - self.started > self.budget:
+            raise StageBudgetExceeded(f"{self.name} exceeded its {self.budget:g}s time budget", self.name)
+
+    def progress(self, rows_done: int, rows_total: int | None = None) -> None:
+        """Report rows processed so far; events are throttled by the instrumentation."""
+        if self._reporter is not None:
+            self._reporter(self, rows_done, rows_total)
+
+
+class Instrumentation:
+    """Fires start/end events for each pipeline stage to registered hooks.
+
+    End events carry wall time, CPU time, row counts, the process peak RSS,
+    and (when ``trace_memory`` is on) tracemalloc current/peak deltas.
+    Progress events go to the separate ``progress_hooks``, at most once per
+    ``progress_interval`` seconds per stage plus a final one when
+    ``rows_done`` reaches the total, so hooks feeding a UI never receive more
+    than it can draw.
+
+    ``cancel`` and ``budgets`` (seconds per stage name) are handed to each
+    :class:`StageSpan`; a cancelled token also stops the next stage from
+    starting. Records logged inside a stage carry its name and ``rows_in``
+    (see :func:`~h2h_pipeline.logging_config.log_context`), and each stage
+    logs one line with its wall time and row counts when it ends.
+
+    Call :meth:`close` when the run ends so tracemalloc is stopped again if
+    this run started it. The traced peak is process-wide, so it is reset per
+    stage only while no other instrumentation in the process is tracing;
+    with overlapping service jobs ``traced_peak_kb`` also counts the other
+    jobs' allocations and is an upper bound.
+    """
+
+    def __init__(
+        self,
+        hooks: Iterable[StageHook] = (),
+        run_id: str | None = None,
+        trace_memory: bool = False,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        progress_hooks: Iterable[StageHook] = (),
+        cancel: CancelToken | None = None,
+        budgets: Mapping[str, float] | None = None,
+    ) -> None:
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.cancel = cancel
+        self.budgets = dict(budgets or {})
+        self.trace_memory = trace_memory
+        self.progress_interval = progress_interval
+        self.spans: List[StageEvent] = []
+        self._hooks: List[StageHook] = list(hooks)
+        self._progress_hooks: List[StageHook] = list(progress_hooks)
+        self._tracing = False
+
+    def add_hook(self, hook: StageHook) -> None:
+        self._hooks.append(hook)
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int | None = None) -> Iterator[StageSpan]:
+        if self.cancel is not None and self.cancel.cancelled:
+            raise RunCancelled(self.cancel.reason, name)
+        span = StageSpan(name, rows_in, self._progress, self.cancel, self.budgets.get(name))
+        if self.trace_memory:
+            if self._start_tracing():
+                tracemalloc.reset_peak()
+            traced_start = tracemalloc.get_traced_memory()[0]
+        self._emit(
+            self._hooks,
+            StageEvent(run_id=self.run_id, stage=name, phase="start", timestamp=time.time(), rows_in=rows_in),
+        )
+
+        wall_start = span.started = time.perf_counter()
+        cpu_start = time.process_time()
+        error: str | None = None
+        try:
+            with log_context(stage=name, rows_in=rows_in):
+                yield span
+        except BaseException as exc:
+            error = f"{exc.__class__.__name__}: {exc}"
+            raise
+        finally:
+            event = StageEvent(
+                run_id=self.run_id,
+                stage=name,
+                phase="end",
+                timestamp=time.time(),
+                wall_seconds=time.perf_counter() - wall_start,
+                cpu_seconds=time.process_time() - cpu_start,
+                rows_in=span.rows_in,
+                rows_out=span.rows_out,
+                peak_rss_kb=peak_rss_kb(),
+                cached=span.cached,
+                error=error,
+            )
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                event.traced_delta_kb = (current - traced_start) / 1024
+                event.traced_peak_kb = (peak - traced_start) / 1024
+            self.spans.append(event)
+            logger.info(
+                "Stage %s %s in %.2fs",
+                name,
+                "failed" if error else "finished",
+                event.wall_seconds,
+                extra={"stage": name, "rows_in": span.rows_in, "rows_out": span.rows_out},
+            )
+            self._emit(self._hooks, event)
+
+    def close(self) -> None:
+        """Stop tracemalloc if this was the last run tracing and tracing was started here."""
+        global _tracing_users, _tracing_started
+        if not self._tracing:
+            return
+        self._tracing = False
+        with _tracing_lock:
+            _tracing_users -= 1
+            if _tracing_users == 0 and _tracing_started:
+                _tracing_started = False
+                tracemalloc.stop()
+
+    def _start_tracing(self) -> bool:
+        """Make sure tracemalloc is on for this run; True if no other run is tracing."""
+        global _tracing_users, _tracing_started
+        with _tracing_lock:
+            if not self._tracing:
+                self._tracing = True
+                _tracing_users += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracing_started = True
+            return _tracing_users == 1
+
+    def _progress(self, span: StageSpan, rows_done: int, rows_total: int | None) -> None:
+        if not self._progress_hooks:
+            return
+        now = time.perf_counter()
+        final = rows_total is not None and rows_done >= rows_total
+        if not final and now - span.last_progress < self.progress_interval:
+            return
+        span.last_progress = now
+        elapsed = now - span.started
+        self._emit(
+            self._progress_hooks,
+            StageEvent(
+                run_id=self.run_id,
+                stage=span.name,
+                phase="progress",
+                timestamp=time.time(),
+                wall_seconds=elapsed,
+                rows_in=span.rows_in,
+                rows_done=rows_done,
+                rows_total=rows_total,
+                rows_per_second=rows_done / elapsed if elapsed > 0 else None,
+            ),
+        )
+
+    def _emit(self, hooks: List[StageHook], event: StageEvent) -> None:
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as exc:  # pragma: no cover - hooks must not break a run
+                logger.warning("Stage hook %r failed: %s", hook, exc)
+
+
+class JsonlSpanExporter:
+    """Stage hook that appends end events as JSON lines."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, event: StageEvent) -> None:
+        if event.phase != "end":
+            return
+        line = json.dumps(asdict(event), sort_keys=True)
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+
+def build_instrumentation(
+    config: Mapping[str, Any],
+    log_file: Path,
+    hooks: Iterable[StageHook] | None = None,
+    progress_hooks: Iterable[StageHook] | None = None,
+    cancel: CancelToken | None = None,
+) -> Instrumentation:
+    """Create the run's instrumentation with the configured built-in exporter and stage budgets."""
+    inst_cfg = config.get("instrumentation", {}) if isinstance(config, Mapping) else {}
+    instrumentation = Instrumentation(
+        hooks or (),
+        trace_memory=bool(inst_cfg.get("trace_memory", False)),
+        progress_interval=float(inst_cfg.get("progress_interval", DEFAULT_PROGRESS_INTERVAL)),
+        progress_hooks=progress_hooks or (),
+        cancel=cancel,
+        budgets=stage_budgets(config),
+    )
+    if inst_cfg.get("spans_file", True):
+        instrumentation.add_hook(JsonlSpanExporter(Path(log_file).parent / SPANS_FILENAME))
+    return instrumentation
+
+
+def format_progress(event: StageEvent) -> str:
+    """One-line description of a stage or progress event for the GUIs."""
+    stage = event.stage.capitalize()
+    if event.phase == "start":
+        return f"{stage}..."
+    if event.phase == "end":
+        rows = f", {event.rows_out:,} rows" if event.rows_out is not None else ""
+        return f"{stage} done in {event.wall_seconds:.1f}s{rows}"
+    done = event.rows_done or 0
+    rows = f"{done:,} / {event.rows_total:,} rows" if event.rows_total else f"{done:,} rows"
+    rate = f" ({event.rows_per_second:,.0f} rows/s)" if event.rows_per_second else ""
+    return f"{stage}: {rows}{rate}"
+
+
+def progress_fraction(event: StageEvent) -> float | None:
+    """Share of the stage completed, when the event knows its total."""
+    if event.phase == "end":
+        return 1.0
+    if event.phase != "progress" or not event.rows_total:
+        return None
+    return min(1.0, (event.rows_done or 0) / event.rows_total)
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak / 1024) if sys.platform == "darwin" else int(peak)
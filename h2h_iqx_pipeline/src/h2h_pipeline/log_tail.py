@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+import os
+import threading
+
+# pipeline.log is appended to forever, so nothing here reads the whole file:
+# the tail is found by seeking back from the end, and the follower reads only
+# the bytes written since its last call.
+
+# Bytes read per step when seeking back for the tail; a block holds a few
+# hundred typical log lines.
+TAIL_BLOCK_SIZE = 64 * 1024
+# How often follow_log checks the file for new lines.
+FOLLOW_INTERVAL = 0.5
+
+LineCallback = Callable[[str], None]
+
+
+def tail_lines(path: Path, limit: int = 200, block_size: int = TAIL_BLOCK_SIZE) -> list[str]:
+    """Return the last ``limit`` lines of ``path`` (``[]`` if it does not exist).
+
+    Reads backwards from the end in ``block_size`` steps until enough line
+    breaks are found, so the cost depends on ``limit``, not on the file size.
+    """
+    if limit <= 0:
+        return []
+    try:
+        with Path(path).open("rb") as handle:
+            position = handle.seek(0, os.SEEK_END)
+            blocks: list[bytes] = []
+            newlines = 0
+            # One more break than lines wanted, so the first kept line is whole.
+            while position > 0 and newlines <= limit:
+                step = min(block_size, position)
+                position -= step
+                handle.seek(position)
+                block = handle.read(step)
+                blocks.append(block)
+                newlines += block.count(b"\n")
+    except FileNotFoundError:
+        return []
+    data = b"".join(reversed(blocks))
+    return data.decode("utf-8", errors="replace").splitlines()[-limit:]
+
+
+def _identity(stat: os.stat_result) -> tuple[int, int]:
+    return (stat.st_dev, stat.st_ino)
+
+
+class LogFollower:
+    """Return the lines appended to a log file since the previous call.
+
+    The follower keeps a byte offset and the file's identity instead of an
+    open handle, so it never blocks a ``RotatingFileHandler`` from renaming
+    the file on Windows. When the file is replaced (rotated) the rest of the
+    old file is read from ``<name>.1`` if it is still there, then the new
+    file from its start; a truncated file is re-read from its start. A line
+    without its trailing newline yet is held back until it is complete.
+    """
+
+    def __init__(self, path: Path, from_end: bool = True) -> None:
+        self.path = Path(path)
+        self._offset = 0
+        self._identity: tuple[int, int] | None = None
+        self._partial = b""
+        stat = self._stat(self.path)
+        if stat is not None:
+            self._identity = _identity(stat)
+            self._offset = stat.st_size if from_end else 0
+
+    def read_new(self) -> list[str]:
+        chunks = [self._partial]
+        stat = self._stat(self.path)
+        identity = _identity(stat) if stat is not None else None
+        if self._identity is not None and identity != self._identity:
+            chunks.append(self._read_rotated())
+            self._offset = 0
+        elif stat is not None and stat.st_size < self._offset:
+            chunks = [b""]
+            self._offset = 0
+        self._identity = identity
+        if stat is not None:
+            new = self._read_from(self.path, self._offset)
+            self._offset += len(new)
+            chunks.append(new)
+
+        lines = b"".join(chunks).split(b"\n")
+        self._partial = lines.pop()
+        return [line.rstrip(b"\r").decode("utf-8", errors="replace") for line in lines]
+
+    def _read_rotated(self) -> bytes:
+        rotated = self.path.with_name(self.path.name + ".1")
+        stat = self._stat(rotated)
+        if stat is None or _identity(stat) != self._identity:
+            return b""
+        return self._read_from(rotated, self._offset)
+
+    @staticmethod
+    def _stat(path: Path) -> os.stat_result | None:
+        try:
+            return path.stat()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_from(path: Path, offset: int) -> bytes:
+        try:
+            with path.open("rb") as handle:
+                handle.seek(offset)
+                return handle.read()
+        except OSError:
+            return b""
+
+
+@contextmanager
+def follow_log(path: Path, on_line: LineCallback, interval: float = FOLLOW_INTERVAL) -> Iterator[LogFollower]:
+    """Pass lines appended to ``path`` inside the block to ``on_line`` as they arrive.
+
+    A background thread polls a :class:`LogFollower` every ``interval``
+    seconds; lines still unread when the block exits are delivered before
+    ``follow_log`` returns.
+    """
+    follower = LogFollower(path)
+    stop = threading.Event()
+
+    def deliver() -> None:
+        for line in follower.read_new():
+            on_line(line)
+
+    def loop() -> None:
+        while not stop.wait(interval):
+            deliver()
+
+    thread = threading.Thread(target=loop, name="log-follower", daemon=True)
+    thread.start()
+    try:
+        yield follower
+    finally:
+        stop.set()
+        thread.join()
+        deliver()
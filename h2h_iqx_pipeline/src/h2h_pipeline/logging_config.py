@@ -1,12 +1,133 @@
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Dict, Iterator, Mapping
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+# Record attributes copied into JSON lines when a stage or caller sets them.
+ROW_FIELDS = ("rows_in", "rows_out", "rows_done")
+
+# Fields of the run and stage the current thread is working on; see log_context.
+_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("h2h_log_context", default={})
+# Background writers by normalized log file path.
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Attach ``fields`` (``run_id``, ``stage``, row counts...) to records logged inside the block.
+
+    The fields belong to the calling thread (a ``contextvars`` context), so
+    concurrent runs in one process keep their own. ``run_started`` (a
+    ``time.perf_counter()`` value) makes records carry the run's ``elapsed``
+    seconds.
+    """
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class RunContextFilter(logging.Filter):
+    """Copy the current :func:`log_context` fields onto each record (never drops one)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        fields = _context.get()
+        for key, value in fields.items():
+            if key != "run_started" and not hasattr(record, key):
+                setattr(record, key, value)
+        started = fields.get("run_started")
+        if started is not None and not hasattr(record, "elapsed"):
+            record.elapsed = round(time.perf_counter() - started, 3)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, and the run fields that are set."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("run_id", "stage", "elapsed", *ROW_FIELDS):
+            value = getattr(record, key, None)
+            if value is not None:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class _PipelineQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a background listener; only ``%`` args are merged on the caller's thread."""
+
+    def __init__(self, log_queue: "queue.Queue[Any]", log_file: str) -> None:
+        super().__init__(log_queue)
+        self.log_file = log_file
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the whole line here; leave that to the listener's
+        # handlers and only freeze what may change after the call (args, the traceback).
+        return _frozen(record)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Passes each record, as a plain dict, to the process that writes ``pipeline.log``."""
+
+    def __init__(self, send: Callable[[Dict[str, Any]], None]) -> None:
+        super().__init__()
+        self._send = send
+        self.addFilter(RunContextFilter())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._send(dict(_frozen(record).__dict__))
+        except Exception:  # pragma: no cover - parent went away or the record cannot be pickled
+            self.handleError(record)
+
+
+class ForwardedRecordListener(logging.handlers.QueueListener):
+    """Writes the records worker processes put on ``log_queue`` (see :func:`forward_records`)."""
+
+    def __init__(self, log_queue: Any) -> None:
+        super().__init__(log_queue)
+
+    def handle(self, record: Any) -> None:
+        handle_forwarded(record)
 
 
 def configure_logging(config: Mapping[str, Any]) -> Path:
-    """Configure console + file logging using settings from config."""
+    """Configure console + file logging using settings from config.
+
+    ``logging.max_bytes`` and ``logging.backup_count`` rotate ``pipeline.log``
+    to ``pipeline.log.1``... (``max_bytes: 0`` keeps one growing file), and
+    ``logging.format: json`` writes it as JSON lines. With
+    ``logging.background`` (the default) records are queued and formatted
+    and written by a listener thread, so stages never wait on disk or the
+    console; call :func:`flush_logging` before reading the file. In a
+    process set up with :func:`forward_records` no handlers are added: its
+    parent writes (and rotates) the file.
+    """
     paths = config.get("paths", {}) if isinstance(config, Mapping) else {}
+    log_cfg = config.get("logging", {}) if isinstance(config, Mapping) else {}
     log_dir = Path(paths.get("log_dir", "logs"))
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "pipeline.log"
@@ -16,26 +137,43 @@ def configure_logging(config: Mapping[str, Any]) -> Path:
     if root_logger.level == logging.NOTSET or root_logger.level > logging.INFO:
         root_logger.setLevel(logging.INFO)
 
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-
-    if not had_handlers:
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        root_logger.addHandler(stream_handler)
+    formatter = logging.Formatter(LOG_FORMAT)
+    log_format = str(log_cfg.get("format") or "text").lower()
+    if log_format not in ("text", "json"):
+        raise ValueError(f"logging.format must be 'text' or 'json', got {log_format!r}")
 
     log_file_normalized = os.path.normcase(os.path.abspath(str(log_file)))
-    has_file_handler = False
-    for handler in root_logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            base = getattr(handler, "baseFilename", None)
-            if base and os.path.normcase(os.path.abspath(str(base))) == log_file_normalized:
-                has_file_handler = True
-                break
+    if not _has_file_handler(root_logger, log_file_normalized):
+        handlers: list[logging.Handler] = []
+        if not had_handlers:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            handlers.append(stream_handler)
 
-    if not has_file_handler:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        max_bytes = int(log_cfg.get("max_bytes", DEFAULT_MAX_BYTES) or 0)
+        if max_bytes > 0:
+            backup_count = int(log_cfg.get("backup_count", DEFAULT_BACKUP_COUNT))
+            file_handler: logging.Handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+        else:
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter() if log_format == "json" else formatter)
+        handlers.append(file_handler)
+
+        if log_cfg.get("background", True):
+            log_queue: "queue.Queue[Any]" = queue.Queue()
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            queue_handler = _PipelineQueueHandler(log_queue, log_file_normalized)
+            queue_handler.addFilter(RunContextFilter())
+            with _listeners_lock:
+                _listeners[log_file_normalized] = listener
+            listener.start()
+            root_logger.addHandler(queue_handler)
+        else:
+            for handler in handlers:
+                handler.addFilter(RunContextFilter())
+                root_logger.addHandler(handler)
 
     # Quiet noisy libraries unless debugging
     logging.getLogger("openpyxl").setLevel(logging.WARNING)
@@ -43,3 +181,91 @@ def configure_logging(config: Mapping[str, Any]) -> Path:
 
     logging.getLogger(__name__).info("Logging initialized. Writing to %s", log_file)
     return log_file
+
+
+def forward_records(send: Callable[[Dict[str, Any]], None]) -> None:
+    """Send this process's log records to its parent instead of writing ``pipeline.log`` here.
+
+    For worker processes (batch pool workers, the GUIs' pipeline processes):
+    the root handlers, including any inherited through ``fork``, are replaced
+    by one that passes each record to ``send`` as a picklable dict, and
+    :func:`configure_logging` then leaves the file alone. The parent hands
+    what it receives to :func:`handle_forwarded` (or a
+    :class:`ForwardedRecordListener`), so a single process writes and rotates
+    the file.
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(_ForwardingHandler(send))
+
+
+def handle_forwarded(payload: Mapping[str, Any]) -> logging.LogRecord:
+    """Log a record a worker sent with :func:`forward_records` through this process's handlers."""
+    record = logging.makeLogRecord(dict(payload))
+    logging.getLogger(record.name).handle(record)
+    return record
+
+
+def flush_logging() -> None:
+    """Block until every record queued so far has been written by the background listeners."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+    for listener in listeners:
+        listener.queue.join()
+
+
+def shutdown_logging() -> None:
+    """Write what is queued and stop the background listeners (run at interpreter exit)."""
+    with _listeners_lock:
+        listeners = list(_listeners.items())
+        _listeners.clear()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, _PipelineQueueHandler):
+            root_logger.removeHandler(handler)
+    for _path, listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _frozen(record: logging.LogRecord) -> logging.LogRecord:
+    # A copy with the message merged and the traceback as text, safe to queue or pickle.
+    record = logging.makeLogRecord(record.__dict__)
+    record.msg = record.getMessage()
+    record.args = None
+    if record.exc_info:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+    return record
+
+
+def _has_file_handler(root_logger: logging.Logger, log_file_normalized: str) -> bool:
+    for handler in root_logger.handlers:
+        if isinstance(handler, _ForwardingHandler):
+            return True  # the parent process writes the file
+        if isinstance(handler, _PipelineQueueHandler) and handler.log_file == log_file_normalized:
+            return True
+        if isinstance(handler, logging.FileHandler):
+            base = getattr(handler, "baseFilename", None)
+            if base and os.path.normcase(os.path.abspath(str(base))) == log_file_normalized:
+                return True
+    return False
+
+
+def _forget_listeners_after_fork() -> None:
+    # A forked child (batch's process pool) has the queue handlers but not the
+    # listener threads; drop both so its run configures logging afresh.
+    global _listeners_lock
+    _listeners_lock = threading.Lock()
+    _listeners.clear()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, _PipelineQueueHandler):
+            root_logger.removeHandler(handler)
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_listeners_after_fork)
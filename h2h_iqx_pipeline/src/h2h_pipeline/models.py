@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Mapping, Optional, Set, List
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
-import pandas as pd
+if TYPE_CHECKING:  # pragma: no cover - pandas is only needed for annotations
+    import pandas as pd
 
 
 @dataclass
@@ -44,3 +47,232 @@ class DedupResult:
     cleaned_df: pd.DataFrame
     duplicates_df: pd.DataFrame
     stats: Dict[str, int] | None = None
+
+
+@dataclass
+class DedupPlan:
+    """Duplicate clusters over rows in priority order, by row position."""
+
+    kept: List[int] = field(default_factory=list)
+    duplicates: List[int] = field(default_factory=list)
+    cluster_of: Dict[int, int] = field(default_factory=dict)
+    kept_of: Dict[int, int] = field(default_factory=dict)
+    matched_on: List[str] = field(default_factory=list)
+    sources: Dict[int, Set[str]] = field(default_factory=dict)
+
+
+@dataclass
+class DeltaResult:
+    """Rows added, removed, and changed relative to a baseline run."""
+
+    added_df: pd.DataFrame
+    removed_df: pd.DataFrame
+    changed_df: pd.DataFrame
+    baseline: str
+    unchanged: int = 0
+
+
+@dataclass
+class SqliteLoadStats:
+    """Timing for a bulk load into the SQLite staging database."""
+
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+@dataclass
+class UploadResult:
+    """Outcome and timings of a bulk import upload."""
+
+    url: str
+    parts_total: int = 0
+    parts_uploaded: int = 0
+    parts_resumed: int = 0
+    failed_parts: List[int] = field(default_factory=list)
+    rows: int = 0
+    bytes_sent: int = 0
+    seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    def latency_percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_sent / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class ExportResult(Mapping[str, Path]):
+    """Output paths written by export, keyed by sink label.
+
+    Behaves like a read-only mapping of sink label to path so callers can
+    keep treating it as the plain ``export_paths`` dict. ``previews`` maps
+    ``"combo"`` and ``"dedup"`` to the Arrow snapshots the GUI preview reads.
+    """
+
+    paths: Dict[str, Path] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    previews: Dict[str, Path] = field(default_factory=dict)
+    sqlite: Optional[SqliteLoadStats] = None
+
+    def __getitem__(self, key: str) -> Path:
+        return self.paths[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+@dataclass
+class StageEvent:
+    """Start, progress, or end event for one pipeline stage.
+
+    Progress events carry ``rows_done``, ``rows_total`` (when known), and the
+    stage's ``rows_per_second`` so far; ``wall_seconds`` is the time elapsed.
+    """
+
+    run_id: str
+    stage: str
+    phase: str
+    timestamp: float
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    peak_rss_kb: Optional[int] = None
+    traced_delta_kb: Optional[float] = None
+    traced_peak_kb: Optional[float] = None
+    cached: bool = False
+    error: Optional[str] = None
+    rows_done: Optional[int] = None
+    rows_total: Optional[int] = None
+    rows_per_second: Optional[float] = None
+
+
+@dataclass
+class RunResult:
+    """Summary returned by run_pipeline."""
+
+    run_id: str
+    run_label: str
+    export_paths: Mapping[str, Path]
+    report_path: Path
+    spans: List[StageEvent] = field(default_factory=list)
+
+
+@dataclass
+class WarmupResult:
+    """What the GUI warm-up prepared before the first run, and how long it took."""
+
+    seconds: float = 0.0
+    import_seconds: float = 0.0
+    config_path: Optional[Path] = None
+    mappings: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchMonthResult:
+    """Outcome of one month in a batch run."""
+
+    month: str
+    depends_on: Optional[str] = None
+    run_label: Optional[str] = None
+    seconds: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    rows_out: Optional[int] = None
+    combo_path: Optional[Path] = None
+    report_path: Optional[Path] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SourcePreview:
+    """Header-only view of one source file for a dry run."""
+
+    name: str
+    path: Path
+    rows: Optional[int]
+    columns: List[str] = field(default_factory=list)
+    unrecognized_columns: List[str] = field(default_factory=list)
+    row_count_basis: str = "dimension"
+    error: Optional[str] = None
+
+
+@dataclass
+class StageEstimate:
+    """Expected duration of one stage, derived from recorded spans."""
+
+    stage: str
+    rows: Optional[int]
+    seconds: Optional[float]
+    basis: str
+
+
+@dataclass
+class DryRunReport:
+    """What a run would read and how long it is expected to take."""
+
+    discovery: DiscoveryResult
+    sources: List[SourcePreview] = field(default_factory=list)
+    previous_combo_rows: Optional[int] = None
+    sample_rows: int = 0
+    validation: ValidationReport = field(default_factory=ValidationReport)
+    estimates: List[StageEstimate] = field(default_factory=list)
+    history_runs: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def source_rows(self) -> int:
+        return sum(source.rows or 0 for source in self.sources)
+
+    @property
+    def estimated_seconds(self) -> Optional[float]:
+        if not self.estimates or any(e.seconds is None for e in self.estimates):
+            return None
+        return sum(e.seconds or 0.0 for e in self.estimates)
+
+
+@dataclass(frozen=True, slots=True)
+class SourceSpec:
+    """One ``sources`` entry as the stages use it."""
+
+    name: str
+    code: Optional[str]
+    label: str
+
+
+@dataclass(frozen=True, slots=True)
+class RunPlan:
+    """The config compiled once per run for the stages (see :func:`~h2h_pipeline.config_loader.compile_plan`).
+
+    Source lookups are indexed by name, mapping files are already parsed and
+    last-import cutoffs already converted, so no stage rescans ``sources`` or
+    re-reads a mapping file. All mappings are read-only views.
+    """
+
+    sources: Tuple[SourceSpec, ...]
+    source_codes: Mapping[str, Optional[str]]
+    source_labels: Mapping[str, str]
+    mappings: Mapping[str, Mapping[str, Any]]
+    priority: Mapping[str, int]
+    last_import_strategy: str
+    cutoffs: Mapping[str, pd.Timestamp]
+    include_cutoff: Optional[bool]
+    exclude_previously_imported: bool
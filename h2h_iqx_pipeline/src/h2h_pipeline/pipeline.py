@@ -1,58 +1,213 @@
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping, MutableMapping
+
+import logging
+import time
 
 import pandas as pd
 
-from . import dedup, export, file_discovery, ingestion, qa, transform
+from . import checkpoint, chunked, dedup, delta, export, file_discovery, ingestion, qa, transform, upload
+from .cancellation import CancelToken, RunCancelled
+from .checkpoint import CheckpointStore, MemoryCheckpointStore
+from .config_loader import compile_plan
 from .constants import CREATE_DATE_COLUMN, SOURCE_COLUMN
-from .logging_config import configure_logging
+from .instrumentation import StageHook, build_instrumentation
+from .logging_config import configure_logging, flush_logging, log_context
+from .models import RunResult
 from .utils.dates import resolve_run_date_value
 
-
-def run_pipeline(month: str, input_root: Path, config: Mapping[str, Any]) -> None:
-    """Top-level orchestration of the H2H to IQX pipeline."""
-
-    configure_logging(config)
-
-    # 1. Discover files and paths
-    discovery = file_discovery.discover_month_files(
-        month=month,
-        input_root=input_root,
-        config=config,
-    )
-
-    # 2. Ingest source Excel and existing Combo
-    raw_data = ingestion.load_sources(discovery, config=config)
-
-    run_label = _resolve_run_label(month, raw_data, config)
-
-    # 3. Transform and standardize into "Combo All Lists" equivalent
-    transform_result = transform.build_combo(month=month, raw_data=raw_data, config=config)
-    combo_df = transform_result.combo_df
-
-    # 4. De-duplicate and create "Combo Dups Removed"
-    dedup_result = dedup.remove_duplicates(combo_df, config=config)
-
-    # 5. Export Excel + CSV for IQX
-    export_paths = export.write_outputs(
-        run_label=run_label,
-        combo_df=combo_df,
-        dedup_df=dedup_result.cleaned_df,
-        config=config,
-    )
-
-    # 6. Generate QA summary report
-    qa.generate_report(
-        run_label=run_label,
-        combo_df=combo_df,
-        dedup_result=dedup_result,
-        export_paths=export_paths,
-        validation=transform_result.validation,
-        discovery=discovery,
-        counts_before=_counts_by_source(combo_df),
-        counts_after=_counts_by_source(dedup_result.cleaned_df),
-        config=config,
-    )
+logger = logging.getLogger(__name__)
+
+
+def run_pipeline(
+    month: str,
+    input_root: Path,
+    config: Mapping[str, Any],
+    hooks: Iterable[StageHook] | None = None,
+    checkpoints: CheckpointStore | MemoryCheckpointStore | None = None,
+    frame_cache: MutableMapping[tuple, pd.DataFrame] | None = None,
+    progress_hooks: Iterable[StageHook] | None = None,
+    cancel: CancelToken | None = None,
+) -> RunResult:
+    """Top-level orchestration of the H2H to IQX pipeline.
+
+    ``hooks`` receive a start and end :class:`StageEvent` for every stage;
+    ``progress_hooks`` receive throttled ``progress`` events (rows done, total
+    when known, rows per second) while a stage runs.
+    When a checkpoint store is given (or ``checkpoints.enabled`` is set),
+    ingestion, transform, and dedup resume from saved outputs whose input
+    keys are unchanged. ``frame_cache`` keeps parsed source files between
+    calls so only changed files are re-read. With ``execution.mode: chunked``
+    the stages after discovery stream rows in bounded chunks instead (see
+    :mod:`h2h_pipeline.chunked`); checkpoints and the frame cache are unused.
+
+    Setting ``cancel`` from another thread stops the run at the next check
+    inside a stage (well under a second, even mid-workbook), and a stage that
+    outlives its ``execution.stage_budgets`` entry is stopped the same way.
+    Either way a partial QA report is written and :class:`RunCancelled` (or
+    :class:`StageBudgetExceeded`) is raised with ``report_path`` set.
+    """
+
+    log_file = configure_logging(config)
+    instrumentation = build_instrumentation(config, log_file, hooks, progress_hooks, cancel)
+    stage = instrumentation.stage
+    store = checkpoints if checkpoints is not None else checkpoint.store_from_config(config, month)
+    discovery = None
+    run_label = resolve_run_date_value(config) or month
+    export_paths = None
+
+    # Records logged during the run carry its id and elapsed time (JSON log lines show them).
+    with log_context(run_id=instrumentation.run_id, run_started=time.perf_counter()):
+        try:
+            # Sources, mapping files and cutoffs are looked up and parsed once for all stages.
+            run_plan = compile_plan(config)
+
+            # 1. Discover files and paths
+            with stage("discovery"):
+                discovery = file_discovery.discover_month_files(
+                    month=month,
+                    input_root=input_root,
+                    config=config,
+                )
+
+            if chunked.enabled(config):
+                run_label, export_paths, report_path = chunked.run_stages(month, discovery, config, stage, run_plan)
+                return RunResult(
+                    run_id=instrumentation.run_id,
+                    run_label=run_label,
+                    export_paths=export_paths,
+                    report_path=report_path,
+                    spans=list(instrumentation.spans),
+                )
+
+            # 2. Ingest source Excel and existing Combo
+            with stage("ingestion") as span:
+                ingestion_key = checkpoint.ingestion_key(month, discovery, config)
+                cached = store.load("ingestion", ingestion_key) if store else None
+                if cached is not None:
+                    raw_data = cached.frames
+                    span.cached = True
+                else:
+                    raw_data = ingestion.load_sources(
+                        discovery,
+                        config=config,
+                        cache=frame_cache,
+                        progress=span.progress,
+                        check=span.cancel_check,
+                        run_plan=run_plan,
+                    )
+                    if store:
+                        store.save("ingestion", ingestion_key, raw_data)
+                span.rows_out = _source_rows(raw_data)
+
+            run_label = _resolve_run_label(month, raw_data, config)
+
+            # 3. Transform and standardize into "Combo All Lists" equivalent
+            with stage("transform", rows_in=_source_rows(raw_data)) as span:
+                transform_key = checkpoint.transform_key(ingestion_key, month, config)
+                cached = store.load("transform", transform_key) if store else None
+                if cached is not None:
+                    transform_result = checkpoint.decode_transform(cached)
+                    span.cached = True
+                else:
+                    transform_result = transform.build_combo(
+                        month=month,
+                        raw_data=raw_data,
+                        config=config,
+                        check=span.cancel_check,
+                        run_plan=run_plan,
+                        progress=span.progress,
+                    )
+                    if store:
+                        store.save("transform", transform_key, *checkpoint.encode_transform(transform_result))
+                combo_df = transform_result.combo_df
+                span.rows_out = len(combo_df)
+
+            # 4. De-duplicate and create "Combo Dups Removed"
+            with stage("dedup", rows_in=len(combo_df)) as span:
+                dedup_key = checkpoint.dedup_key(transform_key, config)
+                cached = store.load("dedup", dedup_key) if store else None
+                if cached is not None:
+                    dedup_result = checkpoint.decode_dedup(cached)
+                    span.cached = True
+                else:
+                    dedup_result = dedup.remove_duplicates(
+                        combo_df, config=config, check=span.cancel_check, run_plan=run_plan, progress=span.progress
+                    )
+                    if store:
+                        store.save("dedup", dedup_key, *checkpoint.encode_dedup(dedup_result))
+                span.rows_out = len(dedup_result.cleaned_df)
+
+            # 5. Optionally compare against the previous run
+            with stage("delta", rows_in=len(dedup_result.cleaned_df)) as span:
+                delta_result = delta.compute_run_delta(dedup_result.cleaned_df, raw_data, config=config)
+                if delta_result is not None:
+                    span.rows_out = (
+                        len(delta_result.added_df) + len(delta_result.removed_df) + len(delta_result.changed_df)
+                    )
+
+            # 6. Export Excel + CSV for IQX
+            with stage("export", rows_in=len(dedup_result.cleaned_df)) as span:
+                export_paths = export.write_outputs(
+                    run_label=run_label,
+                    combo_df=combo_df,
+                    dedup_df=dedup_result.cleaned_df,
+                    config=config,
+                    delta=delta_result,
+                    duplicates_df=dedup_result.duplicates_df,
+                    progress=span.progress,
+                    check=span.cancel_check,
+                )
+
+            # 7. Optionally upload the IQX CSV to the bulk import endpoint
+            with stage("upload") as span:
+                upload_result = upload.upload_outputs(export_paths, config=config)
+                if upload_result is not None:
+                    span.rows_out = upload_result.rows
+
+            # 8. Generate QA summary report
+            with stage("qa"):
+                report_path = qa.generate_report(
+                    run_label=run_label,
+                    combo_df=combo_df,
+                    dedup_result=dedup_result,
+                    export_paths=export_paths,
+                    validation=transform_result.validation,
+                    discovery=discovery,
+                    counts_before=_counts_by_source(combo_df),
+                    counts_after=_counts_by_source(dedup_result.cleaned_df),
+                    config=config,
+                    delta=delta_result,
+                    upload=upload_result,
+                )
+
+            return RunResult(
+                run_id=instrumentation.run_id,
+                run_label=run_label,
+                export_paths=export_paths,
+                report_path=report_path,
+                spans=list(instrumentation.spans),
+            )
+        except RunCancelled as exc:
+            logger.warning("Run %s stopped during %s: %s", instrumentation.run_id, exc.stage, exc.reason)
+            exc.report_path = qa.write_partial_report(
+                run_label=run_label,
+                stage=exc.stage,
+                reason=exc.reason,
+                spans=instrumentation.spans,
+                discovery=discovery,
+                config=config,
+                export_paths=export_paths,
+            )
+            raise
+        finally:
+            instrumentation.close()
+            # Background log writers catch up before the caller reads pipeline.log.
+            flush_logging()
+
+
+def _source_rows(raw_data: Mapping[str, pd.DataFrame]) -> int:
+    return sum(len(df) for name, df in raw_data.items() if not name.startswith("_previous"))
 
 
 def _counts_by_source(df):
@@ -0,0 +1,101 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import threading
+
+# pyarrow is imported where it is used: it is optional, and the GUIs import
+# this module before any run has produced a snapshot.
+
+# Snapshots live in this folder under output_root, one per previewed output.
+PREVIEW_DIRNAME = ".preview"
+PREVIEW_SUFFIX = ".arrow"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def snapshot_path(output_path: Path) -> Path:
+    """Where the preview snapshot of an exported file is stored."""
+    output_path = Path(output_path)
+    return output_path.parent / PREVIEW_DIRNAME / f"{output_path.stem}{PREVIEW_SUFFIX}"
+
+
+class PreviewTable:
+    """One preview snapshot, memory-mapped and served a page at a time.
+
+    Snapshots are uncompressed Arrow IPC files written at export, with every
+    column stored as text. Opening one maps the file instead of reading it, so
+    only the pages that are looked at are ever paged in, and :meth:`page`
+    converts just the requested rows to Python. Sort orders are computed once
+    per column and direction and kept for later pages.
+    """
+
+    def __init__(self, path: Path) -> None:
+        import pyarrow as pa
+
+        self.path = Path(path)
+        self._source = pa.memory_map(str(self.path), "r")
+        self._table = pa.ipc.open_file(self._source).read_all()
+        self._orders: Dict[tuple[str, bool], Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._table.column_names)
+
+    @property
+    def total(self) -> int:
+        return self._table.num_rows
+
+    def page(
+        self,
+        page: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_by: str | None = None,
+        descending: bool = False,
+    ) -> Dict[str, Any]:
+        """Rows of one page as lists of strings (``None`` for blanks), plus paging details.
+
+        ``page`` is clamped to the last page; ``sort_by`` must be one of
+        :attr:`columns` (blanks sort last either way).
+        """
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+        pages = max(1, -(-self.total // page_size))
+        page = max(0, min(int(page), pages - 1))
+        start = page * page_size
+        length = min(page_size, self.total - start)
+        if sort_by:
+            if sort_by not in self._table.column_names:
+                raise KeyError(f"Unknown preview column: {sort_by}")
+            indices = self._order(sort_by, bool(descending)).slice(start, length)
+            rows_table = self._table.take(indices)
+        else:
+            rows_table = self._table.slice(start, length)
+        columns = [rows_table.column(idx).to_pylist() for idx in range(rows_table.num_columns)]
+        return {
+            "columns": self.columns,
+            "rows": [list(row) for row in zip(*columns)],
+            "total": self.total,
+            "page": page,
+            "pages": pages,
+            "page_size": page_size,
+            "sort_by": sort_by or "",
+            "descending": bool(descending) if sort_by else False,
+        }
+
+    def close(self) -> None:
+        """Release the memory map so the export can replace the snapshot file."""
+        self._orders.clear()
+        self._table = None
+        self._source.close()
+
+    def _order(self, column: str, descending: bool) -> Any:
+        import pyarrow.compute as pc
+
+        key = (column, descending)
+        with self._lock:
+            order = self._orders.get(key)
+            if order is None:
+                # Nulls (blank cells) sort last by default in both directions.
+                order = pc.sort_indices(self._table, sort_keys=[(column, "descending" if descending else "ascending")])
+                self._orders[key] = order
+        return order
@@ -0,0 +1,304 @@
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+import logging
+import multiprocessing
+import threading
+
+from .cancellation import CancelToken, RunCancelled, StageBudgetExceeded
+from .instrumentation import StageHook
+from .logging_config import configure_logging, forward_records, handle_forwarded
+from .models import RunResult, WarmupResult
+
+# Only light modules are imported here: the parent (a GUI) never loads pandas
+# or the pipeline stages; the child imports them when it starts the run.
+
+logger = logging.getLogger(__name__)
+
+# How often the parent wakes to forward a cancel while the child is quiet.
+POLL_INTERVAL = 0.1
+# Grace period for the child to exit after it sent its last message.
+JOIN_TIMEOUT = 5.0
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+_LOG_FORMATTER = logging.Formatter(LOG_FORMAT)
+
+LogCallback = Callable[[str], None]
+
+
+class PipelineProcessError(RuntimeError):
+    """Raised when the run failed in the child process or the child died."""
+
+
+def gui_backend(config: Mapping[str, Any]) -> str:
+    """How the desktop GUIs run the pipeline: ``"process"`` (default) or ``"thread"``."""
+    exec_cfg = config.get("execution", {}) if isinstance(config, Mapping) else {}
+    backend = str(exec_cfg.get("gui_backend") or "process").lower()
+    if backend not in ("process", "thread"):
+        raise ValueError(f"execution.gui_backend must be 'process' or 'thread', got {backend!r}")
+    return backend
+
+
+class WarmWorker:
+    """A pipeline child process started before the runs it will execute.
+
+    The child imports the pipeline and runs :func:`~h2h_pipeline.warmup.warm_up`
+    on ``config_path`` while the user is still filling in the form, then runs
+    each pipeline handed to :meth:`run`, one at a time, until closed. Parsed
+    source files are kept in the child between runs, so later runs for the
+    same month re-read only changed files. :func:`run_in_subprocess` closes
+    the worker after its one run, so that run's memory is still released.
+    """
+
+    def __init__(self, config_path: Path | str | None = None) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._stop = ctx.Event()
+        self._process = ctx.Process(
+            target=_child_main,
+            args=(child_conn, self._stop, None, str(config_path) if config_path else None),
+            name="h2h-pipeline-run",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._lock = threading.Lock()
+        self._ready: WarmupResult | None = None
+        self._busy = False
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        """True while the worker is idle: not running a pipeline, closed, or dead."""
+        return not self._busy and not self._closed and self._process.is_alive()
+
+    def wait_ready(self) -> WarmupResult:
+        """Block until the child finished warming up (log lines sent meanwhile are dropped)."""
+        with self._lock:
+            while self._ready is None:
+                try:
+                    kind, payload = self._conn.recv()
+                except EOFError:
+                    raise PipelineProcessError(
+                        f"Pipeline process exited during warm-up (exit code {self._process.exitcode})"
+                    )
+                if kind == "ready":
+                    self._ready = payload
+            return self._ready
+
+    def run(
+        self,
+        month: str,
+        input_root: Path,
+        config: Mapping[str, Any],
+        hooks: Iterable[StageHook] | None = None,
+        progress_hooks: Iterable[StageHook] | None = None,
+        cancel: CancelToken | None = None,
+        on_log: LogCallback | None = None,
+    ) -> RunResult:
+        """Run one pipeline in the worker; arguments and results as for :func:`run_in_subprocess`."""
+        self.wait_ready()
+        with self._lock:
+            if not self.available:
+                raise PipelineProcessError("Pipeline process is busy, closed, or has exited")
+            self._busy = True
+        try:
+            configure_logging(config)
+            self._stop.clear()
+            self._conn.send((month, str(input_root), config))
+            return _relay(self._conn, self._stop, self._process, hooks, progress_hooks, cancel, on_log)
+        finally:
+            with self._lock:
+                self._busy = False
+                closing = self._closed
+            if closing:
+                self._shutdown()
+
+    def close(self) -> None:
+        """Stop the worker; a worker running a pipeline stops once that run is over."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._busy:
+                return
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        try:
+            self._conn.send(None)
+        except (OSError, ValueError):
+            pass
+        _reap(self._process)
+        self._conn.close()
+
+
+def run_in_subprocess(
+    month: str,
+    input_root: Path,
+    config: Mapping[str, Any],
+    hooks: Iterable[StageHook] | None = None,
+    progress_hooks: Iterable[StageHook] | None = None,
+    cancel: CancelToken | None = None,
+    on_log: LogCallback | None = None,
+    worker: WarmWorker | None = None,
+) -> RunResult:
+    """Run :func:`~h2h_pipeline.pipeline.run_pipeline` in a child process.
+
+    Takes the same arguments as ``run_pipeline`` (``config`` must be
+    picklable) and relays what the child sends over a pipe: stage and
+    progress events go to ``hooks`` and ``progress_hooks`` on the calling
+    thread, log records to this process's ``pipeline.log`` (the child never
+    opens it, so only this process rotates it) and as formatted lines to
+    ``on_log``, and the :class:`RunResult` is returned. Cancelling ``cancel`` stops the child through a shared event,
+    and :class:`RunCancelled` is re-raised here with the partial report path.
+    The child is a fresh ``spawn`` process, so the caller never holds the
+    GIL or pandas memory for the run; both are gone when the child exits.
+    An available ``worker`` runs the pipeline instead of a new process,
+    skipping the child's start-up imports (waiting for its warm-up first),
+    and is closed afterwards.
+    """
+    if worker is not None and worker.available:
+        try:
+            return worker.run(month, input_root, config, hooks, progress_hooks, cancel, on_log)
+        finally:
+            worker.close()
+    configure_logging(config)
+    ctx = multiprocessing.get_context("spawn")
+    receiver, sender = ctx.Pipe(duplex=False)
+    stop = ctx.Event()
+    process = ctx.Process(
+        target=_child_main,
+        args=(sender, stop, (month, str(input_root), config), None),
+        name="h2h-pipeline-run",
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    try:
+        return _relay(receiver, stop, process, hooks, progress_hooks, cancel, on_log)
+    finally:
+        _reap(process)
+        receiver.close()
+
+
+def _relay(
+    receiver: Any,
+    stop: Any,
+    process: Any,
+    hooks: Iterable[StageHook] | None,
+    progress_hooks: Iterable[StageHook] | None,
+    cancel: CancelToken | None,
+    on_log: LogCallback | None,
+) -> RunResult:
+    """Forward one run's messages from the child until its outcome arrives."""
+    hooks = list(hooks or ())
+    progress_hooks = list(progress_hooks or ())
+    while True:
+        if cancel is not None and cancel.cancelled:
+            stop.set()
+        if not receiver.poll(POLL_INTERVAL):
+            continue
+        try:
+            kind, payload = receiver.recv()
+        except EOFError:
+            process.join(JOIN_TIMEOUT)
+            raise PipelineProcessError(f"Pipeline process exited unexpectedly (exit code {process.exitcode})")
+        if kind == "stage":
+            _emit(hooks, payload)
+        elif kind == "progress":
+            _emit(progress_hooks, payload)
+        elif kind == "log":
+            record = handle_forwarded(payload)
+            if on_log is not None:
+                on_log(_LOG_FORMATTER.format(record))
+        elif kind == "result":
+            return payload
+        elif kind == "cancelled":
+            error_type = StageBudgetExceeded if payload["budget"] else RunCancelled
+            exc = error_type(payload["reason"], payload["stage"])
+            exc.report_path = payload["report_path"]
+            raise exc
+        elif kind == "error":
+            raise PipelineProcessError(payload)
+
+
+def _reap(process: Any) -> None:
+    process.join(JOIN_TIMEOUT)
+    if process.is_alive():  # pragma: no cover - child ignored the stop request
+        logger.warning("Pipeline process %s did not exit; terminating it", process.pid)
+        process.terminate()
+        process.join(JOIN_TIMEOUT)
+
+
+def _emit(hooks: list[StageHook], event: Any) -> None:
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception as exc:  # pragma: no cover - hooks must not break a run
+            logger.warning("Stage hook %r failed: %s", hook, exc)
+
+
+class _Sender:
+    """Pipe end shared by the run, its hooks, and log records from any thread."""
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, kind: str, payload: Any) -> None:
+        with self._lock:
+            self._conn.send((kind, payload))
+
+
+def _child_main(conn: Any, stop: Any, job: tuple[Any, ...] | None, warm_config: str | None) -> None:
+    sender = _Sender(conn)
+    forward_records(lambda record: sender.send("log", record))
+    try:
+        if job is not None:
+            _run_job(sender, stop, job, None)
+            return
+        # A WarmWorker: warm up, report it, then run jobs until None (close) or EOF (the GUI went away).
+        from .warmup import warm_up
+
+        sender.send("ready", warm_up(warm_config))
+        frames: dict[tuple, Any] = {}
+        while True:
+            try:
+                job = conn.recv()
+            except EOFError:
+                return
+            if job is None:
+                return
+            _run_job(sender, stop, job, frames)
+    finally:
+        conn.close()
+
+
+def _run_job(sender: _Sender, stop: Any, job: tuple[Any, ...], frames: dict[tuple, Any] | None) -> None:
+    month, input_root, config = job
+    try:
+        from .pipeline import run_pipeline
+
+        result = run_pipeline(
+            month=month,
+            input_root=Path(input_root),
+            config=config,
+            hooks=[lambda event: sender.send("stage", event)],
+            progress_hooks=[lambda event: sender.send("progress", event)],
+            frame_cache=frames,
+            cancel=CancelToken(stop),
+        )
+        sender.send("result", result)
+    except RunCancelled as exc:
+        sender.send(
+            "cancelled",
+            {
+                "reason": exc.reason,
+                "stage": exc.stage,
+                "budget": isinstance(exc, StageBudgetExceeded),
+                "report_path": exc.report_path,
+            },
+        )
+    except Exception as exc:
+        logger.exception("Pipeline run failed")
+        sender.send("error", str(exc) or exc.__class__.__name__)
@@ -1,10 +1,18 @@
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 import logging
 import pandas as pd
 
-from .models import DedupResult, ValidationReport, DiscoveryResult
+from .models import (
+    DedupResult,
+    DeltaResult,
+    DiscoveryResult,
+    ExportResult,
+    StageEvent,
+    UploadResult,
+    ValidationReport,
+)
 from .utils.io_helpers import ensure_dir
 
 
@@ -21,25 +29,56 @@ def generate_report(
     counts_before: Mapping[str, int],
     counts_after: Mapping[str, int],
     config: Mapping[str, Any],
+    delta: DeltaResult | None = None,
+    upload: UploadResult | None = None,
+    row_counts: Mapping[str, int] | None = None,
 ) -> Path:
-    """Write a QA report summarizing the run."""
+    """Write a QA report summarizing the run.
+
+    ``row_counts`` (``combo``, ``cleaned``, ``duplicates``) replaces the frame
+    lengths when the frames were never held in memory (chunked execution).
+    """
     paths_cfg = config.get("paths", {}) if isinstance(config, Mapping) else {}
     output_root = ensure_dir(Path(paths_cfg.get("output_root", "output")))
 
     report_path = output_root / f"QA Report {run_label}.txt"
 
+    if row_counts is None:
+        row_counts = {
+            "combo": len(combo_df),
+            "cleaned": len(dedup_result.cleaned_df),
+            "duplicates": len(dedup_result.duplicates_df),
+        }
+
     lines = [
         f"QA report for {run_label}",
         "",
-        f"Rows in Combo: {len(combo_df)}",
-        f"Rows after dedup: {len(dedup_result.cleaned_df)}",
-        f"Duplicates removed: {len(dedup_result.duplicates_df)}",
+        f"Rows in Combo: {row_counts['combo']}",
+        f"Rows after dedup: {row_counts['cleaned']}",
+        f"Duplicates removed: {row_counts['duplicates']}",
         "",
         "Outputs:",
     ]
     for label, path in export_paths.items():
         lines.append(f"- {label}: {path}")
 
+    if isinstance(export_paths, ExportResult):
+        lines.append("")
+        lines.append("Skipped outputs (contents unchanged):")
+        if export_paths.skipped:
+            for label in export_paths.skipped:
+                lines.append(f"- {label}")
+        else:
+            lines.append("- none")
+
+        if export_paths.sqlite is not None:
+            stats = export_paths.sqlite
+            lines.append("")
+            lines.append(
+                f"SQLite staging: {stats.rows} rows into {stats.table} in {stats.seconds:.2f}s "
+                f"({stats.rows_per_second:,.0f} rows/s)"
+            )
+
     lines.extend(
         [
             "",
@@ -72,17 +111,99 @@ def generate_report(
         ]
     )
 
+    if delta is not None:
+        lines.extend(
+            [
+                "",
+                f"Delta vs {delta.baseline}:",
+                f"- Added: {len(delta.added_df)}",
+                f"- Removed: {len(delta.removed_df)}",
+                f"- Changed: {len(delta.changed_df)}",
+                f"- Unchanged: {delta.unchanged}",
+            ]
+        )
+
+    if upload is not None:
+        lines.extend(
+            [
+                "",
+                f"Upload to {upload.url}:",
+                f"- Parts uploaded: {upload.parts_uploaded + upload.parts_resumed}/{upload.parts_total}"
+                f" ({upload.parts_resumed} from checkpoint)",
+                f"- Failed parts: {upload.failed_parts if upload.failed_parts else 'none'}",
+                f"- Latency p50/p95/max: {upload.latency_percentile(50) * 1000:.0f}"
+                f"/{upload.latency_percentile(95) * 1000:.0f}/{upload.latency_percentile(100) * 1000:.0f} ms",
+                f"- Throughput: {upload.bytes_per_second / 1024:,.1f} KiB/s over {upload.seconds:.2f}s",
+            ]
+        )
+
+    lines.extend(_discovery_lines(discovery))
+
+    with report_path.open("w", encoding="utf-8") as handle:
+        handle.write("\n".join(lines))
+
+    logger.info("QA report written to %s", report_path)
+    return report_path
+
+
+def write_partial_report(
+    run_label: str,
+    stage: str | None,
+    reason: str,
+    spans: Iterable[StageEvent],
+    discovery: DiscoveryResult | None,
+    config: Mapping[str, Any],
+    export_paths: Mapping[str, Path] | None = None,
+) -> Path:
+    """Write a QA report for a run that was cancelled or ran out of time.
+
+    Lists the stage that stopped, the stages that finished (with their time
+    and row counts), the outputs if export completed, and discovery warnings.
+    Written next to the full report as ``QA Report <label> (incomplete).txt``
+    so a previous complete report is not overwritten.
+    """
+    paths_cfg = config.get("paths", {}) if isinstance(config, Mapping) else {}
+    output_root = ensure_dir(Path(paths_cfg.get("output_root", "output")))
+    report_path = output_root / f"QA Report {run_label} (incomplete).txt"
+
+    lines = [
+        f"QA report for {run_label} (incomplete)",
+        "",
+        f"Run stopped during {stage or 'startup'}: {reason}",
+        "",
+        "Completed stages:",
+    ]
+    completed = [span for span in spans if span.phase == "end" and span.error is None]
+    for span in completed:
+        rows = f", {span.rows_out} rows" if span.rows_out is not None else ""
+        lines.append(f"- {span.stage}: {span.wall_seconds:.2f}s{rows}")
+    if not completed:
+        lines.append("- none")
+
     lines.append("")
-    lines.append("Discovery warnings:")
+    lines.append("Outputs:")
+    if export_paths:
+        for label, path in export_paths.items():
+            lines.append(f"- {label}: {path}")
+    else:
+        lines.append("- none (the run stopped before export finished)")
+
+    if discovery is not None:
+        lines.extend(_discovery_lines(discovery))
+
+    with report_path.open("w", encoding="utf-8") as handle:
+        handle.write("\n".join(lines))
+
+    logger.warning("Partial QA report written to %s", report_path)
+    return report_path
+
+
+def _discovery_lines(discovery: DiscoveryResult) -> list[str]:
+    lines = ["", "Discovery warnings:"]
     if discovery.month_dir_missing:
         lines.append(f"- Month directory not found under {discovery.input_root}")
     if discovery.missing_sources:
         lines.append(f"- Missing source files for: {', '.join(sorted(discovery.missing_sources))}")
     if not discovery.month_dir_missing and not discovery.missing_sources:
         lines.append("- none")
-
-    with report_path.open("w", encoding="utf-8") as handle:
-        handle.write("\n".join(lines))
-
-    logger.info("QA report written to %s", report_path)
-    return report_path
+    return lines
@@ -0,0 +1,259 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+import logging
+import threading
+import time
+import uuid
+
+from .cancellation import CancelToken, RunCancelled
+from .instrumentation import StageHook
+from .log_tail import follow_log
+from .models import RunResult
+from .process_runner import LogCallback, WarmWorker, gui_backend
+
+# Imported by the GUIs at start-up, so only light modules are used here; the
+# pipeline itself is imported by the child process (or by RunLane.run with the
+# thread backend).
+
+logger = logging.getLogger(__name__)
+
+# Pipelines run at the same time (one per month and input root); further jobs wait.
+DEFAULT_WORKERS = 2
+# Finished jobs kept in the list before the oldest are forgotten.
+MAX_FINISHED_JOBS = 50
+
+
+class QueuedJob:
+    """One run submitted from a GUI, with its status, timings and result."""
+
+    def __init__(self, config_path: str, input_root: str, output_root: str, month: str) -> None:
+        self.id = uuid.uuid4().hex[:8]
+        self.config_path = config_path
+        self.input_root = input_root
+        self.output_root = output_root
+        self.month = month
+        self.status = "queued"
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.result: Optional[RunResult] = None
+        self.error: Optional[str] = None
+        self.cancel_token = CancelToken()
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Jobs with the same key run one after another and share parsed source files."""
+        return (self.month, self.input_root)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def to_dict(self) -> Dict[str, Any]:
+        now = time.time()
+        queued_until = self.started or self.finished or now
+        payload: Dict[str, Any] = {
+            "id": self.id,
+            "config_path": self.config_path,
+            "input_root": self.input_root,
+            "output_root": self.output_root,
+            "month": self.month,
+            "status": self.status,
+            "queued_seconds": round(queued_until - self.submitted, 2),
+            "run_seconds": round((self.finished or now) - self.started, 2) if self.started else None,
+            "error": self.error,
+        }
+        if self.result is not None:
+            payload["run_label"] = self.result.run_label
+            payload["report_path"] = str(self.result.report_path)
+        return payload
+
+
+class RunLane:
+    """What consecutive jobs for one month and input root share.
+
+    ``worker`` is the pipeline process kept between the lane's jobs with the
+    ``process`` backend (it keeps their parsed source files); ``frames`` are
+    the parsed source files kept for in-process (``thread`` backend) runs.
+    Both are dropped when the lane ends.
+    """
+
+    def __init__(self, key: tuple[str, str]) -> None:
+        self.key = key
+        self.worker: WarmWorker | None = None
+        self.frames: Dict[tuple, Any] = {}
+
+    def run(
+        self,
+        month: str,
+        input_root: Path,
+        config: Mapping[str, Any],
+        hooks: Iterable[StageHook],
+        progress_hooks: Iterable[StageHook],
+        cancel: CancelToken,
+        on_log: LogCallback,
+        log_file: Path,
+        spare: Callable[[], WarmWorker | None] | None = None,
+    ) -> RunResult:
+        """Run one pipeline with the config's GUI backend, reusing what earlier jobs left.
+
+        With the ``process`` backend the lane's process is started on first
+        use, adopting the idle pre-warmed worker ``spare`` returns if any.
+        With ``thread`` the run happens here and ``pipeline.log`` is followed
+        for ``on_log``.
+        """
+        if gui_backend(config) == "thread":
+            from .pipeline import run_pipeline
+
+            # Only the lines this run appends are read, however large the log has grown.
+            with follow_log(log_file, on_log):
+                return run_pipeline(
+                    month=month,
+                    input_root=input_root,
+                    config=config,
+                    hooks=hooks,
+                    progress_hooks=progress_hooks,
+                    frame_cache=self.frames,
+                    cancel=cancel,
+                )
+        if self.worker is None or not self.worker.available:
+            if self.worker is not None:
+                self.worker.close()
+            self.worker = spare() if spare is not None else None
+            if self.worker is None or not self.worker.available:
+                self.worker = WarmWorker()
+        return self.worker.run(month, input_root, config, hooks, progress_hooks, cancel, on_log)
+
+    def close(self) -> None:
+        if self.worker is not None:
+            self.worker.close()
+            self.worker = None
+        self.frames.clear()
+
+
+JobRunner = Callable[[QueuedJob, RunLane], RunResult]
+JobCallback = Callable[[QueuedJob], None]
+
+
+class RunQueue:
+    """Run GUI jobs in submission order on at most ``workers`` pipelines at once.
+
+    Each month and input root gets a lane: a thread that runs that key's
+    queued jobs one after another through ``run_job`` and ends when none are
+    left, so later jobs reuse the lane's warm process and parsed source files.
+    Lanes for different keys run in parallel. ``on_change`` is called from
+    the lane threads whenever a job changes status.
+    """
+
+    def __init__(
+        self, run_job: JobRunner, workers: int = DEFAULT_WORKERS, on_change: JobCallback | None = None
+    ) -> None:
+        self.workers = max(1, int(workers))
+        self._run_job = run_job
+        self._on_change = on_change
+        self._jobs: List[QueuedJob] = []
+        self._lanes: Dict[tuple[str, str], RunLane] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        with self._lock:
+            return any(not job.done for job in self._jobs)
+
+    def jobs(self) -> List[QueuedJob]:
+        with self._lock:
+            return list(self._jobs)
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        with self._lock:
+            return next((job for job in self._jobs if job.id == job_id), None)
+
+    def submit(self, config_path: str, input_root: str, output_root: str, month: str) -> QueuedJob:
+        job = QueuedJob(config_path, input_root, output_root, month)
+        with self._lock:
+            self._jobs.append(job)
+            self._prune()
+            self._dispatch()
+        self._changed(job)
+        return job
+
+    def cancel(self, job_id: str, reason: str = "Cancelled by user") -> Optional[QueuedJob]:
+        """Stop a job: a queued one is dropped, a running one stops at its next stage check."""
+        job = self.get(job_id)
+        if job is None or job.done:
+            return job
+        job.cancel_token.cancel(reason)
+        with self._lock:
+            dropped = job.status == "queued"
+            if dropped:
+                job.status = "cancelled"
+                job.error = job.cancel_token.reason
+                job.finished = time.time()
+        if dropped:
+            self._changed(job)
+        return job
+
+    def cancel_all(self, reason: str = "Cancelled by user") -> List[QueuedJob]:
+        """Cancel every job not yet finished; returns them."""
+        pending = [job for job in self.jobs() if not job.done]
+        for job in pending:
+            self.cancel(job.id, reason)
+        return pending
+
+    def _dispatch(self) -> None:
+        # Called with the lock held: open a lane for the oldest waiting key while slots are free.
+        for job in self._jobs:
+            if len(self._lanes) >= self.workers:
+                return
+            if job.status == "queued" and job.key not in self._lanes:
+                lane = RunLane(job.key)
+                self._lanes[job.key] = lane
+                threading.Thread(target=self._lane_loop, args=(lane,), name="pipeline-lane", daemon=True).start()
+
+    def _next_job(self, lane: RunLane) -> Optional[QueuedJob]:
+        with self._lock:
+            job = next((j for j in self._jobs if j.status == "queued" and j.key == lane.key), None)
+            if job is None:
+                del self._lanes[lane.key]
+                self._dispatch()
+                return None
+            job.status = "running"
+            job.started = time.time()
+            return job
+
+    def _lane_loop(self, lane: RunLane) -> None:
+        try:
+            while True:
+                job = self._next_job(lane)
+                if job is None:
+                    return
+                self._changed(job)
+                try:
+                    job.result = self._run_job(job, lane)
+                    status = "succeeded"
+                except RunCancelled as exc:
+                    job.error = exc.reason
+                    status = "cancelled"
+                except Exception as exc:
+                    job.error = str(exc) or exc.__class__.__name__
+                    status = "failed"
+                with self._lock:
+                    job.status = status
+                    job.finished = time.time()
+                self._changed(job)
+        finally:
+            lane.close()
+
+    def _changed(self, job: QueuedJob) -> None:
+        if self._on_change is None:
+            return
+        try:
+            self._on_change(job)
+        except Exception as exc:  # pragma: no cover - a GUI callback must not stop the queue
+            logger.warning("Run queue callback failed: %s", exc)
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs if job.done]
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            self._jobs.remove(job)
@@ -0,0 +1,474 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import hmac
+import json
+import logging
+import re
+import secrets
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from .cancellation import CancelToken, RunCancelled
+from .checkpoint import MemoryCheckpointStore
+from .config_loader import load_config
+from .models import RunResult
+from .pipeline import run_pipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 8
+# Finished jobs kept for status lookups before the oldest are forgotten.
+MAX_FINISHED_JOBS = 100
+# (month, input root) pairs whose checkpoints and parsed sources stay in memory; the least
+# recently used idle one is dropped when another month is submitted.
+MAX_WARM_MONTHS = 4
+# Loaded configs kept by (config file, overrides), least recently used dropped first.
+MAX_CACHED_CONFIGS = 32
+
+_MONTH = re.compile(r"^\d{4}-\d{2}$")
+# Run labels end up in output file names, so they may not contain path separators.
+_RUN_VALUE = re.compile(r"^[\w .-]*$")
+
+# Config sections a request's "overrides" may change, with the keys allowed in each (None: any).
+# The rest (paths, mappings, upload, checkpoints, delta, execution, ...) names files, directories
+# or URLs and stays as the operator configured it.
+OVERRIDABLE_SECTIONS: Dict[str, Optional[tuple[str, ...]]] = {
+    "run": ("current_month", "previous_month", "output_date", "current_date", "run_date"),
+    "date_handling": None,
+    "defaults": None,
+}
+# Environment variable `cli serve` reads the API token from when --token is not given.
+TOKEN_ENV = "H2H_SERVICE_TOKEN"
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+class ServiceBusy(RuntimeError):
+    """Raised when the run queue is full."""
+
+
+class Job:
+    """One queued run and the progress events it has produced so far."""
+
+    def __init__(
+        self, month: str, input_root: Path, overrides: Mapping[str, Any], config_path: Optional[Path] = None
+    ) -> None:
+        self.id = uuid.uuid4().hex[:12]
+        self.month = month
+        self.input_root = input_root
+        self.overrides = dict(overrides)
+        self.config_path = config_path
+        self.status = "queued"
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self.result: Optional[RunResult] = None
+        self.qa_summary: Optional[str] = None
+        self.error: Optional[str] = None
+        self.cancel_token = CancelToken()
+        self._changed = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def add_event(self, event: Dict[str, Any]) -> None:
+        with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    def set_status(self, status: str) -> None:
+        with self._changed:
+            self.status = status
+            if status == "running":
+                self.started = time.time()
+            if self.done:
+                self.finished = time.time()
+            self.events.append({"type": "status", "status": status, "timestamp": time.time()})
+            self._changed.notify_all()
+
+    def wait_for_events(self, seen: int, timeout: float) -> List[Dict[str, Any]]:
+        """Return events after the first ``seen``, waiting up to ``timeout`` for new ones."""
+        with self._changed:
+            if len(self.events) <= seen and not self.done:
+                self._changed.wait(timeout)
+            return list(self.events[seen:])
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; return False on timeout."""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.done, timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "id": self.id,
+            "month": self.month,
+            "input_root": str(self.input_root),
+            "config": str(self.config_path) if self.config_path else None,
+            "status": self.status,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "queued_seconds": round((self.started or self.finished or time.time()) - self.submitted, 3),
+            "run_seconds": round((self.finished or time.time()) - self.started, 3) if self.started else None,
+            "error": self.error,
+        }
+        if self.result is not None:
+            payload["run_id"] = self.result.run_id
+            payload["run_label"] = self.result.run_label
+            payload["export_paths"] = {key: str(path) for key, path in self.result.export_paths.items()}
+            payload["report_path"] = str(self.result.report_path)
+            payload["qa_summary"] = self.qa_summary
+            payload["stage_seconds"] = {
+                e.stage: round(e.wall_seconds, 4) for e in self.result.spans if e.phase == "end"
+            }
+        elif self.qa_summary is not None:
+            payload["qa_summary"] = self.qa_summary
+        return payload
+
+
+class _WarmState:
+    """Lock, checkpoints and parsed source frames shared by the jobs of one month and input root."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.store = MemoryCheckpointStore()
+        self.frames: Dict[tuple, pd.DataFrame] = {}
+        # Jobs holding this state; a state in use is never dropped.
+        self.users = 0
+
+
+class PipelineService:
+    """Run pipeline requests on a bounded worker pool with warm per-month caches.
+
+    Jobs for the same month and input root run one at a time and share an
+    in-memory checkpoint store and parsed source frames, so repeated requests
+    (with any config) only redo stages whose inputs changed. Only the
+    :data:`MAX_WARM_MONTHS` most recently used months stay warm. Different months
+    run in parallel up to ``workers``; at most ``max_queue`` jobs may wait.
+    A job may name its own ``config_path`` inside ``config_dir`` (default: the
+    folder of ``config_path``, which is the default config), and may only
+    override the keys in :data:`OVERRIDABLE_SECTIONS`.
+    """
+
+    def __init__(
+        self,
+        config_path: Path,
+        input_root: Path,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        config_dir: Optional[Path] = None,
+    ) -> None:
+        self.config_path = Path(config_path)
+        self.config_dir = Path(config_dir or self.config_path.parent).resolve()
+        self.input_root = Path(input_root)
+        self.max_queue = max(0, int(max_queue))
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="pipeline-job")
+        self._slots = threading.BoundedSemaphore(max(1, int(workers)) + self.max_queue)
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._warm: "OrderedDict[tuple, _WarmState]" = OrderedDict()
+        self._configs: "OrderedDict[str, tuple[tuple, Mapping[str, Any]]]" = OrderedDict()
+
+    def submit(
+        self,
+        month: str,
+        input_root: Optional[Path] = None,
+        overrides: Optional[Mapping[str, Any]] = None,
+        config_path: Optional[Path] = None,
+    ):
+        if not _MONTH.match(str(month)):
+            raise ValueError(f"month must be YYYY-MM, got {month!r}")
+        _check_overrides(overrides)
+        if config_path is not None:
+            config_path = self._check_config_path(config_path)
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy("Run queue is full; retry later.")
+        job = Job(
+            str(month),
+            Path(input_root) if input_root else self.input_root,
+            overrides or {},
+            Path(config_path) if config_path else None,
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune_jobs()
+        job.set_status("queued")
+        self._executor.submit(self._run_job, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _check_config_path(self, config_path: Path | str) -> Path:
+        path = Path(config_path)
+        if not path.is_absolute():
+            path = self.config_dir / path
+        path = path.resolve()
+        if not path.is_relative_to(self.config_dir):
+            raise ValueError(f"config must be a file in {self.config_dir}")
+        if not path.is_file():
+            raise ValueError(f"config file not found: {config_path}")
+        return path
+
+    def jobs(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Ask a queued or running job to stop; a running job stops at its next stage check."""
+        job = self.get(job_id)
+        if job is not None and not job.done:
+            job.cancel_token.cancel("Cancelled by request")
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _run_job(self, job: Job) -> None:
+        try:
+            config = self._config(job)
+            warm = self._acquire_warm(job)
+            try:
+                with warm.lock:
+                    if job.cancel_token.cancelled:
+                        job.error = job.cancel_token.reason
+                        job.set_status("cancelled")
+                        return
+                    job.set_status("running")
+                    result = run_pipeline(
+                        month=job.month,
+                        input_root=job.input_root,
+                        config=config,
+                        hooks=[lambda event: job.add_event({"type": "stage", **asdict(event)})],
+                        progress_hooks=[lambda event: job.add_event({"type": "progress", **asdict(event)})],
+                        checkpoints=warm.store,
+                        frame_cache=warm.frames,
+                        cancel=job.cancel_token,
+                    )
+            finally:
+                self._release_warm(warm)
+            job.result = result
+            try:
+                job.qa_summary = Path(result.report_path).read_text(encoding="utf-8")
+            except OSError as exc:  # pragma: no cover - report was just written
+                logger.warning("Could not read QA report %s: %s", result.report_path, exc)
+            job.set_status("succeeded")
+        except RunCancelled as exc:
+            logger.warning("Service job %s for %s stopped: %s", job.id, job.month, exc.reason)
+            job.error = exc.reason
+            try:
+                job.qa_summary = Path(exc.report_path).read_text(encoding="utf-8") if exc.report_path else None
+            except OSError as read_exc:  # pragma: no cover - report was just written
+                logger.warning("Could not read partial QA report %s: %s", exc.report_path, read_exc)
+            job.set_status("cancelled")
+        except Exception as exc:
+            logger.exception("Service job %s for %s failed", job.id, job.month)
+            job.error = str(exc) or exc.__class__.__name__
+            job.set_status("failed")
+        finally:
+            self._slots.release()
+
+    def _config(self, job: Job) -> Mapping[str, Any]:
+        overrides = {**job.overrides}
+        paths = dict(overrides.get("paths") or {})
+        paths["input_root"] = str(job.input_root)
+        overrides["paths"] = paths
+        config_path = job.config_path or self.config_path
+        cache_key = json.dumps([str(config_path), overrides], sort_keys=True, default=str)
+        stat = config_path.stat()
+        version = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._configs.get(cache_key)
+            if cached is not None:
+                self._configs.move_to_end(cache_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        config = load_config(config_path, overrides=overrides)
+        with self._lock:
+            self._configs[cache_key] = (version, config)
+            self._configs.move_to_end(cache_key)
+            while len(self._configs) > MAX_CACHED_CONFIGS:
+                self._configs.popitem(last=False)
+        return config
+
+    def _acquire_warm(self, job: Job) -> _WarmState:
+        key = (job.month, str(job.input_root))
+        with self._lock:
+            warm = self._warm.get(key)
+            if warm is None:
+                warm = self._warm[key] = _WarmState()
+            self._warm.move_to_end(key)
+            warm.users += 1
+            # Drop the least recently used idle months; months with queued or running jobs stay.
+            idle = [k for k, state in self._warm.items() if state.users == 0]
+            for stale in idle[: max(0, len(self._warm) - MAX_WARM_MONTHS)]:
+                del self._warm[stale]
+            return warm
+
+    def _release_warm(self, warm: _WarmState) -> None:
+        with self._lock:
+            warm.users -= 1
+
+    def _prune_jobs(self) -> None:
+        finished = [job for job in self._jobs.values() if job.done]
+        for job in sorted(finished, key=lambda j: j.finished or 0)[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
+
+
+def _check_overrides(overrides: Any) -> None:
+    if overrides is None:
+        return
+    if not isinstance(overrides, Mapping):
+        raise ValueError("overrides must be a JSON object")
+    for section, values in overrides.items():
+        if section not in OVERRIDABLE_SECTIONS:
+            allowed = ", ".join(OVERRIDABLE_SECTIONS)
+            raise ValueError(f"overrides may not change '{section}' (allowed sections: {allowed})")
+        if not isinstance(values, Mapping):
+            raise ValueError(f"overrides.{section} must be a JSON object")
+        keys = OVERRIDABLE_SECTIONS[section]
+        for key, value in values.items():
+            if keys is not None and key not in keys:
+                raise ValueError(f"overrides may not change '{section}.{key}'")
+            if section == "run" and not (value is None or _RUN_VALUE.match(str(value))):
+                raise ValueError(f"overrides.run.{key} may only contain letters, digits, spaces, '.', '_' and '-'")
+
+
+def make_server(
+    service: PipelineService, host: str = "127.0.0.1", port: int = 8765, token: Optional[str] = None
+) -> ThreadingHTTPServer:
+    """Build the HTTP/JSON front end for ``service``.
+
+    Every request except ``GET /health`` must send ``Authorization: Bearer
+    <token>``, and ``POST /runs`` must be ``application/json``, so web pages
+    open in the operator's browser cannot start runs. Without ``token`` one
+    is generated (read it from the server's ``token`` attribute); listening
+    on a non-loopback ``host`` requires an explicit token.
+
+    ``POST /runs`` queues a run (``{"month": "YYYY-MM", "input_root": ..., "config": ..., "overrides": {...}}``),
+    ``GET /runs/<id>`` returns its status, QA summary and export paths, and
+    ``GET /runs/<id>/events`` streams progress events as JSON lines until the
+    run finishes, and ``POST /runs/<id>/cancel`` stops a queued or running run
+    (its partial QA report becomes the ``qa_summary``).
+    """
+
+    if not token and host not in LOOPBACK_HOSTS:
+        raise ValueError(f"Listening on {host} requires a token (--token or {TOKEN_ENV})")
+    api_token = token or secrets.token_urlsafe(24)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+            if parts == ["health"]:
+                self._send_json(200, {"status": "ok", "jobs": len(service.jobs())})
+            elif not self._authorized():
+                return
+            elif parts == ["runs"]:
+                self._send_json(200, {"runs": [job.to_dict() for job in service.jobs()]})
+            elif len(parts) in (2, 3) and parts[0] == "runs" and parts[2:] in ([], ["events"]):
+                job = service.get(parts[1])
+                if job is None:
+                    self._send_json(404, {"error": "unknown run"})
+                elif len(parts) == 3:
+                    self._stream_events(job)
+                else:
+                    self._send_json(200, job.to_dict())
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+            if not self._authorized():
+                return
+            if len(parts) == 3 and parts[0] == "runs" and parts[2] == "cancel":
+                job = service.cancel(parts[1])
+                if job is None:
+                    self._send_json(404, {"error": "unknown run"})
+                elif job.done:
+                    self._send_json(409, {"error": f"run already {job.status}", **job.to_dict()})
+                else:
+                    self._send_json(202, job.to_dict())
+                return
+            if parts != ["runs"]:
+                self._send_json(404, {"error": "not found"})
+                return
+            content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+            if content_type != "application/json":
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self._send_json(415, {"error": "Content-Type must be application/json"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(body, Mapping):
+                    raise ValueError("request body must be a JSON object")
+                job = service.submit(
+                    body.get("month", ""), body.get("input_root"), body.get("overrides"), body.get("config")
+                )
+            except ServiceBusy as exc:
+                self._send_json(429, {"error": str(exc)})
+                return
+            except ValueError as exc:
+                self._send_json(400, {"error": str(exc)})
+                return
+            self._send_json(202, job.to_dict())
+
+        def _authorized(self) -> bool:
+            sent = self.headers.get("Authorization") or ""
+            if hmac.compare_digest(sent.encode("utf-8"), f"Bearer {api_token}".encode("utf-8")):
+                return True
+            # Drain the body so the keep-alive connection stays usable for the reply.
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self._send_json(401, {"error": "missing or wrong Authorization token"})
+            return False
+
+        def _stream_events(self, job: Job) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            seen = 0
+            try:
+                while True:
+                    events = job.wait_for_events(seen, timeout=15.0)
+                    seen += len(events)
+                    payload = "".join(json.dumps(event, default=str) + "\n" for event in events)
+                    if payload:
+                        self._write_chunk(payload.encode("utf-8"))
+                    if job.done and not events:
+                        break
+                self._write_chunk(b"")
+            except (BrokenPipeError, ConnectionResetError):
+                logger.info("Event stream for %s closed by client", job.id)
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+        def _send_json(self, status: int, payload: Mapping[str, Any]) -> None:
+            body = json.dumps(payload, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.token = api_token  # type: ignore[attr-defined]
+    return server
@@ -0,0 +1,158 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import logging
+import re
+import sqlite3
+import time
+
+import pandas as pd
+
+from .constants import EMAIL_COLUMN, FIRST_NAME_COLUMN, LAST_NAME_COLUMN, PHONE_COLUMN, ZIP_COLUMN
+from .models import SqliteLoadStats
+from .utils.series import combine_keys, digits_only, identity_key, normalize_series
+
+logger = logging.getLogger(__name__)
+
+RECORD_KEY_COLUMN = "_record_key"
+RUN_LABEL_COLUMN = "_run_label"
+KEY_COLUMNS = ["_norm_email", "_norm_phone", "_norm_name_zip"]
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def load_frame(
+    df: pd.DataFrame,
+    db_path: Path,
+    run_label: str,
+    mode: str = "per_run",
+    table: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SqliteLoadStats:
+    """Bulk load rows into the SQLite staging database.
+
+    ``per_run`` mode replaces a table named after the run label. ``history``
+    mode upserts into a single table keyed by normalized email, then phone,
+    then name+ZIP. Rows are inserted with ``executemany`` in transactions of
+    ``batch_size`` rows under WAL journaling; lookup indexes are created only
+    after the load completes.
+    """
+    mode = mode.lower()
+    if mode not in ("per_run", "history"):
+        raise ValueError(f"Unknown SQLite sink mode '{mode}'; expected 'per_run' or 'history'.")
+    table = resolve_table(run_label, mode, table)
+
+    frame = _staging_frame(df, run_label)
+    if mode == "history":
+        missing = frame[RECORD_KEY_COLUMN] == ""
+        if missing.any():
+            logger.warning("Skipping %s rows without email, phone, or name+zip for SQLite history", missing.sum())
+            frame = frame.loc[~missing]
+
+    columns = list(frame.columns)
+    started = time.perf_counter()
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if mode == "per_run":
+            conn.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+            conn.execute(f"CREATE TABLE {_quote(table)} ({', '.join(f'{_quote(c)} TEXT' for c in columns)})")
+            sql = _insert_sql(table, columns)
+        else:
+            _ensure_history_table(conn, table, columns)
+            sql = _upsert_sql(table, columns)
+
+        for batch in _batches(_rows(frame), max(1, int(batch_size))):
+            with conn:
+                conn.executemany(sql, batch)
+
+        with conn:
+            for col in KEY_COLUMNS:
+                index = f"idx_{_sanitize(table)}_{col.strip('_')}"
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {_quote(index)} ON {_quote(table)} ({_quote(col)})")
+    finally:
+        conn.close()
+
+    stats = SqliteLoadStats(table=table, rows=len(frame), seconds=time.perf_counter() - started)
+    logger.info(
+        "Loaded %s rows into SQLite table %s in %.2fs (%.0f rows/s)",
+        stats.rows,
+        table,
+        stats.seconds,
+        stats.rows_per_second,
+    )
+    return stats
+
+
+def table_exists(db_path: Path, table: str) -> bool:
+    if not db_path.exists():
+        return False
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    finally:
+        conn.close()
+    return row is not None
+
+
+def resolve_table(run_label: str, mode: str, table: str | None) -> str:
+    if table:
+        return table
+    return f"run_{_sanitize(run_label)}" if mode.lower() == "per_run" else "h2h_history"
+
+
+def _staging_frame(df: pd.DataFrame, run_label: str) -> pd.DataFrame:
+    frame = df.astype(str).where(df.notna(), None)
+    frame["_norm_email"] = normalize_series(df, EMAIL_COLUMN, lambda v: str(v).strip().lower()).to_numpy()
+    frame["_norm_phone"] = normalize_series(df, PHONE_COLUMN, digits_only).to_numpy()
+    last = normalize_series(df, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    first = normalize_series(df, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    zip_code = normalize_series(df, ZIP_COLUMN, lambda v: str(v).strip())
+    frame["_norm_name_zip"] = combine_keys([last, first, zip_code]).to_numpy() if len(df) else []
+    frame[RECORD_KEY_COLUMN] = identity_key(df).to_numpy() if len(df) else []
+    frame[RUN_LABEL_COLUMN] = run_label
+    return frame
+
+
+def _ensure_history_table(conn: sqlite3.Connection, table: str, columns: list[str]) -> None:
+    column_defs = [
+        f"{_quote(c)} TEXT PRIMARY KEY" if c == RECORD_KEY_COLUMN else f"{_quote(c)} TEXT" for c in columns
+    ]
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({', '.join(column_defs)})")
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")}
+    for col in columns:
+        if col not in existing:
+            conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(col)} TEXT")
+
+
+def _insert_sql(table: str, columns: list[str]) -> str:
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {_quote(table)} ({', '.join(_quote(c) for c in columns)}) VALUES ({placeholders})"
+
+
+def _upsert_sql(table: str, columns: list[str]) -> str:
+    updates = ", ".join(f"{_quote(c)} = excluded.{_quote(c)}" for c in columns if c != RECORD_KEY_COLUMN)
+    return f"{_insert_sql(table, columns)} ON CONFLICT({_quote(RECORD_KEY_COLUMN)}) DO UPDATE SET {updates}"
+
+
+def _rows(frame: pd.DataFrame) -> Iterator[tuple]:
+    return frame.itertuples(index=False, name=None)
+
+
+def _batches(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    batch: list[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sanitize(text: str) -> str:
+    return re.sub(r"\W+", "_", str(text)).strip("_").lower()
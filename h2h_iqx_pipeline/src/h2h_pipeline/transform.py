@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Any, Dict, Mapping, Set
+from typing import Any, Callable, Dict, Mapping, Set
 
 import logging
 import pandas as pd
@@ -15,40 +15,43 @@ from .constants import (
     EMAIL_COLUMN,
     END_DATE_COLUMN,
     EXTERNAL_IDENTIFIER_COLUMN,
-    FIRST_NAME_COLUMN,
     INDUSTRY_COLUMN,
     INTERNAL_COMMENT_COLUMN,
-    LAST_NAME_COLUMN,
     LOCATION_RADIUS_COLUMN,
     PHONE_COLUMN,
     PROFESSION_COLUMN,
+    REQUIRED_COLUMNS,
     SERVICE_BRANCH_COLUMN,
     SUMMARY_NOTES_COLUMN,
     TALENT_PRICE_CATEGORY_COLUMN,
     ZIP_COLUMN,
 )
-from .models import TransformResult, ValidationReport
+from .cancellation import CHECK_EVERY_ROWS, CancelCheck
+from .config_loader import compile_plan
+from .instrumentation import ProgressCallback
+from .models import RunPlan, TransformResult, ValidationReport
 from .utils.dates import parse_date, parse_month, resolve_run_date_value
-from .utils.mappings import load_yaml_mapping
 
 logger = logging.getLogger(__name__)
 
-REQUIRED_COLUMNS = [
-    LAST_NAME_COLUMN,
-    FIRST_NAME_COLUMN,
-    EMAIL_COLUMN,
-    PHONE_COLUMN,
-    ZIP_COLUMN,
-    PROFESSION_COLUMN,
-    SERVICE_BRANCH_COLUMN,
-]
-
-
-def build_combo(month: str, raw_data: Dict[str, pd.DataFrame], config: Mapping[str, Any]) -> TransformResult:
-    """Transform raw source frames into a unified Combo DataFrame."""
+def build_combo(
+    month: str,
+    raw_data: Dict[str, pd.DataFrame],
+    config: Mapping[str, Any],
+    check: CancelCheck | None = None,
+    run_plan: RunPlan | None = None,
+    progress: ProgressCallback | None = None,
+) -> TransformResult:
+    """Transform raw source frames into a unified Combo DataFrame.
+
+    ``check`` is called between steps and inside the per-row formatting loops,
+    which also report ``progress`` every :data:`CHECK_EVERY_ROWS` rows.
+    Profession and service branch mappings come from ``run_plan`` (compiled from
+    ``config`` when not given), so chunked runs parse them once, not per chunk.
+    """
     column_order = config.get("iqx_import", {}).get("column_order", [])
     defaults = config.get("defaults", {})
-    mappings = _load_mappings(config)
+    mappings = (run_plan if run_plan is not None else compile_plan(config)).mappings
 
     validation = ValidationReport()
 
@@ -67,10 +70,18 @@ def build_combo(month: str, raw_data: Dict[str, pd.DataFrame], config: Mapping[s
     email_series = _series_or_empty(combined, EMAIL_COLUMN).str.strip().str.lower()
     combined[EMAIL_COLUMN] = email_series
 
+    # Each row goes through both formatting loops; each loop covers half of the reported rows.
+    rows = len(combined)
+    phone_progress = zip_progress = None
+    if progress:
+        phone_progress = lambda position: progress(position // 2, rows)  # noqa: E731
+        zip_progress = lambda position: progress((rows + position) // 2, rows)  # noqa: E731
     phone_series = _series_or_empty(combined, PHONE_COLUMN)
-    combined[PHONE_COLUMN] = _format_phone_series(phone_series, validation)
+    combined[PHONE_COLUMN] = _format_phone_series(phone_series, validation, check, phone_progress)
     zip_series = _series_or_empty(combined, ZIP_COLUMN)
-    combined[ZIP_COLUMN] = _format_zip_series(zip_series, validation)
+    combined[ZIP_COLUMN] = _format_zip_series(zip_series, validation, check, zip_progress)
+    if progress:
+        progress(rows, rows)
     profession_series = _series_or_empty(combined, PROFESSION_COLUMN)
     combined[PROFESSION_COLUMN] = profession_series.map(
         _mapper_with_tracking(mappings.get("professions", {}), validation.missing_profession_mappings)
@@ -81,6 +92,9 @@ def build_combo(month: str, raw_data: Dict[str, pd.DataFrame], config: Mapping[s
         _service_mapper_with_tracking(mappings.get("service_branches", {}), validation.missing_service_branch_mappings)
     )
 
+    if check is not None:
+        check()
+
     # Defaults and computed dates
     combined[LOCATION_RADIUS_COLUMN] = defaults.get("location_radius", defaults.get("location_radius_miles", 100))
     combined[INDUSTRY_COLUMN] = defaults.get("industry", "")
@@ -89,9 +103,7 @@ def build_combo(month: str, raw_data: Dict[str, pd.DataFrame], config: Mapping[s
         defaults.get("pay_scale", ""),
     )
 
-    date_format = _resolve_date_format(config, defaults)
-    base_date = _resolve_base_date(month, combined, config)
-    date_available, end_date = _compute_dates(base_date, defaults, date_format)
+    date_available, end_date = run_dates(month, combined, config)
     combined[DATE_AVAILABLE_COLUMN] = date_available
     combined[END_DATE_COLUMN] = end_date
 
@@ -141,15 +153,15 @@ def build_combo(month: str, raw_data: Dict[str, pd.DataFrame], config: Mapping[s
     return TransformResult(combo_df=combined, validation=validation)
 
 
-def _load_mappings(config: Mapping[str, Any]) -> Dict[str, Dict[str, str]]:
-    result: Dict[str, Dict[str, str]] = {}
-    mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
-    for key in ("professions", "service_branches", "source_priority"):
-        result[key] = load_yaml_mapping(mapping_cfg.get(key), logger)
-    return result
+def run_dates(month: str, df: pd.DataFrame, config: Mapping[str, Any]) -> tuple[str, str]:
+    """Return the formatted date_available and end_date for a run over ``df``'s rows."""
+    defaults = config.get("defaults", {})
+    date_format = _resolve_date_format(config, defaults)
+    base_date = _resolve_base_date(month, df, config)
+    return _compute_dates(base_date, defaults, date_format)
 
 
-def _mapper_with_tracking(mapping: Dict[str, str], missing_set: Set[str]):
+def _mapper_with_tracking(mapping: Mapping[str, str], missing_set: Set[str]):
     def mapper(raw: Any) -> str:
         key = str(raw).strip()
         if not key:
@@ -162,7 +174,7 @@ def _mapper_with_tracking(mapping: Dict[str, str], missing_set: Set[str]):
     return mapper
 
 
-def _service_mapper_with_tracking(mapping: Dict[str, str], missing_set: Set[str]):
+def _service_mapper_with_tracking(mapping: Mapping[str, str], missing_set: Set[str]):
     def mapper(raw: Any) -> str:
         key = str(raw).strip()
         if not key:
@@ -175,9 +187,19 @@ def _service_mapper_with_tracking(mapping: Dict[str, str], missing_set: Set[str]
     return mapper
 
 
-def _format_phone_series(series: pd.Series, validation: ValidationReport) -> pd.Series:
+def _format_phone_series(
+    series: pd.Series,
+    validation: ValidationReport,
+    check: CancelCheck | None = None,
+    progress: Callable[[int], None] | None = None,
+) -> pd.Series:
     formatted = []
-    for idx, raw in series.items():
+    for position, (idx, raw) in enumerate(series.items()):
+        if position % CHECK_EVERY_ROWS == 0:
+            if check is not None:
+                check()
+            if progress is not None:
+                progress(position)
         digits = "".join(ch for ch in str(raw) if ch.isdigit())
         if len(digits) == 11 and digits.startswith("1"):
             digits = digits[1:]
@@ -190,9 +212,19 @@ def _format_phone_series(series: pd.Series, validation: ValidationReport) -> pd.
     return pd.Series(formatted, index=series.index)
 
 
-def _format_zip_series(series: pd.Series, validation: ValidationReport) -> pd.Series:
+def _format_zip_series(
+    series: pd.Series,
+    validation: ValidationReport,
+    check: CancelCheck | None = None,
+    progress: Callable[[int], None] | None = None,
+) -> pd.Series:
     formatted = []
-    for idx, raw in series.items():
+    for position, (idx, raw) in enumerate(series.items()):
+        if position % CHECK_EVERY_ROWS == 0:
+            if check is not None:
+                check()
+            if progress is not None:
+                progress(position)
         digits = "".join(ch for ch in str(raw) if ch.isdigit())
         if len(digits) >= 5:
             formatted_zip = digits[:5]
@@ -0,0 +1,241 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+from urllib.parse import urlsplit
+
+import csv
+import hashlib
+import http.client
+import io
+import json
+import logging
+import queue
+import threading
+import time
+
+from .models import UploadResult
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def upload_outputs(export_paths: Mapping[str, Path], config: Mapping[str, Any]) -> UploadResult | None:
+    """Post the IQX CSV to the configured bulk import endpoint when upload is enabled."""
+    upload_cfg = config.get("upload", {}) if isinstance(config, Mapping) else {}
+    if not upload_cfg.get("enabled"):
+        return None
+    url = upload_cfg.get("url")
+    if not url:
+        logger.warning("Upload enabled but upload.url is not set; skipping upload.")
+        return None
+    csv_path = export_paths.get("iqx_csv")
+    if csv_path is None or not Path(csv_path).exists():
+        logger.warning("Upload enabled but no IQX CSV was written; skipping upload.")
+        return None
+    return upload_csv(Path(csv_path), url, upload_cfg)
+
+
+def upload_csv(csv_path: Path, url: str, upload_cfg: Mapping[str, Any] | None = None) -> UploadResult:
+    """Upload a CSV in parts over pooled keep-alive connections.
+
+    Parts are posted by a bounded number of worker threads, retried with
+    exponential backoff on transient failures, and recorded in a checkpoint
+    file next to the CSV so an interrupted upload resumes with the parts that
+    are still missing.
+    """
+    upload_cfg = upload_cfg or {}
+    rows_per_part = max(1, int(upload_cfg.get("rows_per_part", 5000)))
+    concurrency = max(1, int(upload_cfg.get("max_concurrency", 4)))
+    max_retries = max(0, int(upload_cfg.get("max_retries", 3)))
+    backoff = float(upload_cfg.get("backoff_seconds", 1.0))
+    timeout = float(upload_cfg.get("timeout_seconds", 60))
+    headers = {str(k): str(v) for k, v in (upload_cfg.get("headers") or {}).items()}
+
+    content = csv_path.read_bytes()
+    source_hash = hashlib.sha256(content).hexdigest()
+    parts, rows = _split_csv(content.decode("utf-8"), rows_per_part)
+
+    checkpoint_path = csv_path.with_name(f".{csv_path.name}.upload.json")
+    checkpoint = _load_checkpoint(checkpoint_path, source_hash, url)
+    completed: set[int] = set(checkpoint["completed"])
+    pending = [idx for idx in range(len(parts)) if idx not in completed]
+
+    result = UploadResult(
+        url=url,
+        parts_total=len(parts),
+        parts_resumed=len(parts) - len(pending),
+        rows=rows,
+    )
+    if not pending:
+        logger.info("All %s parts of %s already uploaded to %s", len(parts), csv_path.name, url)
+        return result
+
+    pool = ConnectionPool(url, size=concurrency, timeout=timeout)
+    lock = threading.Lock()
+
+    def send(idx: int) -> None:
+        part_headers = {
+            **headers,
+            "Content-Type": "text/csv; charset=utf-8",
+            "X-Part-Index": str(idx),
+            "X-Part-Count": str(len(parts)),
+            "Idempotency-Key": f"{source_hash[:16]}-{idx}",
+        }
+        body = parts[idx]
+        try:
+            latency = _post_with_retry(pool, body, part_headers, max_retries, backoff)
+        except UploadError as exc:
+            logger.error("Upload of part %s/%s failed: %s", idx + 1, len(parts), exc)
+            with lock:
+                result.failed_parts.append(idx)
+            return
+        with lock:
+            result.latencies.append(latency)
+            result.parts_uploaded += 1
+            result.bytes_sent += len(body)
+            completed.add(idx)
+            _save_checkpoint(checkpoint_path, source_hash, url, completed)
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(send, pending))
+    finally:
+        pool.close()
+    result.seconds = time.perf_counter() - started
+    result.failed_parts.sort()
+
+    logger.info(
+        "Uploaded %s/%s parts of %s to %s in %.2fs (%s resumed, %s failed)",
+        result.parts_uploaded + result.parts_resumed,
+        result.parts_total,
+        csv_path.name,
+        url,
+        result.seconds,
+        result.parts_resumed,
+        len(result.failed_parts),
+    )
+    return result
+
+
+class UploadError(RuntimeError):
+    """Raised when a part cannot be uploaded after all retries."""
+
+
+class ConnectionPool:
+    """Small pool of persistent HTTP connections to a single host."""
+
+    def __init__(self, url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported upload URL scheme: {url}")
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path = f"{self.path}?{parts.query}"
+        self._scheme = parts.scheme
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.opened += 1
+            conn_cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            return conn_cls(self._host, self._port, timeout=self._timeout)
+
+    def release(self, conn: http.client.HTTPConnection, reuse: bool = True) -> None:
+        if not reuse:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _post_with_retry(
+    pool: ConnectionPool, body: bytes, headers: Mapping[str, str], max_retries: int, backoff: float
+) -> float:
+    last_error = ""
+    for attempt in range(max_retries + 1):
+        if attempt:
+            time.sleep(backoff * (2 ** (attempt - 1)))
+        conn = pool.acquire()
+        started = time.perf_counter()
+        try:
+            conn.request("POST", pool.path, body=body, headers=dict(headers))
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            pool.release(conn, reuse=False)
+            last_error = str(exc) or exc.__class__.__name__
+            continue
+        latency = time.perf_counter() - started
+        pool.release(conn, reuse=not response.will_close)
+        if 200 <= response.status < 300:
+            return latency
+        last_error = f"HTTP {response.status} {response.reason}"
+        if response.status not in RETRY_STATUSES:
+            break
+    raise UploadError(last_error)
+
+
+def _split_csv(text: str, rows_per_part: int) -> tuple[List[bytes], int]:
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, None)
+    if header is None:
+        return [], 0
+    parts: List[bytes] = []
+    rows = 0
+    buffer: List[List[str]] = []
+    for row in reader:
+        buffer.append(row)
+        rows += 1
+        if len(buffer) >= rows_per_part:
+            parts.append(_encode_part(header, buffer))
+            buffer = []
+    if buffer or not parts:
+        parts.append(_encode_part(header, buffer))
+    return parts, rows
+
+
+def _encode_part(header: List[str], rows: List[List[str]]) -> bytes:
+    out = io.StringIO(newline="")
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    return out.getvalue().encode("utf-8")
+
+
+def _load_checkpoint(path: Path, source_hash: str, url: str) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, Mapping) or data.get("source_hash") != source_hash or data.get("url") != url:
+        return {"completed": []}
+    return {"completed": [int(idx) for idx in data.get("completed", [])]}
+
+
+def _save_checkpoint(path: Path, source_hash: str, url: str, completed: set[int]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    payload = {"source_hash": source_hash, "url": url, "completed": sorted(completed)}
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as exc:  # pragma: no cover - best effort
+        logger.warning("Failed to write upload checkpoint %s: %s", path, exc)
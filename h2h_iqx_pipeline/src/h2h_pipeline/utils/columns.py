@@ -0,0 +1,60 @@
+from ..constants import (
+    CREATE_DATE_COLUMN,
+    EMAIL_COLUMN,
+    EXTERNAL_IDENTIFIER_COLUMN,
+    FIRST_NAME_COLUMN,
+    LAST_NAME_COLUMN,
+    PHONE_COLUMN,
+    PROFESSION_COLUMN,
+    SERVICE_BRANCH_COLUMN,
+    SOURCE_CODE_COLUMN,
+    SOURCE_COLUMN,
+    ZIP_COLUMN,
+)
+
+# Maps normalized column tokens to canonical names
+CANONICAL_COLUMN_MAP = {
+    "record id": EXTERNAL_IDENTIFIER_COLUMN,
+    "record_id": EXTERNAL_IDENTIFIER_COLUMN,
+    "external identifier": EXTERNAL_IDENTIFIER_COLUMN,
+    "external_identifier": EXTERNAL_IDENTIFIER_COLUMN,
+    "last name": LAST_NAME_COLUMN,
+    "lastname": LAST_NAME_COLUMN,
+    "last_name": LAST_NAME_COLUMN,
+    "first name": FIRST_NAME_COLUMN,
+    "firstname": FIRST_NAME_COLUMN,
+    "first_name": FIRST_NAME_COLUMN,
+    "email": EMAIL_COLUMN,
+    "email address": EMAIL_COLUMN,
+    "email_address": EMAIL_COLUMN,
+    "phone": PHONE_COLUMN,
+    "phone number": PHONE_COLUMN,
+    "mobile phone number": PHONE_COLUMN,
+    "phone_number": PHONE_COLUMN,
+    "zip": ZIP_COLUMN,
+    "zipcode": ZIP_COLUMN,
+    "zip code": ZIP_COLUMN,
+    "postal": ZIP_COLUMN,
+    "postal code": ZIP_COLUMN,
+    "profession": PROFESSION_COLUMN,
+    "trade of interest": PROFESSION_COLUMN,
+    "service branch": SERVICE_BRANCH_COLUMN,
+    "branch of service": SERVICE_BRANCH_COLUMN,
+    "service": SERVICE_BRANCH_COLUMN,
+    "create date": CREATE_DATE_COLUMN,
+    "create_date": CREATE_DATE_COLUMN,
+    "source": SOURCE_COLUMN,
+    "external source": SOURCE_COLUMN,
+    "external_source": SOURCE_COLUMN,
+    "external source code": SOURCE_CODE_COLUMN,
+    "external_source_code": SOURCE_CODE_COLUMN,
+}
+
+
+def canonical_column(name: object) -> object:
+    """Return the canonical column name for a source header, or the header unchanged."""
+    return CANONICAL_COLUMN_MAP.get(normalize_token(name), name) if isinstance(name, str) else name
+
+
+def normalize_token(text: str) -> str:
+    return text.strip().lower().replace("-", " ").replace("_", " ")
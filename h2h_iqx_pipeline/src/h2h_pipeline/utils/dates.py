@@ -10,6 +10,28 @@ def parse_month(month_str: str) -> datetime:
         return datetime.strptime(month_str, "%Y-%m-%d")
 
 
+def month_range(start: str, end: str) -> list[str]:
+    """Return every YYYY-MM month from ``start`` to ``end`` inclusive."""
+    first = parse_month(start)
+    last = parse_month(end)
+    if first > last:
+        raise ValueError(f"Month range start {start} is after end {end}.")
+    months = []
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def previous_month(month_str: str) -> str:
+    """Return the YYYY-MM month before ``month_str``."""
+    current = parse_month(month_str)
+    if current.month == 1:
+        return f"{current.year - 1:04d}-12"
+    return f"{current.year:04d}-{current.month - 1:02d}"
+
+
 def parse_date(date_str: str) -> datetime:
     """Parse a run/output date in YYYY-MM-DD or YYYY-MM format."""
     try:
@@ -1,20 +1,142 @@
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+import hashlib
+import json
 import logging
+import os
+import threading
 
-import yaml
+logger = logging.getLogger(__name__)
+
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+# Written into each sidecar; sidecars from another layout version are ignored.
+SIDECAR_VERSION = 1
+SIDECAR_SUFFIX = ".cache.json"
+
+
+class MappingRegistry:
+    """Process-wide cache of parsed mapping files.
+
+    Entries are keyed by resolved path and re-parsed only when the file's
+    modification time or size changes, so watch, service and batch runs
+    read each mapping file once until it is edited. Mappings are returned
+    as read-only views shared by every caller; forked worker processes
+    inherit the entries parsed before the fork. Safe to use from several
+    threads. A new process parses a file from its JSON sidecar when the file
+    is unchanged since the sidecar was written (see :func:`_parse`).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple[tuple[int, int], Any]] = {}
+
+    def get(self, path_val: str | Path | None, logger: logging.Logger | None = None) -> Mapping[str, Any]:
+        if not path_val:
+            return EMPTY_MAPPING
+        path = Path(path_val).resolve()
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            self.invalidate(path)
+            if logger:
+                logger.warning("Mapping file %s missing", path_val)
+            return EMPTY_MAPPING
+        state = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == state:
+                return entry[1]
+            data = _parse(path)
+            self._entries[key] = (state, data)
+            return data
+
+    def invalidate(self, path_val: str | Path | None = None) -> None:
+        """Forget one mapping file (or all of them) so the next :meth:`get` re-parses it."""
+        with self._lock:
+            if path_val is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(path_val).resolve()), None)
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock at fork time; the entries are still valid.
+        self._lock = threading.Lock()
+
+
+registry = MappingRegistry()
 
 
 def load_yaml_mapping(
     path_val: str | Path | None,
     logger: logging.Logger | None = None,
-) -> dict[str, Any]:
-    if not path_val:
-        return {}
-    path = Path(path_val)
-    if not path.exists():
-        if logger:
-            logger.warning("Mapping file %s missing", path)
-        return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+) -> Mapping[str, Any]:
+    """Return the parsed mapping file as a shared read-only view (see :class:`MappingRegistry`)."""
+    return registry.get(path_val, logger)
+
+
+def sidecar_path(path: Path) -> Path:
+    """Where the compiled copy of a mapping file is kept: ``professions.yml.cache.json``."""
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _parse(path: Path) -> Any:
+    """Parse ``path``, from its JSON sidecar when that was written for the same file contents.
+
+    The YAML parse (with libyaml's ``CSafeLoader`` when PyYAML has it) only
+    happens when the sidecar is missing or stale; flat mappings are then
+    written to a fresh sidecar for the next process. A sidecar that cannot
+    be written (read-only folder) is skipped.
+    """
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    sidecar = sidecar_path(path)
+    data = _read_sidecar(sidecar, digest)
+    if data is None:
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(raw.decode("utf-8"), Loader=loader) or {}
+        if _is_flat_mapping(data):
+            _write_sidecar(sidecar, digest, data)
+    return MappingProxyType(data) if isinstance(data, dict) else data
+
+
+def _read_sidecar(sidecar: Path, digest: str) -> Any:
+    try:
+        with sidecar.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != SIDECAR_VERSION:
+        return None
+    if payload.get("sha256") != digest or not isinstance(payload.get("data"), dict):
+        return None
+    return payload["data"]
+
+
+def _write_sidecar(sidecar: Path, digest: str, data: Mapping[str, Any]) -> None:
+    temp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temp.open("w", encoding="utf-8") as handle:
+            json.dump({"version": SIDECAR_VERSION, "sha256": digest, "data": data}, handle, ensure_ascii=False)
+        os.replace(temp, sidecar)
+    except OSError as exc:
+        logger.debug("Could not write mapping sidecar %s: %s", sidecar, exc)
+        try:
+            temp.unlink()
+        except OSError:
+            pass
+
+
+def _is_flat_mapping(data: Any) -> bool:
+    # Only what JSON gives back unchanged: string keys and scalar values.
+    return isinstance(data, dict) and all(
+        isinstance(key, str) and (value is None or isinstance(value, (str, int, float, bool)))
+        for key, value in data.items()
+    )
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry._reset_after_fork)
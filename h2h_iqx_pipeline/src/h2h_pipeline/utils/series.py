@@ -2,6 +2,8 @@ from typing import Any, Callable, Iterable
 
 import pandas as pd
 
+from ..constants import EMAIL_COLUMN, FIRST_NAME_COLUMN, LAST_NAME_COLUMN, PHONE_COLUMN, ZIP_COLUMN
+
 
 def digits_only(value: Any) -> str:
     return "".join(ch for ch in str(value) if ch.isdigit())
@@ -28,3 +30,22 @@ def combine_keys(series_list: Iterable[pd.Series]) -> pd.Series:
     has_any = (frame != "").any(axis=1)
     combined[~has_any] = ""
     return combined
+
+
+def identity_key(df: pd.DataFrame) -> pd.Series:
+    """Return one record key per row: email, else phone digits, else name+zip.
+
+    Keys are prefixed with their kind so values from different identifiers
+    never collide. Rows with no identifiers get an empty key.
+    """
+    email = normalize_series(df, EMAIL_COLUMN, lambda v: str(v).strip().lower())
+    phone = normalize_series(df, PHONE_COLUMN, digits_only)
+    last = normalize_series(df, LAST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    first = normalize_series(df, FIRST_NAME_COLUMN, lambda v: str(v).strip().lower())
+    zip_code = normalize_series(df, ZIP_COLUMN, lambda v: str(v).strip())
+    name_zip = combine_keys([last, first, zip_code])
+
+    key = ("name_zip:" + name_zip).where(name_zip != "", "")
+    key = ("phone:" + phone).where(phone != "", key)
+    key = ("email:" + email).where(email != "", key)
+    return key
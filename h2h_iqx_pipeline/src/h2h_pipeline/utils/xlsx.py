@@ -0,0 +1,176 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+import posixpath
+import re
+import zipfile
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+@dataclass
+class SheetPreview:
+    """Header, leading rows, and data row count of the first worksheet."""
+
+    header: List[str]
+    rows: Optional[int]
+    sample: List[List[str]] = field(default_factory=list)
+    row_count_basis: str = "dimension"
+
+
+def read_sheet_preview(path: Path, sample_rows: int = 0) -> SheetPreview:
+    """Read the header row, ``sample_rows`` data rows, and the row count of an xlsx.
+
+    The worksheet XML is streamed and abandoned once the sample is read; the
+    row count comes from the ``<dimension>`` element when present and from
+    counting ``<row>`` elements otherwise. Shared strings are only decoded up
+    to the highest index the header and sample refer to.
+    """
+    with zipfile.ZipFile(path) as archive:
+        sheet_name = _first_sheet_path(archive)
+        raw_rows, dimension_rows = _read_leading_rows(archive, sheet_name, sample_rows + 1)
+        basis = "dimension"
+        if dimension_rows is None:
+            dimension_rows = _count_rows(archive, sheet_name)
+            basis = "scan"
+        wanted = [int(value) for row in raw_rows for kind, value in row if kind == "s"]
+        shared = _read_shared_strings(archive, max(wanted) if wanted else -1)
+
+    rows = [[shared.get(int(value), "") if kind == "s" else value for kind, value in row] for row in raw_rows]
+    header = [cell.strip() for cell in rows[0]] if rows else []
+    while header and not header[-1]:
+        header.pop()
+    data_rows = None if dimension_rows is None else max(0, dimension_rows - (1 if rows else 0))
+    return SheetPreview(header=header, rows=data_rows, sample=rows[1:], row_count_basis=basis)
+
+
+def sheet_row_count(path: Path) -> Optional[int]:
+    """Data row count from the first worksheet's ``<dimension>``, or None if not recorded.
+
+    Unlike :func:`read_sheet_preview` this never scans the sheet, so it is
+    cheap enough to call before every full read.
+    """
+    with zipfile.ZipFile(path) as archive:
+        raw_rows, dimension_rows = _read_leading_rows(archive, _first_sheet_path(archive), 1)
+    if dimension_rows is None:
+        return None
+    return max(0, dimension_rows - (1 if raw_rows else 0))
+
+
+def _first_sheet_path(archive: zipfile.ZipFile) -> str:
+    try:
+        workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+        rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    except KeyError:
+        return "xl/worksheets/sheet1.xml"
+    sheet = workbook.find(f"{{{MAIN_NS}}}sheets/{{{MAIN_NS}}}sheet")
+    rel_id = sheet.get(f"{{{REL_NS}}}id") if sheet is not None else None
+    for rel in rels.iter(f"{{{PACKAGE_REL_NS}}}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", target))
+    return "xl/worksheets/sheet1.xml"
+
+
+def _read_leading_rows(
+    archive: zipfile.ZipFile, sheet_name: str, limit: int
+) -> Tuple[List[List[Tuple[str, str]]], Optional[int]]:
+    rows: List[List[Tuple[str, str]]] = []
+    dimension_rows: Optional[int] = None
+    with archive.open(sheet_name) as handle:
+        for _event, elem in ElementTree.iterparse(handle, events=("end",)):
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if tag == "dimension":
+                dimension_rows = _rows_from_dimension(elem.get("ref", ""))
+            elif tag == "row":
+                rows.append(_row_cells(elem))
+                elem.clear()
+                if len(rows) >= limit:
+                    break
+    return rows, dimension_rows
+
+
+def _row_cells(row: ElementTree.Element) -> List[Tuple[str, str]]:
+    cells: List[Tuple[str, str]] = []
+    for cell in row.iter(f"{{{MAIN_NS}}}c"):
+        column = _column_index(cell.get("r", ""))
+        if column is not None:
+            while len(cells) < column:
+                cells.append(("str", ""))
+        kind = cell.get("t", "n")
+        if kind == "inlineStr":
+            inline = cell.find(f"{{{MAIN_NS}}}is")
+            cells.append(("str", _rich_text(inline) if inline is not None else ""))
+            continue
+        value = cell.find(f"{{{MAIN_NS}}}v")
+        text = value.text if value is not None and value.text is not None else ""
+        cells.append(("s" if kind == "s" and text else "str", text))
+    return cells
+
+
+def _column_index(ref: str) -> Optional[int]:
+    match = _CELL_REF.match(ref)
+    if not match:
+        return None
+    index = 0
+    for char in match.group(1):
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index - 1
+
+
+def _rows_from_dimension(ref: str) -> Optional[int]:
+    parts = ref.split(":")
+    first = _CELL_REF.match(parts[0])
+    last = _CELL_REF.match(parts[-1])
+    # Writers that do not track the used range emit a single "A1"; treat it as unknown.
+    if not first or not last or len(parts) == 1:
+        return None
+    return int(last.group(2)) - int(first.group(2)) + 1
+
+
+def _count_rows(archive: zipfile.ZipFile, sheet_name: str) -> int:
+    count = 0
+    with archive.open(sheet_name) as handle:
+        for _event, elem in ElementTree.iterparse(handle, events=("end",)):
+            if elem.tag.rsplit("}", 1)[-1] == "row":
+                count += 1
+                elem.clear()
+    return count
+
+
+def _read_shared_strings(archive: zipfile.ZipFile, max_index: int) -> Dict[int, str]:
+    strings: Dict[int, str] = {}
+    if max_index < 0:
+        return strings
+    try:
+        handle = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return strings
+    with handle:
+        for idx, item in enumerate(_string_items(handle)):
+            strings[idx] = item
+            if idx >= max_index:
+                break
+    return strings
+
+
+def _string_items(handle) -> Iterator[str]:
+    for _event, elem in ElementTree.iterparse(handle, events=("end",)):
+        if elem.tag == f"{{{MAIN_NS}}}si":
+            yield _rich_text(elem)
+            elem.clear()
+
+
+def _rich_text(elem: ElementTree.Element) -> str:
+    # Plain <t> and rich-text runs <r><t>; phonetic hints (<rPh>) are skipped.
+    parts = [elem.findtext(f"{{{MAIN_NS}}}t") or ""]
+    parts.extend(run.findtext(f"{{{MAIN_NS}}}t") or "" for run in elem.findall(f"{{{MAIN_NS}}}r"))
+    return "".join(parts)
@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Any, Mapping
+
+import importlib
+import logging
+import time
+
+from .config_loader import load_config
+from .models import WarmupResult
+from .process_runner import WarmWorker, gui_backend
+from .utils.mappings import load_yaml_mapping
+
+# Nothing heavy is imported at module level: warm_up exists to import it in
+# the background, after the GUI window is already on screen.
+
+logger = logging.getLogger(__name__)
+
+# Imported by warm_up; together they pull in pandas, numpy, openpyxl, yaml and
+# dateutil, which make up most of the delay before a cold run reads its first row.
+WARM_MODULES = ("openpyxl", "h2h_pipeline.pipeline")
+
+
+def warm_up(config_path: Path | str | None = None) -> WarmupResult:
+    """Import the pipeline and load ``config_path`` and its mapping files.
+
+    Run on a background thread (or in a pre-started pipeline process, see
+    :class:`~h2h_pipeline.process_runner.WarmWorker`) so the first run does
+    not pay for it; the parsed mapping files stay in the process's mapping
+    registry for the runs that follow. Never raises: a config that fails to load or validate is
+    reported in ``error`` so the GUI can show it before Run is pressed.
+    """
+    started = time.perf_counter()
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    result = WarmupResult(import_seconds=time.perf_counter() - started)
+
+    if config_path:
+        result.config_path = Path(config_path)
+        try:
+            result.mappings = _load_mappings(load_config(result.config_path))
+        except Exception as exc:
+            result.error = str(exc) or exc.__class__.__name__
+            logger.warning("Warm-up could not load config %s: %s", config_path, result.error)
+
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _load_mappings(config: Mapping[str, Any]) -> int:
+    mapping_cfg = config.get("mappings", {}) if isinstance(config, Mapping) else {}
+    loaded = 0
+    for key, path in mapping_cfg.items():
+        if not isinstance(load_yaml_mapping(path, logger), Mapping):
+            raise ValueError(f"Mapping file for '{key}' must be a mapping: {path}")
+        loaded += 1
+    return loaded
+
+
+def start_worker(config_path: Path | str | None = None) -> WarmWorker | None:
+    """Start the pipeline process the GUIs' next run will use, warming up on ``config_path``.
+
+    Returns ``None`` when the config runs the pipeline inside the GUI process
+    (``execution.gui_backend: thread``); call :func:`warm_up` there instead.
+    """
+    backend = "process"
+    if config_path and Path(config_path).exists():
+        try:
+            backend = gui_backend(load_config(Path(config_path)))
+        except Exception:
+            pass  # reported by the warm-up itself
+    return WarmWorker(config_path) if backend == "process" else None
@@ -0,0 +1,161 @@
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+import logging
+import threading
+
+import pandas as pd
+
+from . import file_discovery
+from .checkpoint import MemoryCheckpointStore
+from .config_loader import load_config
+from .models import RunResult
+from .pipeline import run_pipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 5.0
+
+FileStates = Dict[str, tuple]
+
+
+class Watcher:
+    """Keep a warm pipeline process and re-run it when its inputs change.
+
+    The watcher polls the month's source files, the previous Combo, the
+    config file, and the mapping files. A change is processed once the file
+    states are identical on two consecutive polls, so exports that are still
+    being written are not picked up half-finished. Parsed source frames and
+    stage checkpoints stay in memory, so a run only repeats the stages whose
+    inputs changed. Config edits are reloaded in place; an invalid config is
+    logged and the previous one is kept.
+    """
+
+    def __init__(
+        self,
+        config_path: Path,
+        input_root: Path,
+        month: Optional[str] = None,
+        overrides: Optional[Mapping[str, Any]] = None,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+    ) -> None:
+        self.config_path = Path(config_path)
+        self.input_root = Path(input_root)
+        self.overrides = dict(overrides or {})
+        self.interval = interval
+        self.config = load_config(self.config_path, overrides=self.overrides)
+        self._fixed_month = month
+        self.store = MemoryCheckpointStore()
+        self.frame_cache: Dict[tuple, pd.DataFrame] = {}
+        self.runs = 0
+        self.last_result: Optional[RunResult] = None
+        self._config_state = _state(self.config_path)
+        self._processed: Optional[FileStates] = None
+        self._pending: Optional[FileStates] = None
+
+    @property
+    def month(self) -> str:
+        if self._fixed_month:
+            return self._fixed_month
+        run_cfg = self.config.get("run", {}) if isinstance(self.config, Mapping) else {}
+        return str(run_cfg.get("current_month") or date.today().strftime("%Y-%m"))
+
+    def poll_once(self) -> Optional[RunResult]:
+        """Check inputs once; run the pipeline if a settled change is found."""
+        self._reload_config_if_changed()
+        states = self._input_states()
+        if states == self._processed:
+            self._pending = None
+            return None
+        if states != self._pending:
+            # First sighting (or still changing): wait one more poll for it to settle.
+            self._pending = states
+            if self._processed is not None:
+                logger.info("Detected input changes for %s; waiting for files to settle", self.month)
+                return None
+        self._pending = None
+        self._processed = states
+        if not any(key.startswith("source:") for key in states):
+            logger.info("No source files for %s yet; waiting", self.month)
+            return None
+        return self._run()
+
+    def serve_forever(self, stop: Optional[threading.Event] = None) -> None:
+        stop = stop or threading.Event()
+        logger.info("Watching %s for %s every %.1fs", self.input_root, self.month, self.interval)
+        while not stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("Watch iteration failed; will retry")
+            stop.wait(self.interval)
+
+    def _run(self) -> RunResult:
+        self.runs += 1
+        result = run_pipeline(
+            month=self.month,
+            input_root=self.input_root,
+            config=self.config,
+            checkpoints=self.store,
+            frame_cache=self.frame_cache,
+        )
+        cached = [span.stage for span in result.spans if span.phase == "end" and span.cached]
+        logger.info(
+            "Watch run %s for %s finished (reused: %s)", self.runs, result.run_label, ", ".join(cached) or "none"
+        )
+        self.last_result = result
+        return result
+
+    def _reload_config_if_changed(self) -> None:
+        state = _state(self.config_path)
+        if state == self._config_state:
+            return
+        self._config_state = state
+        try:
+            config = load_config(self.config_path, overrides=self.overrides)
+        except Exception as exc:
+            logger.error("Config reload failed; keeping previous config: %s", exc)
+            return
+        self.config = config
+        logger.info("Reloaded config from %s", self.config_path)
+
+    def _input_states(self) -> FileStates:
+        # Cheaper and quieter than full discovery: every workbook in the month
+        # folder counts, so a new export is seen even before its pattern matches.
+        states: FileStates = {"config": _state(self.config_path)}
+        for path in self._candidate_sources():
+            states[f"source:{path}"] = _state(path)
+        previous_combo = file_discovery.find_previous_combo(self.input_root, self.config)
+        if previous_combo:
+            states["previous_combo"] = _state(previous_combo)
+        mapping_cfg = self.config.get("mappings", {}) if isinstance(self.config, Mapping) else {}
+        for key, path in mapping_cfg.items():
+            if path:
+                states[f"mapping:{key}"] = _state(Path(path))
+        return states
+
+    def _candidate_sources(self) -> list[Path]:
+        month_dir = file_discovery.find_month_dir(self.input_root, self.month)
+        if month_dir is not None:
+            candidates = set(month_dir.glob("*.xlsx"))
+        else:
+            candidates = set()
+            for root in (self.input_root / "inputs", self.input_root):
+                for source_cfg in self.config.get("sources", []):
+                    if source_cfg.get("file_pattern"):
+                        candidates.update(root.glob(source_cfg["file_pattern"]))
+        paths_cfg = self.config.get("paths", {}) if isinstance(self.config, Mapping) else {}
+        output_root = Path(paths_cfg.get("output_root", "output")).resolve()
+        # Skip Excel lock files and our own outputs if output_root sits inside the inputs.
+        return sorted(
+            path for path in candidates if not path.name.startswith("~$") and path.resolve().parent != output_root
+        )
+
+
+def _state(path: Path) -> tuple:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), stat.st_size, stat.st_mtime_ns)
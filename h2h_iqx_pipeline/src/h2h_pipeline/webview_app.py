@@ -1,23 +1,37 @@
 import json
+import multiprocessing
 import os
 import queue
 import re
 import subprocess
 import sys
 import threading
+import time
 from datetime import date
 from pathlib import Path
 from typing import Any, Mapping
 
-import webview
-import yaml
-
+from .cancellation import RunCancelled
 from .config_loader import load_config, normalize_config_paths
-from .pipeline import run_pipeline
+from .instrumentation import format_progress, progress_fraction
+from .log_tail import tail_lines
+from .models import RunResult
+from .process_runner import WarmWorker
+from .run_queue import QueuedJob, RunLane, RunQueue
+from .warmup import start_worker, warm_up
+
+# webview, yaml and the pipeline (pandas) are imported where they are used so
+# the window can appear before the heavy modules load.
 
 
 SETTINGS_PATH = Path.home() / ".h2h_iqx_pipeline_gui.json"
 MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+PREVIEW_LABELS = {"combo": "Combo", "dedup": "Combo Dups Removed"}
+# Pushed updates are held this long so a burst of log lines reaches the page
+# as one batch (one evaluate_js call, one render) instead of one call per line.
+PUSH_INTERVAL = 0.1
+# Lines of pipeline.log shown when the window opens (runs stream theirs as they go).
+LOG_TAIL_LINES = 200
 
 
 def _resource_path(relative: str) -> Path:
@@ -26,21 +40,12 @@ def _resource_path(relative: str) -> Path:
 
 
 def _load_yaml(path: Path) -> Mapping[str, Any]:
+    import yaml
+
     with path.open("r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
 
 
-def _tail_lines(path: Path, limit: int = 200) -> list[str]:
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-        if len(lines) > limit:
-            lines = lines[-limit:]
-        return [line.rstrip("\n") for line in lines]
-    except FileNotFoundError:
-        return []
-
-
 def _open_path(path: Path) -> None:
     if sys.platform.startswith("win"):
         try:
@@ -67,6 +72,15 @@ def _first_selection(selection: Any) -> str | None:
     return str(selection)
 
 
+def _saved_log_file(settings: Mapping[str, str]) -> Path | None:
+    """pipeline.log of the last run with the saved folders (the log_dir _run_job sets)."""
+    output_root = settings.get("output_root", "").strip()
+    input_root = settings.get("input_root", "").strip()
+    if not output_root and not input_root:
+        return None
+    return (Path(output_root) if output_root else Path(input_root) / "output") / "logs" / "pipeline.log"
+
+
 def _resolve_config_path(value: str, base_dir: Path) -> str:
     candidate = Path(value)
     if candidate.is_absolute():
@@ -78,15 +92,64 @@ class PipelineWebAPI:
     def __init__(self) -> None:
         self._queue: queue.Queue[dict[str, Any]] = queue.Queue()
         self._running = False
+        self._runs = RunQueue(self._run_job, on_change=self._job_changed)
         self._last_output_root: Path | None = None
         self._last_log_file: Path | None = None
         self._window: Any | None = None
+        self._pending = threading.Event()
+        self._pusher: threading.Thread | None = None
+        self._preview_paths: dict[str, Path] = {}
+        self._preview_tables: dict[str, Any] = {}
+        self._preview_lock = threading.Lock()
+        self._worker: WarmWorker | None = None
+        self._worker_lock = threading.Lock()
+        self._run_started: float | None = None
 
     def bind_window(self, window: Any) -> None:
         self._window = window
 
+    def enable_push(self) -> bool:
+        """Called by the page once it can receive updates via ``window.receiveUpdates``.
+
+        Returns ``False`` when no window is bound, in which case the page keeps
+        polling :meth:`get_updates`.
+        """
+        if not self._window:
+            return False
+        if self._pusher is None:
+            self._pusher = threading.Thread(target=self._push_loop, name="webview-push", daemon=True)
+            self._pusher.start()
+        self._pending.set()
+        return True
+
+    def start_warmup(self, config_path: str | None = None, quiet: bool = False) -> None:
+        """Warm up for the next run on a background thread (the saved config by default).
+
+        Imports the pipeline, loads and validates the config and parses its
+        mapping files, in the pre-started pipeline process with the default
+        ``process`` backend. Unless ``quiet``, the status shows "Ready" when done.
+        """
+        if config_path is None:
+            config_path = self._load_settings().get("config_path", "")
+        thread = threading.Thread(
+            target=self._warmup_worker, args=(config_path.strip(), quiet), name="gui-warmup", daemon=True
+        )
+        thread.start()
+
+    def close(self) -> None:
+        worker = self._take_worker()
+        if worker is not None:
+            worker.close()
+        self._runs.cancel_all("Window closed")
+
     def get_state(self) -> dict[str, Any]:
+        """Saved settings and run state for the page, with the tail of the last run's log."""
         settings = self._load_settings()
+        if self._last_log_file is None:
+            saved_log = _saved_log_file(settings)
+            if saved_log is not None and saved_log.exists():
+                self._last_log_file = saved_log
+        log_tail = tail_lines(self._last_log_file, LOG_TAIL_LINES) if self._last_log_file else []
         return {
             "config_path": settings.get("config_path", ""),
             "input_root": settings.get("input_root", ""),
@@ -98,15 +161,32 @@ class PipelineWebAPI:
             "log_ready": bool(self._last_log_file),
             "last_output_root": str(self._last_output_root) if self._last_output_root else "",
             "last_log_file": str(self._last_log_file) if self._last_log_file else "",
+            "log_tail": ["---- Pipeline log (tail) ----", *log_tail] if log_tail else [],
         }
 
     def get_updates(self) -> list[dict[str, Any]]:
+        # Progress and the job list are coalesced to the newest update so a slow poll never
+        # replays a backlog, and log lines queued before a log_clear are dropped rather than drawn and erased.
         updates: list[dict[str, Any]] = []
+        latest_progress: dict[str, Any] | None = None
         while True:
             try:
-                updates.append(self._queue.get_nowait())
+                update = self._queue.get_nowait()
             except queue.Empty:
                 break
+            kind = update.get("type")
+            if kind == "progress":
+                latest_progress = update
+            elif kind == "jobs":
+                updates = [u for u in updates if u.get("type") != "jobs"]
+                updates.append(update)
+            elif kind == "log_clear":
+                updates = [u for u in updates if u.get("type") != "log"]
+                updates.append(update)
+            else:
+                updates.append(update)
+        if latest_progress is not None:
+            updates.append(latest_progress)
         return updates
 
     def prefill_from_config(self, config_path: str) -> dict[str, str]:
@@ -137,6 +217,8 @@ class PipelineWebAPI:
     def choose_config(self) -> str | None:
         if not self._window:
             return None
+        import webview
+
         file_types = [
             ("YAML files (*.yml;*.yaml)", "*.yml;*.yaml"),
             ("All files (*.*)", "*.*"),
@@ -149,12 +231,16 @@ class PipelineWebAPI:
     def choose_input_root(self) -> str | None:
         if not self._window:
             return None
+        import webview
+
         selection = self._window.create_file_dialog(webview.FOLDER_DIALOG)
         return _first_selection(selection)
 
     def choose_output_root(self) -> str | None:
         if not self._window:
             return None
+        import webview
+
         selection = self._window.create_file_dialog(webview.FOLDER_DIALOG)
         return _first_selection(selection)
 
@@ -175,9 +261,7 @@ class PipelineWebAPI:
     def run_pipeline(
         self, config_path: str, input_root_raw: str, output_root_raw: str, month_raw: str
     ) -> dict[str, Any]:
-        if self._running:
-            return {"ok": False, "error": "Pipeline already running."}
-
+        """Queue a run; it starts once a worker is free and no earlier job for its month is running."""
         config_path = (config_path or "").strip()
         if not config_path:
             return {"ok": False, "error": "Please select a config file."}
@@ -188,19 +272,54 @@ class PipelineWebAPI:
         if month and not MONTH_PATTERN.match(month):
             return {"ok": False, "error": "Month must be in YYYY-MM format."}
 
-        self._set_running(True)
-        self._queue.put({"type": "log_clear"})
-        self._enqueue_log("Starting pipeline run...")
+        if not self._runs.busy:
+            self._put({"type": "log_clear"})
         self.save_settings(config_path, input_root_raw, output_root_raw, month_raw)
-
-        thread = threading.Thread(
-            target=self._run_pipeline_worker,
-            args=(config_path, input_root_raw, output_root_raw, month_raw),
-            daemon=True,
-        )
-        thread.start()
+        job = self._runs.submit(config_path, (input_root_raw or "").strip(), (output_root_raw or "").strip(), month)
+        self._enqueue_log(f"Queued run {job.id} ({month or 'config month'}, {Path(config_path).name}).")
+        return {"ok": True, "job": job.to_dict()}
+
+    def list_jobs(self) -> dict[str, Any]:
+        return {"ok": True, "jobs": [job.to_dict() for job in self._runs.jobs()]}
+
+    def cancel_job(self, job_id: str) -> dict[str, Any]:
+        job = self._runs.cancel(job_id)
+        if job is None:
+            return {"ok": False, "error": "Unknown run."}
+        if job.status == "running":
+            self._enqueue_log(f"Cancelling run {job.id}; it stops at the next check.")
+        return {"ok": True, "job": job.to_dict()}
+
+    def cancel_run(self) -> dict[str, Any]:
+        """Cancel every queued and running job."""
+        if not self._runs.cancel_all():
+            return {"ok": False, "error": "No run in progress."}
+        self._enqueue_status("Cancelling...")
+        self._enqueue_log("Cancelling; running jobs stop at the next check.")
         return {"ok": True}
 
+    def list_previews(self) -> dict[str, Any]:
+        """Outputs of the last run that can be previewed, with their row counts."""
+        tables = []
+        try:
+            for key in self._preview_paths:
+                tables.append({"key": key, "label": PREVIEW_LABELS.get(key, key), "rows": self._preview(key).total})
+        except Exception as exc:
+            return {"ok": False, "error": f"Preview unavailable: {exc}"}
+        return {"ok": True, "tables": tables}
+
+    def get_preview_page(
+        self, key: str, page: int = 0, page_size: int = 100, sort_by: str = "", descending: bool = False
+    ) -> dict[str, Any]:
+        """One page of a previewed output; only these rows are sent to the page."""
+        if key not in self._preview_paths:
+            return {"ok": False, "error": "No preview available yet."}
+        try:
+            result = self._preview(key).page(page, page_size, sort_by or None, bool(descending))
+        except Exception as exc:
+            return {"ok": False, "error": f"Preview unavailable: {exc}"}
+        return {"ok": True, "key": key, **result}
+
     def open_output(self) -> dict[str, Any]:
         if not self._last_output_root or not self._last_output_root.exists():
             return {"ok": False, "error": "No output folder available yet."}
@@ -213,13 +332,13 @@ class PipelineWebAPI:
         _open_path(self._last_log_file)
         return {"ok": True}
 
-    def _run_pipeline_worker(
-        self, config_path: str, input_root_raw: str, output_root_raw: str, month_raw: str
-    ) -> None:
+    def _run_job(self, job: QueuedJob, lane: RunLane) -> RunResult:
+        output_root: Path | None = None
+        paths_cfg: dict[str, Any] = {}
         try:
             overrides: dict[str, dict[str, str]] = {"paths": {}}
-            input_root = Path(input_root_raw) if input_root_raw else None
-            output_root = Path(output_root_raw) if output_root_raw else None
+            input_root = Path(job.input_root) if job.input_root else None
+            output_root = Path(job.output_root) if job.output_root else None
 
             if input_root:
                 overrides["paths"]["input_root"] = str(input_root)
@@ -227,7 +346,7 @@ class PipelineWebAPI:
                 overrides["paths"]["output_root"] = str(output_root)
 
             cfg = load_config(
-                Path(config_path),
+                Path(job.config_path),
                 overrides=overrides if overrides["paths"] else None,
             )
 
@@ -240,36 +359,134 @@ class PipelineWebAPI:
             paths_cfg["output_root"] = str(output_root)
             paths_cfg["log_dir"] = str(output_root / "logs")
 
-            month = month_raw or cfg.get("run", {}).get("current_month") or date.today().strftime("%Y-%m")
+            month = job.month or cfg.get("run", {}).get("current_month") or date.today().strftime("%Y-%m")
             if not MONTH_PATTERN.match(month):
                 raise ValueError("Month must be in YYYY-MM format.")
+            job.month = month
 
+            self._run_started = time.perf_counter()
+            # The run rewrites the snapshots, which cannot be replaced while mapped on Windows.
+            self._close_previews()
             self._enqueue_status("Running pipeline...")
-            self._enqueue_log(f"Config: {config_path}")
+            self._enqueue_log(f"Starting run {job.id}...")
+            self._enqueue_log(f"Config: {job.config_path}")
             self._enqueue_log(f"Input root: {input_root}")
             self._enqueue_log(f"Output root: {output_root}")
             self._enqueue_log(f"Month: {month}")
 
-            run_pipeline(month=month, input_root=input_root, config=cfg)
-
             log_file = Path(paths_cfg["log_dir"]) / "pipeline.log"
-            log_lines = _tail_lines(log_file)
-            self._enqueue_log("Pipeline run completed.")
-            if log_lines:
-                self._enqueue_log("---- Pipeline log (tail) ----")
-                for line in log_lines:
-                    self._enqueue_log(line)
+            result = lane.run(
+                month,
+                input_root,
+                cfg,
+                hooks=[self._enqueue_progress],
+                progress_hooks=[self._enqueue_progress],
+                cancel=job.cancel_token,
+                on_log=self._enqueue_log,
+                log_file=log_file,
+                spare=self._take_worker,
+            )
+
+            self._enqueue_log(f"Run {job.id} completed.")
 
             self._last_output_root = output_root
             self._last_log_file = log_file
+            self._preview_paths = dict(getattr(result.export_paths, "previews", {}))
             self._enqueue_status("Run complete")
+            return result
+        except RunCancelled as exc:
+            self._enqueue_log(f"Run {job.id} stopped: {exc.reason}")
+            if exc.report_path:
+                self._enqueue_log(f"Partial QA report: {exc.report_path}")
+            if paths_cfg.get("log_dir"):
+                self._last_output_root = output_root
+                self._last_log_file = Path(paths_cfg["log_dir"]) / "pipeline.log"
+            self._enqueue_status("Cancelled")
+            raise
         except Exception as exc:
             self._enqueue_error(str(exc))
+            raise
         finally:
-            self._set_running(False)
+            self._run_started = None
+
+    def _job_changed(self, job: QueuedJob) -> None:
+        self._put({"type": "jobs", "jobs": [j.to_dict() for j in self._runs.jobs()]})
+        running = self._runs.busy
+        if running != self._running:
+            self._set_running(running)
+        if job.done and not running and self._worker is None:
+            # Lane processes end with their lane; have the next one ready before the next run.
+            self.start_warmup(job.config_path, quiet=True)
+
+    def _take_worker(self) -> WarmWorker | None:
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        return worker
+
+    def _warmup_worker(self, config_path: str, quiet: bool) -> None:
+        if not quiet:
+            self._enqueue_status("Warming up...")
+        try:
+            worker = start_worker(config_path or None)
+            with self._worker_lock:
+                previous, self._worker = self._worker, worker
+            if previous is not None:
+                previous.close()
+            result = worker.wait_ready() if worker is not None else warm_up(config_path or None)
+        except Exception as exc:
+            self._enqueue_log(f"Warm-up failed: {exc}")
+            if not quiet and not self._running:
+                self._enqueue_status("Idle")
+            return
+        if quiet:
+            return
+        if result.error:
+            self._enqueue_log(f"Config check failed: {result.error}")
+        self._enqueue_log(f"Ready in {result.seconds:.1f}s ({result.mappings} mapping files loaded).")
+        if not self._running:
+            self._enqueue_status("Ready")
+
+    def _preview(self, key: str) -> Any:
+        with self._preview_lock:
+            table = self._preview_tables.get(key)
+            if table is None:
+                from .preview import PreviewTable
+
+                table = PreviewTable(self._preview_paths[key])
+                self._preview_tables[key] = table
+            return table
+
+    def _close_previews(self) -> None:
+        with self._preview_lock:
+            for table in self._preview_tables.values():
+                table.close()
+            self._preview_tables.clear()
+            self._preview_paths = {}
+
+    def _put(self, update: dict[str, Any]) -> None:
+        self._queue.put(update)
+        self._pending.set()
+
+    def _push_loop(self) -> None:
+        while self._pending.wait():
+            time.sleep(PUSH_INTERVAL)
+            self._pending.clear()
+            if not self._push_updates():
+                return
+
+    def _push_updates(self) -> bool:
+        """Send everything queued to the page in one call; ``False`` once the window is gone."""
+        updates = self.get_updates()
+        if not updates or not self._window:
+            return bool(self._window)
+        try:
+            self._window.evaluate_js(f"window.receiveUpdates({json.dumps(updates)})")
+        except Exception:
+            return False
+        return True
 
     def _emit_state(self) -> None:
-        self._queue.put(
+        self._put(
             {
                 "type": "state",
                 "running": self._running,
@@ -278,15 +495,33 @@ class PipelineWebAPI:
             }
         )
 
+    def _enqueue_progress(self, event: Any) -> None:
+        started = self._run_started
+        if started is not None and event.rows_done:
+            self._run_started = None
+            self._enqueue_log(f"Time to first row: {time.perf_counter() - started:.2f}s")
+        self._put(
+            {
+                "type": "progress",
+                "stage": event.stage,
+                "phase": event.phase,
+                "message": format_progress(event),
+                "fraction": progress_fraction(event),
+                "rows_done": event.rows_done,
+                "rows_total": event.rows_total,
+                "rows_per_second": event.rows_per_second,
+            }
+        )
+
     def _enqueue_log(self, message: str) -> None:
-        self._queue.put({"type": "log", "message": message})
+        self._put({"type": "log", "message": message})
 
     def _enqueue_status(self, message: str) -> None:
-        self._queue.put({"type": "status", "message": message})
+        self._put({"type": "status", "message": message})
 
     def _enqueue_error(self, message: str) -> None:
-        self._queue.put({"type": "error", "message": message})
-        self._queue.put({"type": "log", "message": f"ERROR: {message}"})
+        self._put({"type": "error", "message": message})
+        self._put({"type": "log", "message": f"ERROR: {message}"})
 
     def _set_running(self, running: bool) -> None:
         self._running = running
@@ -302,6 +537,10 @@ class PipelineWebAPI:
 
 
 def main() -> None:
+    # Lets a frozen (PyInstaller) build start the pipeline child process.
+    multiprocessing.freeze_support()
+    import webview
+
     webview.settings["ALLOW_FILE_URLS"] = True
     api = PipelineWebAPI()
     index_path = _resource_path("web/index.html").resolve()
@@ -314,6 +553,8 @@ def main() -> None:
         js_api=api,
     )
     api.bind_window(window)
+    window.events.closed += api.close
+    api.start_warmup()
     webview.start(debug=False)
 
 
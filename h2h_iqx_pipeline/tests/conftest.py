@@ -6,3 +6,90 @@ ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+import pandas as pd
+import pytest
+import yaml
+
+COLUMN_ORDER = [
+    "Summary - Bulk Import Failure Notes",
+    "external_identifier",
+    "external_source",
+    "internal_comment",
+    "date_available",
+    "end_date",
+    "location_radius",
+    "last_name",
+    "first_name",
+    "phone_number",
+    "email",
+    "location_zip",
+    "profession",
+    "industry",
+    "talent_price_category",
+]
+
+
+def write_source(path, rows):
+    """Write an H2H-style source export with the given (first, last, email, phone) rows."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        {
+            "Record ID": [str(180000000000 + idx) for idx in range(len(rows))],
+            "First Name": [r[0] for r in rows],
+            "Last Name": [r[1] for r in rows],
+            "Create Date": ["2025-12-04 09:00:00"] * len(rows),
+            "Mobile Phone Number": [r[3] for r in rows],
+            "Email": [r[2] for r in rows],
+            "Postal Code": ["12345"] * len(rows),
+            "Trade of Interest": ["Ironworkers"] * len(rows),
+            "Branch of Service": ["Army"] * len(rows),
+        }
+    ).to_excel(path, index=False)
+
+
+@pytest.fixture
+def sample_run(tmp_path):
+    """A small on-disk input tree and config file for end-to-end runs."""
+    input_root = tmp_path / "input_data"
+    write_source(
+        input_root / "Vet Talents 2025-12" / "Career Seekers Interested in IBEW D4 11052025-12042025.xlsx",
+        [("Jane", "Doe", "jane@example.com", "5551112222"), ("Sam", "Roe", "sam@example.com", "5553334444")],
+    )
+    mappings_dir = tmp_path / "mappings"
+    mappings_dir.mkdir()
+    (mappings_dir / "professions.yml").write_text(
+        '"Ironworkers": "Structural Iron and Steel Workers"\n', encoding="utf-8"
+    )
+    (mappings_dir / "service_branches.yml").write_text('"Army": "Service: Army"\n', encoding="utf-8")
+    (mappings_dir / "source_priority.yml").write_text('"IBEW D4": 90\n', encoding="utf-8")
+
+    config = {
+        "paths": {
+            "input_root": str(input_root),
+            "output_root": str(tmp_path / "out"),
+            "log_dir": str(tmp_path / "logs"),
+        },
+        "run": {"output_date": "2025-12-04"},
+        "sources": [
+            {
+                "name": "IBEW D4",
+                "code": "IBEW_4",
+                "file_pattern": "Career Seekers Interested in IBEW D4 *.xlsx",
+            }
+        ],
+        "combo_files": {
+            "excel_pattern": "Combo H2H {date}.xlsx",
+            "csv_pattern": "Bulk Import H2H {date}.csv",
+        },
+        "iqx_import": {"column_order": COLUMN_ORDER},
+        "defaults": {"industry": "23 Construction", "talent_price_category": "A"},
+        "mappings": {
+            "professions": str(mappings_dir / "professions.yml"),
+            "service_branches": str(mappings_dir / "service_branches.yml"),
+            "source_priority": str(mappings_dir / "source_priority.yml"),
+        },
+    }
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    return {"input_root": input_root, "config_path": config_path, "tmp_path": tmp_path}
@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+from h2h_pipeline.batch import format_summary, month_run_config, plan_batch, run_batch
+from h2h_pipeline.config_loader import load_config
+
+from .conftest import write_source
+
+SOURCE_NAME = "Career Seekers Interested in IBEW D4 10012025-11302025.xlsx"
+
+
+def _add_month(input_root, month):
+    write_source(input_root / f"Vet Talents {month}" / SOURCE_NAME, [("Ann", "Lee", "ann@example.com", "5550001111")])
+
+
+def test_plan_batch_chains_months_without_existing_combo(sample_run):
+    input_root = sample_run["input_root"]
+    for month in ("2025-10", "2025-11"):
+        _add_month(input_root, month)
+    (input_root / "Vet Talents 2025-11" / "Combo H2H 2025-11.xlsx").touch()
+    config = load_config(sample_run["config_path"])
+
+    chains = plan_batch(["2025-10", "2025-11", "2025-12"], input_root, config)
+
+    assert chains == [["2025-10", "2025-11"], ["2025-12"]]
+
+
+def test_month_run_config_isolates_outputs_and_dates(sample_run, tmp_path):
+    config = load_config(sample_run["config_path"])
+
+    month_config = month_run_config(config, "2026-01", tmp_path / "prev.xlsx")
+
+    assert month_config["paths"]["output_root"].endswith("2026-01")
+    assert month_config["run"]["previous_month"] == "2025-12"
+    assert month_config["run"]["previous_combo"] == str(tmp_path / "prev.xlsx")
+    assert "output_date" not in month_config["run"]
+    assert config["run"]["output_date"] == "2025-12-04"
+
+
+def test_run_batch_feeds_previous_combo_through_chain(sample_run):
+    input_root = sample_run["input_root"]
+    _add_month(input_root, "2025-11")
+    config = load_config(sample_run["config_path"])
+
+    results = run_batch("2025-11", "2025-12", input_root, config, workers=1)
+
+    assert [r.month for r in results] == ["2025-11", "2025-12"]
+    assert all(r.ok for r in results)
+    assert results[1].depends_on == "2025-11"
+    assert results[0].combo_path.parent.name == "2025-11"
+    assert results[1].combo_path.parent.name == "2025-12"
+    assert set(results[1].stage_seconds) >= {"ingestion", "transform", "dedup", "export", "qa"}
+
+    summary = format_summary(results, 1.5)
+    assert "2/2 months succeeded" in summary
+    assert summary.splitlines()[0].split()[:3] == ["month", "label", "discovery"]
+
+
+def test_run_batch_runs_independent_months_in_processes(sample_run):
+    input_root = sample_run["input_root"]
+    _add_month(input_root, "2025-11")
+    (input_root / "Vet Talents 2025-11" / "Combo H2H 2025-11.xlsx").touch()
+    config = load_config(sample_run["config_path"], overrides={"logging": {"format": "json"}})
+
+    results = run_batch("2025-11", "2025-12", input_root, config, workers=2)
+
+    assert [r.depends_on for r in results] == [None, None]
+    assert all(r.ok for r in results), [r.error for r in results]
+    # Both workers' runs are in the log this process wrote.
+    log_file = Path(config["paths"]["log_dir"]) / "pipeline.log"
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert len({r["run_id"] for r in records if r["message"].startswith("Stage qa finished")}) == 2
@@ -0,0 +1,120 @@
+import openpyxl
+import pandas as pd
+import pytest
+
+from h2h_pipeline.cancellation import CHECK_EVERY_ROWS, CancelToken, RunCancelled, StageBudgetExceeded
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.ingestion import iter_source_chunks
+from h2h_pipeline.pipeline import run_pipeline
+from h2h_pipeline.process_runner import run_in_subprocess
+
+from .conftest import write_source
+
+
+def test_cancel_stops_run_and_writes_partial_report(sample_run):
+    config = load_config(sample_run["config_path"])
+    token = CancelToken()
+
+    def cancel_on_ingestion(event):
+        if event.stage == "ingestion" and event.phase == "start":
+            token.cancel()
+
+    with pytest.raises(RunCancelled) as info:
+        run_pipeline("2025-12", sample_run["input_root"], config, hooks=[cancel_on_ingestion], cancel=token)
+
+    assert info.value.stage == "ingestion"
+    report = info.value.report_path.read_text(encoding="utf-8")
+    assert report.startswith("QA report for 2025-12-04 (incomplete)")
+    assert "Run stopped during ingestion: Cancelled by user" in report
+    assert "- discovery: " in report
+    assert "- none (the run stopped before export finished)" in report
+    assert not list((sample_run["tmp_path"] / "out").glob("*.csv"))
+
+
+def test_stage_budget_stops_run(sample_run):
+    config = load_config(sample_run["config_path"])
+    config["execution"] = {"stage_budgets": {"dedup": 0}}
+
+    with pytest.raises(StageBudgetExceeded) as info:
+        run_pipeline("2025-12", sample_run["input_root"], config)
+
+    assert info.value.stage == "dedup"
+    report = info.value.report_path.read_text(encoding="utf-8")
+    assert "Run stopped during dedup: dedup exceeded its 0s time budget" in report
+    assert "- transform: " in report
+
+
+def test_cancel_is_checked_between_rows_of_a_workbook(tmp_path):
+    path = tmp_path / "source.xlsx"
+    pd.DataFrame({"Email": [f"user{idx}@example.com" for idx in range(3 * CHECK_EVERY_ROWS)]}).to_excel(
+        path, index=False
+    )
+    token = CancelToken()
+    calls = []
+
+    def check():
+        calls.append(len(calls))
+        if len(calls) == 2:
+            token.cancel()
+        token.check()
+
+    with pytest.raises(RunCancelled):
+        list(iter_source_chunks(path, "IBEW D4", "IBEW_4", None, chunk_rows=10 * CHECK_EVERY_ROWS, check=check))
+    assert len(calls) == 2
+
+
+def test_cancellable_run_matches_plain_run(sample_run):
+    config = load_config(sample_run["config_path"])
+    expected = run_pipeline("2025-12", sample_run["input_root"], config)
+    expected_frames = {
+        key: pd.read_excel(path, dtype=str) if path.suffix == ".xlsx" else pd.read_csv(path, dtype=str)
+        for key, path in expected.export_paths.items()
+    }
+    config["export"] = {"skip_unchanged": False}
+
+    result = run_pipeline("2025-12", sample_run["input_root"], config, cancel=CancelToken())
+
+    for key, path in result.export_paths.items():
+        actual = pd.read_excel(path, dtype=str) if path.suffix == ".xlsx" else pd.read_csv(path, dtype=str)
+        pd.testing.assert_frame_equal(actual, expected_frames[key])
+
+
+def _sheet(path):
+    workbook = openpyxl.load_workbook(path)
+    sheet = workbook.active
+    header_fonts = [cell.font.b for cell in sheet[1]]
+    return [list(row) for row in sheet.iter_rows(values_only=True)], header_fonts
+
+
+def test_gui_run_matches_cli_run_on_na_strings(sample_run):
+    # Different people whose email or phone is one of pandas' NA strings.
+    write_source(
+        sample_run["input_root"] / "Vet Talents 2025-12" / "Career Seekers Interested in IBEW D4 11052025-12042025.xlsx",
+        [
+            ("Jane", "Doe", "N/A", "5551112222"),
+            ("Sam", "Roe", "N/A", "5553334444"),
+            ("Ann", "Lee", "null", "NA"),
+            ("Bo", "Ray", "null", "null"),
+            ("Cy", "Fox", "NaN", "5550001111"),
+        ],
+    )
+    config = load_config(sample_run["config_path"])
+    config["export"] = {"skip_unchanged": False}
+    out_root = sample_run["tmp_path"]
+
+    config["paths"]["output_root"] = str(out_root / "cli")
+    cli = run_pipeline("2025-12", sample_run["input_root"], config)
+    # The GUIs run in a child process with a cancel token, so they read and write in checked slices.
+    config["paths"]["output_root"] = str(out_root / "gui")
+    gui = run_in_subprocess("2025-12", sample_run["input_root"], config)
+
+    assert set(gui.export_paths) == set(cli.export_paths)
+    for key, path in cli.export_paths.items():
+        if path.suffix == ".xlsx":
+            assert _sheet(gui.export_paths[key]) == _sheet(path)
+        else:
+            assert gui.export_paths[key].read_bytes() == path.read_bytes()
+    # Jane and Sam are not merged on "N/A"; Ann and Bo have neither email nor phone and are dropped.
+    exported = pd.read_csv(gui.export_paths["iqx_csv"], dtype=str)
+    assert exported["first_name"].tolist() == ["Jane", "Sam", "Cy"]
+    assert exported["email"].isna().all()
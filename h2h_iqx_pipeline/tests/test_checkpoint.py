@@ -0,0 +1,59 @@
+import pandas as pd
+
+from h2h_pipeline.checkpoint import CheckpointStore, store_from_config
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.pipeline import run_pipeline
+
+
+def _cached_stages(result):
+    return [span.stage for span in result.spans if span.cached]
+
+
+def test_checkpoint_store_round_trips_frames(tmp_path):
+    store = CheckpointStore(tmp_path / "cp")
+    df = pd.DataFrame({"email": ["a@example.com", None], "n": [1, 2]})
+
+    store.save("transform", "key1", {"combo": df}, {"validation": {"invalid_zips": ["0:12"]}})
+    store.save("transform", "key2", {"combo": df.head(1)})
+
+    assert store.load("transform", "key1") is None  # only the latest key per stage is kept
+    loaded = store.load("transform", "key2")
+    assert loaded.frames["combo"]["email"].tolist() == ["a@example.com"]
+    assert loaded.meta == {}
+
+
+def test_concurrent_months_keep_their_checkpoints(tmp_path):
+    config = {"paths": {"output_root": str(tmp_path / "out")}, "checkpoints": {"enabled": True}}
+    november, december = store_from_config(config, "2025-11"), store_from_config(config, "2025-12")
+    df = pd.DataFrame({"email": ["a@example.com"]})
+
+    november.save("ingestion", "nov", {"raw": df})
+    # Another run of this month is still writing its checkpoint.
+    in_flight = tmp_path / "out" / ".checkpoints" / "2025-12" / "ingestion" / ".dec2.123.456.tmp"
+    in_flight.mkdir(parents=True)
+    december.save("ingestion", "dec", {"raw": df})
+
+    assert november.load("ingestion", "nov") is not None
+    assert december.load("ingestion", "dec") is not None
+    assert in_flight.exists()
+
+
+def test_run_pipeline_resumes_from_first_changed_stage(sample_run):
+    config_path = sample_run["config_path"]
+    input_root = sample_run["input_root"]
+    overrides = {"checkpoints": {"enabled": True}}
+
+    first = run_pipeline("2025-12", input_root, load_config(config_path, overrides=overrides))
+    assert _cached_stages(first) == []
+
+    second = run_pipeline("2025-12", input_root, load_config(config_path, overrides=overrides))
+    assert _cached_stages(second) == ["ingestion", "transform", "dedup"]
+
+    cfg = load_config(config_path, overrides=overrides)
+    with open(cfg["mappings"]["professions"], "a", encoding="utf-8") as handle:
+        handle.write('"Electricians/Lineman": "Electricians"\n')
+    third = run_pipeline("2025-12", input_root, cfg)
+    assert _cached_stages(third) == ["ingestion"]
+
+    csv_path = third.export_paths["iqx_csv"]
+    assert len(pd.read_csv(csv_path)) == 2
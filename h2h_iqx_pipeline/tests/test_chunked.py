@@ -0,0 +1,103 @@
+import copy
+
+import pandas as pd
+
+from h2h_pipeline import chunked
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.constants import SOURCE_COLUMN
+from h2h_pipeline.ingestion import iter_source_chunks
+from h2h_pipeline.pipeline import run_pipeline
+from h2h_pipeline.preview import PreviewTable
+
+from .conftest import write_source
+
+
+def _two_source_config(sample_run):
+    tmp_path = sample_run["tmp_path"]
+    month_dir = sample_run["input_root"] / "Vet Talents 2025-12"
+    write_source(
+        month_dir / "Career Seekers Interested in IBEW D8 11052025-12042025.xlsx",
+        [
+            ("Janet", "Doe", "JANE@example.com", "5559990000"),
+            ("Kim", "Poe", "kim@example.com", "555333444"),
+            ("Sam", "Roe", "", "(555) 333-4444"),
+            ("Lee", "Moe", "lee@example.com", ""),
+        ],
+    )
+    (tmp_path / "mappings" / "source_priority.yml").write_text('"IBEW D4": 50\n"IBEW D8": 90\n', encoding="utf-8")
+    config = load_config(sample_run["config_path"])
+    config["sources"].append(
+        {"name": "IBEW D8", "code": "IBEW_8", "file_pattern": "Career Seekers Interested in IBEW D8 *.xlsx"}
+    )
+    return config
+
+
+def _run(sample_run, config, out_name):
+    config = copy.deepcopy(config)
+    config["paths"]["output_root"] = str(sample_run["tmp_path"] / out_name)
+    return run_pipeline("2025-12", sample_run["input_root"], config)
+
+
+def test_chunked_mode_matches_in_memory_outputs(sample_run):
+    config = _two_source_config(sample_run)
+    chunked_config = copy.deepcopy(config)
+    chunked_config["execution"] = {"mode": "chunked", "chunk_rows": 1, "spill_dir": str(sample_run["tmp_path"] / "spill")}
+
+    expected = _run(sample_run, config, "memory")
+    result = _run(sample_run, chunked_config, "chunked")
+
+    for key in ("iqx_csv", "duplicates_csv"):
+        pd.testing.assert_frame_equal(
+            pd.read_csv(result.export_paths[key], dtype=str), pd.read_csv(expected.export_paths[key], dtype=str)
+        )
+    for key in ("combo_excel", "dedup_excel"):
+        pd.testing.assert_frame_equal(
+            pd.read_excel(result.export_paths[key], dtype=str), pd.read_excel(expected.export_paths[key], dtype=str)
+        )
+    for key in ("combo", "dedup"):
+        actual = PreviewTable(result.export_paths.previews[key]).page(page_size=100)
+        assert actual["rows"] == PreviewTable(expected.export_paths.previews[key]).page(page_size=100)["rows"]
+    expected_report = expected.report_path.read_text(encoding="utf-8").replace("memory", "chunked")
+    assert result.report_path.read_text(encoding="utf-8") == expected_report
+    assert list((sample_run["tmp_path"] / "spill").iterdir()) == []
+
+
+def test_chunk_rows_follow_memory_budget():
+    assert chunked.chunk_rows({"execution": {"chunk_rows": 500}}) == 500
+    assert chunked.chunk_rows({"execution": {"memory_budget_mb": 64}}) == 64 * 1024 * 1024 // chunked.BYTES_PER_ROW
+    assert chunked.chunk_rows({"execution": {"memory_budget_mb": 0.001}}) == chunked.MIN_CHUNK_ROWS
+
+
+def test_plan_is_arrays_by_row_id():
+    keys = pd.DataFrame(
+        {
+            "_row": [0, 1, 2, 3],
+            "_priority": [50, 90, 50, 90],
+            "_norm_email": [11, 11, 0, 0],
+            "_norm_phone": [0, 0, 22, 22],
+            "_norm_name_zip": [0, 0, 0, 0],
+            SOURCE_COLUMN: ["IBEW D4", "IBEW D8", "IBEW D4", "IBEW D8"],
+        }
+    )
+    plan = chunked._plan(keys, {"IBEW D4": 50, "IBEW D8": 90})
+
+    assert plan.kept.tolist() == [False, True, False, True]
+    assert plan.priority.tolist() == [50.0, 90.0, 50.0, 90.0]
+    assert plan.kept_position[[0, 2]].tolist() == [0, 1]
+    assert [plan.match_labels[code] for code in plan.matched_on[[0, 2]]] == ["email", "phone"]
+    assert plan.source_counts() == {"IBEW D8 & IBEW D4": 2}
+    assert (plan.kept_count, plan.duplicate_count) == (2, 2)
+
+
+def test_iter_source_chunks_matches_read_excel(tmp_path):
+    path = tmp_path / "source.xlsx"
+    pd.DataFrame(
+        {"Email": ["a@example.com", None, None, "d@example.com", None], "Postal Code": [12345, 2.5, None, 501, None]}
+    ).to_excel(path, index=False)
+
+    chunks = list(iter_source_chunks(path, "IBEW D4", "IBEW_4", None, chunk_rows=2))
+    expected = pd.read_excel(path, dtype=str).rename(columns={"Email": "email", "Postal Code": "location_zip"})
+    expected["external_source"] = "IBEW D4"
+    expected["external_source_code"] = "IBEW_4"
+
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
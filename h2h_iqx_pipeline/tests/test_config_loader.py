@@ -1,7 +1,11 @@
+import dataclasses
+
+import pandas as pd
 import pytest
 from pathlib import Path
 
-from h2h_pipeline.config_loader import load_config, validate_config
+from h2h_pipeline import dedup
+from h2h_pipeline.config_loader import compile_plan, load_config, validate_config
 
 
 def test_validate_config_missing_sections(tmp_path):
@@ -24,3 +28,40 @@ def test_validate_config_checks_input_root(tmp_path):
     cfg_path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
     with pytest.raises(FileNotFoundError):
         load_config(cfg_path)
+
+
+def test_compile_plan_indexes_sources_and_parses_files_once(tmp_path):
+    priority_file = tmp_path / "source_priority.yml"
+    priority_file.write_text('"IBEW D4": "5"\n"Helmets": 1\n', encoding="utf-8")
+    config = {
+        "sources": [
+            {"name": "IBEW D4", "code": "IBEW_4", "output_label": "IBEW"},
+            {"name": "Helmets", "code": "H2H"},
+            {"name": "Helmets", "code": "OTHER"},
+        ],
+        "mappings": {"source_priority": str(priority_file)},
+        "date_handling": {
+            "last_import_strategy": "From_Config",
+            "last_import_date_by_source": {"IBEW D4": "2025-11-01", "Helmets": "not a date"},
+        },
+    }
+
+    plan = compile_plan(config)
+
+    assert [spec.name for spec in plan.sources] == ["IBEW D4", "Helmets"]
+    assert plan.source_codes == {"IBEW D4": "IBEW_4", "Helmets": "H2H"}
+    assert plan.source_labels == {"IBEW D4": "IBEW", "Helmets": "Helmets"}
+    assert plan.priority == {"IBEW D4": 5, "Helmets": 1}
+    assert plan.mappings["professions"] == {}
+    assert plan.last_import_strategy == "from_config"
+    assert plan.cutoffs == {"IBEW D4": pd.Timestamp("2025-11-01")}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.priority = {}
+    with pytest.raises(TypeError):
+        plan.priority["Helmets"] = 9
+
+    # Stages given the plan never go back to the mapping files.
+    priority_file.unlink()
+    combo = pd.DataFrame({"email": ["a@x.com", "a@x.com"], "external_source": ["Helmets", "IBEW D4"]})
+    result = dedup.remove_duplicates(combo, config, run_plan=plan)
+    assert result.cleaned_df["external_source"].tolist() == ["IBEW D4 & Helmets"]
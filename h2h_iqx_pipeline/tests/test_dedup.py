@@ -52,3 +52,26 @@ def test_dedup_ignores_blank_identifier_values():
 
     assert len(result.cleaned_df) == 2
     assert result.stats["duplicates_removed"] == 0
+
+
+def test_dedup_annotates_dropped_rows_with_cluster_and_key():
+    data = pd.DataFrame(
+        {
+            "external_source": ["A", "B", "C", "D"],
+            "email": ["jane@example.com", "JANE@example.com", "sam@example.com", "other@example.com"],
+            "phone_number": ["555-111-2222", "", "555-333-4444", "(555) 333-4444"],
+            "last_name": ["Doe", "Doe", "Roe", "Poe"],
+            "first_name": ["Jane", "Jane", "Sam", "Al"],
+            "location_zip": ["12345", "12345", "67890", "11111"],
+        }
+    )
+
+    result = dedup.remove_duplicates(data, config={})
+
+    assert list(result.cleaned_df["email"]) == ["jane@example.com", "sam@example.com"]
+    dups = result.duplicates_df.set_index("external_source")
+    assert dups.at["B", "matched_on"] == "email"
+    assert dups.at["B", "kept_row_id"] == 0
+    assert dups.at["D", "matched_on"] == "phone"
+    assert dups.at["D", "kept_row_id"] == 1
+    assert dups.at["B", "duplicate_cluster_id"] != dups.at["D", "duplicate_cluster_id"]
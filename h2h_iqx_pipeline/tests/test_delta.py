@@ -0,0 +1,101 @@
+import pandas as pd
+
+from h2h_pipeline import delta
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.pipeline import run_pipeline
+
+
+def test_compute_delta_splits_added_removed_changed():
+    previous = pd.DataFrame(
+        {
+            "email": ["keep@example.com", "gone@example.com", "edit@example.com"],
+            "phone_number": ["555-111-2222", "555-222-3333", "555-333-4444"],
+            "profession": ["Electricians", "Electricians", "Electricians"],
+            "date_available": ["11/10/2025", "11/10/2025", "11/10/2025"],
+        }
+    )
+    current = pd.DataFrame(
+        {
+            "email": ["keep@example.com", "edit@example.com", "new@example.com"],
+            "phone_number": ["555-111-2222", "555-333-4444", "555-444-5555"],
+            "profession": ["Electricians", "Structural Iron and Steel Workers", "Electricians"],
+            "date_available": ["12/10/2025", "12/10/2025", "12/10/2025"],
+        }
+    )
+
+    result = delta.compute_delta(current, previous, ["email", "phone_number", "profession"])
+
+    assert list(result.added_df["email"]) == ["new@example.com"]
+    assert list(result.removed_df["email"]) == ["gone@example.com"]
+    assert list(result.changed_df["email"]) == ["edit@example.com"]
+    assert result.unchanged == 1
+
+
+def test_compute_run_delta_uses_snapshot_and_ignores_dates(tmp_path):
+    snapshot = tmp_path / "snapshot.csv"
+    pd.DataFrame(
+        {"email": ["a@example.com"], "profession": ["Electricians"], "date_available": ["11/10/2025"]}
+    ).to_csv(snapshot, index=False)
+    current = pd.DataFrame(
+        {"email": ["a@example.com"], "profession": ["Electricians"], "date_available": ["12/10/2025"]}
+    )
+    config = {
+        "iqx_import": {"column_order": ["email", "profession", "date_available"]},
+        "delta": {"enabled": True, "snapshot_path": str(snapshot)},
+    }
+
+    result = delta.compute_run_delta(current, raw_data={}, config=config)
+
+    assert result.baseline == str(snapshot)
+    assert result.unchanged == 1
+    assert result.added_df.empty and result.removed_df.empty and result.changed_df.empty
+
+
+def test_compute_run_delta_disabled_returns_none():
+    assert delta.compute_run_delta(pd.DataFrame(), raw_data={}, config={}) is None
+
+
+def _delta_counts(report_path):
+    lines = report_path.read_text(encoding="utf-8").splitlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith("Delta vs "))
+    counts = dict(line[2:].split(": ") for line in lines[start + 1 : start + 5])
+    return lines[start], {kind: int(value) for kind, value in counts.items()}
+
+
+def test_run_pipeline_delta_against_previous_combo_and_filtered_runs(sample_run):
+    tmp_path = sample_run["tmp_path"]
+    previous = tmp_path / "Combo H2H 2025-11.xlsx"
+    pd.DataFrame(
+        {
+            "First Name": ["Jane", "Old"],
+            "Last Name": ["Doe", "Timer"],
+            "Email": ["jane@example.com", "old@example.com"],
+            "Mobile Phone Number": ["5551112222", "5559998888"],
+            "Create Date": ["2025-11-01 09:00:00", "2025-11-01 09:00:00"],
+        }
+    ).to_excel(previous, index=False)
+    snapshot = tmp_path / "snapshot.csv"
+    overrides = {"run": {"previous_combo": str(previous)}, "delta": {"enabled": True}}
+
+    # Without a last-import filter the previous Combo is a fair baseline.
+    config = load_config(sample_run["config_path"], overrides)
+    result = run_pipeline("2025-12", sample_run["input_root"], config)
+    header, counts = _delta_counts(result.report_path)
+    assert header == "Delta vs previous Combo:"
+    assert counts["Added"] == 1 and counts["Removed"] == 1 and counts["Changed"] + counts["Unchanged"] == 1
+
+    # With the filter, Jane never reaches dedup, so the previous Combo is skipped for the snapshot.
+    overrides["date_handling"] = {"last_import_strategy": "from_combo_file"}
+    overrides["delta"]["snapshot_path"] = str(snapshot)
+    config = load_config(sample_run["config_path"], overrides)
+    result = run_pipeline("2025-12", sample_run["input_root"], config)
+    assert _delta_counts(result.report_path) == (
+        "Delta vs none:",
+        {"Added": 1, "Removed": 0, "Changed": 0, "Unchanged": 0},
+    )
+
+    result = run_pipeline("2025-12", sample_run["input_root"], config)
+    assert _delta_counts(result.report_path) == (
+        f"Delta vs {snapshot}:",
+        {"Added": 0, "Removed": 0, "Changed": 0, "Unchanged": 1},
+    )
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.estimate import dry_run, format_dry_run
+from h2h_pipeline.pipeline import run_pipeline
+from h2h_pipeline.utils.xlsx import read_sheet_preview
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _by_stage(report):
+    return {estimate.stage: estimate for estimate in report.estimates}
+
+
+def test_dry_run_reports_headers_counts_and_missing_mappings(sample_run):
+    config = load_config(sample_run["config_path"])
+    Path(config["mappings"]["professions"]).write_text('"Electricians": "Electricians"\n', encoding="utf-8")
+
+    report = dry_run("2025-12", sample_run["input_root"], config)
+
+    assert report.source_rows == 2
+    [source] = report.sources
+    assert source.row_count_basis == "dimension"
+    assert {"email", "phone_number", "profession", "service_branch"} <= set(source.columns)
+    assert report.validation.missing_profession_mappings == {"Ironworkers"}
+    assert report.validation.missing_service_branch_mappings == set()
+    assert _by_stage(report)["transform"].basis == "no history"
+    assert "Missing profession mappings: Ironworkers" in format_dry_run(report)
+
+
+def test_dry_run_estimates_from_recorded_throughput(sample_run):
+    config = load_config(sample_run["config_path"])
+    run_pipeline("2025-12", sample_run["input_root"], config)
+
+    report = dry_run("2025-12", sample_run["input_root"], config)
+
+    assert report.history_runs == 1
+    estimates = _by_stage(report)
+    assert estimates["ingestion"].basis.endswith("rows/s")
+    assert estimates["qa"].basis == "average of 1 runs"
+    assert estimates["upload"].basis == "disabled"
+    assert report.estimated_seconds is not None
+
+
+def test_dry_run_cli_does_not_import_pandas(sample_run):
+    code = (
+        "import sys, time\n"
+        "from h2h_pipeline import cli\n"
+        "started = time.perf_counter()\n"
+        f"cli.main(['run', '--dry-run', '--month', '2025-12', '--input-root', {str(sample_run['input_root'])!r},"
+        f" '--config', {str(sample_run['config_path'])!r}])\n"
+        "assert 'pandas' not in sys.modules, 'pandas was imported'\n"
+        "print('elapsed', time.perf_counter() - started)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "Total source rows: 2" in proc.stdout
+    elapsed = float(proc.stdout.rsplit("elapsed", 1)[1])
+    assert elapsed < 1.0
+
+
+def test_read_sheet_preview_counts_rows_without_dimension(tmp_path):
+    path = tmp_path / "inline.xlsx"
+    sheet = (
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        '<row r="1"><c r="A1" t="inlineStr"><is><t>Email</t></is></c>'
+        '<c r="C1" t="inlineStr"><is><t>Postal Code</t></is></c></row>'
+        '<row r="2"><c r="A2" t="inlineStr"><is><t>a@example.com</t></is></c></row>'
+        '<row r="3"><c r="C3"><v>12345</v></c></row>'
+        "</sheetData></worksheet>"
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("xl/worksheets/sheet1.xml", sheet)
+
+    preview = read_sheet_preview(path, sample_rows=1)
+
+    assert preview.header == ["Email", "", "Postal Code"]
+    assert preview.rows == 2
+    assert preview.row_count_basis == "scan"
+    assert preview.sample == [["a@example.com"]]
@@ -22,3 +22,57 @@ def test_export_writes_files_and_reorders(tmp_path):
 
     csv_content = Path(paths["iqx_csv"]).read_text(encoding="utf-8")
     assert csv_content.splitlines()[0] == "email,external_source"
+
+
+def test_export_skips_unchanged_outputs(tmp_path):
+    combo_df = pd.DataFrame({"external_source": ["IBEW D4"], "email": ["a@example.com"]})
+    config = {
+        "paths": {"output_root": str(tmp_path / "out")},
+        "iqx_import": {"column_order": ["email", "external_source"]},
+    }
+
+    first = export.write_outputs(run_label="2025-12-04", combo_df=combo_df, dedup_df=combo_df, config=config)
+    assert first.skipped == []
+    assert (tmp_path / "out" / export.MANIFEST_FILENAME).exists()
+
+    second = export.write_outputs(run_label="2025-12-04", combo_df=combo_df, dedup_df=combo_df, config=config)
+    assert sorted(second.skipped) == ["combo_excel", "dedup_excel", "iqx_csv"]
+
+    Path(second["iqx_csv"]).unlink()
+    changed = pd.DataFrame({"external_source": ["IBEW D4"], "email": ["b@example.com"]})
+    third = export.write_outputs(run_label="2025-12-04", combo_df=combo_df, dedup_df=changed, config=config)
+    assert third.skipped == ["combo_excel"]
+    assert "b@example.com" in Path(third["iqx_csv"]).read_text(encoding="utf-8")
+
+
+def test_export_loads_sqlite_staging_and_skips_unchanged(tmp_path):
+    dedup_df = pd.DataFrame({"external_source": ["IBEW D4"], "email": ["a@example.com"]})
+    config = {
+        "paths": {"output_root": str(tmp_path / "out")},
+        "iqx_import": {"column_order": ["email", "external_source"]},
+        "export": {"sqlite": {"path": str(tmp_path / "db" / "staging.db")}},
+    }
+
+    first = export.write_outputs(run_label="2025-12-04", combo_df=dedup_df, dedup_df=dedup_df, config=config)
+    assert first.sqlite is not None and first.sqlite.rows == 1
+    assert Path(first["sqlite"]).exists()
+
+    second = export.write_outputs(run_label="2025-12-04", combo_df=dedup_df, dedup_df=dedup_df, config=config)
+    assert second.sqlite is None
+    assert "sqlite" in second.skipped
+
+
+def test_export_writes_duplicates_report(tmp_path):
+    dedup_df = pd.DataFrame({"external_source": ["IBEW D4"], "email": ["a@example.com"]})
+    duplicates_df = dedup_df.assign(duplicate_cluster_id=[0], kept_row_id=[0], matched_on=["email"])
+    config = {
+        "paths": {"output_root": str(tmp_path / "out")},
+        "iqx_import": {"column_order": ["email", "external_source"]},
+    }
+
+    paths = export.write_outputs(
+        run_label="2025-12-04", combo_df=dedup_df, dedup_df=dedup_df, config=config, duplicates_df=duplicates_df
+    )
+
+    report = pd.read_csv(paths["duplicates_csv"])
+    assert list(report.columns) == ["duplicate_cluster_id", "kept_row_id", "matched_on", "email", "external_source"]
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# The CLI only needs argparse and pathlib; these cost ~0.5s together. Wall-clock
+# budgets are checked by scripts/import_time.sh, not here (too noisy on shared CI).
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "yaml", "dateutil", "webview")
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Return cumulative import time in microseconds per module imported by ``module``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def _heavy(times: dict[str, int]) -> list[str]:
+    return sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+
+
+def test_cli_import_loads_no_heavy_modules():
+    times = _import_times("h2h_pipeline.cli")
+
+    assert "h2h_pipeline.cli" in times
+    assert _heavy(times) == []
+
+
+def test_cli_help_does_not_load_stage_dependencies():
+    code = (
+        "import sys\n"
+        "from h2h_pipeline import cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(sorted(m for m in sys.modules if m.split('.')[0] in {HEAVY_MODULES!r}))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
+
+
+@pytest.mark.parametrize("module", ["h2h_pipeline", "h2h_pipeline.webview_app", "h2h_pipeline.gui_app"])
+def test_package_and_gui_modules_defer_heavy_imports(module):
+    if module.endswith("gui_app"):
+        pytest.importorskip("tkinter")
+    assert _heavy(_import_times(module)) == []
@@ -1,6 +1,6 @@
 import pandas as pd
 
-from h2h_pipeline import ingestion
+from h2h_pipeline import dedup, ingestion
 from h2h_pipeline.models import DiscoveryResult
 
 
@@ -82,3 +82,27 @@ def test_ingestion_filters_by_last_import_date(tmp_path):
 
     assert len(df) == 1
     assert df.at[df.index[0], "email"] == "new@example.com"
+
+
+def test_cancellable_load_keeps_blank_and_na_cells_missing(tmp_path):
+    excel_path = tmp_path / "source.xlsx"
+    emails = ["jane@example.com", None, "N/A", "null", "NA", "NaN", "#N/A"]
+    pd.DataFrame(
+        {
+            "First Name": ["Jane", "Sam", "Ann", "Bo", "Cy", "Di", "NULL"],
+            "Last Name": ["Doe", "Roe", "Lee", "Ray", "Fox", "Kim", "n/a"],
+            "Email": emails,
+            "Mobile Phone Number": [None, "5553334444", "5550001111", "5550002222", "N/A", "NA", "None"],
+        }
+    ).to_excel(excel_path, index=False)
+    discovery = DiscoveryResult(month="2025-12", input_root=tmp_path, sources={"IBEW D4": excel_path})
+    config = {"sources": [{"name": "IBEW D4", "code": "IBEW_4", "file_pattern": "*.xlsx"}]}
+
+    # With a cancel check the workbook is streamed instead of read with read_excel.
+    streamed = ingestion.load_sources(discovery, config, check=lambda: None)["IBEW D4"]
+    pd.testing.assert_frame_equal(streamed, ingestion.load_sources(discovery, config)["IBEW D4"])
+    assert streamed["email"].isna().tolist() == [False, True, True, True, True, True, True]
+    assert not set(streamed.to_numpy().ravel().tolist()) & {"None", "N/A", "null", "NA", "NaN"}
+
+    # Missing emails and phones are no key, so the seven people stay separate.
+    assert len(dedup.remove_duplicates(streamed, config).cleaned_df) == 7
@@ -0,0 +1,115 @@
+import json
+import tracemalloc
+
+import pytest
+
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.instrumentation import Instrumentation, build_instrumentation, format_progress
+from h2h_pipeline.pipeline import run_pipeline
+
+
+def test_stage_emits_start_and_end_events_with_metrics():
+    events = []
+    inst = Instrumentation(hooks=[events.append], trace_memory=True)
+
+    try:
+        with inst.stage("transform", rows_in=10) as span:
+            _ = [0] * 100_000
+            span.rows_out = 8
+    finally:
+        inst.close()
+
+    assert not tracemalloc.is_tracing()
+
+    assert [(e.stage, e.phase) for e in events] == [("transform", "start"), ("transform", "end")]
+    end = events[-1]
+    assert end.rows_in == 10 and end.rows_out == 8
+    assert end.wall_seconds >= 0 and end.cpu_seconds >= 0
+    assert end.traced_peak_kb is not None and end.traced_peak_kb > 0
+    assert inst.spans == [end]
+
+
+def test_tracing_stops_when_the_last_tracing_run_closes():
+    first, second = Instrumentation(trace_memory=True), Instrumentation(trace_memory=True)
+
+    try:
+        with first.stage("ingestion"):
+            pass
+        with second.stage("ingestion"):
+            pass
+        first.close()
+        assert tracemalloc.is_tracing()
+    finally:
+        second.close()
+
+    assert not tracemalloc.is_tracing()
+    assert all(span.traced_peak_kb is not None for span in first.spans + second.spans)
+
+
+def test_tracing_started_elsewhere_is_left_running():
+    tracemalloc.start()
+    try:
+        inst = Instrumentation(trace_memory=True)
+        with inst.stage("ingestion"):
+            pass
+        inst.close()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_run_pipeline_stops_the_tracing_it_started(sample_run):
+    config = load_config(sample_run["config_path"])
+    config["instrumentation"] = {"trace_memory": True}
+
+    result = run_pipeline("2025-12", sample_run["input_root"], config)
+
+    assert not tracemalloc.is_tracing()
+    assert all(span.traced_peak_kb is not None for span in result.spans)
+
+
+def test_progress_events_are_throttled_and_keep_the_final_one():
+    events, progress = [], []
+    inst = Instrumentation(hooks=[events.append], progress_hooks=[progress.append], progress_interval=60)
+
+    with inst.stage("ingestion") as span:
+        for done in range(1, 1001):
+            span.progress(done, 1000)
+
+    assert [e.phase for e in events] == ["start", "end"]
+    assert [(e.rows_done, e.rows_total) for e in progress] == [(1, 1000), (1000, 1000)]
+    assert progress[-1].rows_per_second > 0
+    assert format_progress(progress[-1]).startswith("Ingestion: 1,000 / 1,000 rows (")
+
+
+def test_stage_records_errors_and_reraises():
+    inst = Instrumentation()
+
+    with pytest.raises(ValueError):
+        with inst.stage("dedup"):
+            raise ValueError("boom")
+
+    assert inst.spans[0].error == "ValueError: boom"
+
+
+def test_jsonl_exporter_writes_end_events_next_to_log(tmp_path):
+    log_file = tmp_path / "logs" / "pipeline.log"
+    log_file.parent.mkdir()
+    inst = build_instrumentation({}, log_file)
+
+    with inst.stage("qa"):
+        pass
+
+    lines = (log_file.parent / "pipeline_spans.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["stage"] == "qa" and record["run_id"] == inst.run_id
+
+
+def test_build_instrumentation_can_disable_exporter(tmp_path):
+    inst = build_instrumentation({"instrumentation": {"spans_file": False}}, tmp_path / "pipeline.log")
+
+    with inst.stage("qa"):
+        pass
+
+    assert not (tmp_path / "pipeline_spans.jsonl").exists()
@@ -0,0 +1,40 @@
+from h2h_pipeline.log_tail import LogFollower, follow_log, tail_lines
+
+
+def test_tail_lines_reads_back_across_blocks(tmp_path):
+    path = tmp_path / "pipeline.log"
+    path.write_bytes(b"".join(f"line {idx}\r\n".encode() for idx in range(1000)))
+
+    assert tail_lines(path, limit=3, block_size=16) == ["line 997", "line 998", "line 999"]
+    assert tail_lines(path, limit=5000, block_size=64)[0] == "line 0"
+    assert tail_lines(tmp_path / "missing.log") == []
+
+
+def test_follower_reads_only_new_lines_and_survives_rotation(tmp_path):
+    path = tmp_path / "pipeline.log"
+    path.write_text("old run\n", encoding="utf-8")
+    follower = LogFollower(path)
+    assert follower.read_new() == []
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("first\nsecond, half")
+    assert follower.read_new() == ["first"]
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(" done\nbefore rotation\n")
+    path.rename(tmp_path / "pipeline.log.1")
+    path.write_text("after rotation\n", encoding="utf-8")
+    assert follower.read_new() == ["second, half done", "before rotation", "after rotation"]
+
+    path.write_text("truncated\n", encoding="utf-8")
+    assert follower.read_new() == ["truncated"]
+
+
+def test_follow_log_delivers_lines_written_inside_the_block(tmp_path):
+    path = tmp_path / "pipeline.log"
+    lines = []
+
+    with follow_log(path, lines.append, interval=0.01):
+        path.write_text("created during the run\nsecond line\n", encoding="utf-8")
+
+    assert lines == ["created during the run", "second line"]
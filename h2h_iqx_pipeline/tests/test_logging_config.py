@@ -0,0 +1,101 @@
+import json
+import logging
+import multiprocessing
+import time
+from pathlib import Path
+
+import pytest
+
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.log_tail import LogFollower
+from h2h_pipeline.logging_config import (
+    ForwardedRecordListener,
+    configure_logging,
+    flush_logging,
+    forward_records,
+    log_context,
+    shutdown_logging,
+)
+from h2h_pipeline.pipeline import run_pipeline
+
+
+@pytest.fixture(autouse=True)
+def _stop_listeners():
+    yield
+    shutdown_logging()
+
+
+def test_json_lines_carry_run_stage_elapsed_and_rows(tmp_path):
+    log_file = configure_logging({"paths": {"log_dir": str(tmp_path)}, "logging": {"format": "json"}})
+    assert configure_logging({"paths": {"log_dir": str(tmp_path)}}) == log_file  # no second writer
+
+    log = logging.getLogger("h2h_pipeline.test")
+    with log_context(run_id="run1", run_started=time.perf_counter()):
+        with log_context(stage="dedup", rows_in=10):
+            log.info("kept %d rows", 8, extra={"rows_out": 8})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("failed")
+    flush_logging()
+
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    kept = next(r for r in records if r["message"] == "kept 8 rows")
+    assert kept["run_id"] == "run1" and kept["stage"] == "dedup" and kept["elapsed"] >= 0
+    assert (kept["rows_in"], kept["rows_out"]) == (10, 8)
+    failed = next(r for r in records if r["message"] == "failed")
+    assert "stage" not in failed and "ValueError: boom" in failed["exc"]
+
+
+def test_pipeline_log_rotates_and_the_follower_keeps_up(tmp_path):
+    log_file = configure_logging(
+        {"paths": {"log_dir": str(tmp_path)}, "logging": {"max_bytes": 2000, "backup_count": 2}}
+    )
+    follower = LogFollower(log_file)
+    log = logging.getLogger("h2h_pipeline.test")
+    for idx in range(40):
+        log.info("line %03d", idx)
+    flush_logging()
+
+    assert (tmp_path / "pipeline.log.1").exists() and not (tmp_path / "pipeline.log.3").exists()
+    assert log_file.stat().st_size <= 2000
+    # Lines written since the last rotation; older ones are in the backups.
+    lines = [line for line in follower.read_new() if "h2h_pipeline.test" in line]
+    assert lines and lines[-1].endswith("line 039")
+
+
+def test_run_log_is_complete_when_run_pipeline_returns(sample_run):
+    config = load_config(sample_run["config_path"], overrides={"logging": {"format": "json"}})
+    result = run_pipeline("2025-12", sample_run["input_root"], config)
+
+    log_file = Path(config["paths"]["log_dir"]) / "pipeline.log"
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    ends = [r for r in records if r.get("run_id") == result.run_id and r["message"].startswith("Stage ")]
+    assert [r["stage"] for r in ends][-1] == "qa"
+    dedup_end = next(r for r in ends if r["stage"] == "dedup")
+    assert dedup_end["rows_out"] == next(e.rows_out for e in result.spans if e.stage == "dedup")
+
+
+def _worker(log_queue, log_dir):
+    forward_records(log_queue.put)
+    configure_logging({"paths": {"log_dir": log_dir}})
+    assert not any(isinstance(h, logging.FileHandler) for h in logging.getLogger().handlers)
+    with log_context(run_id="worker-run"):
+        logging.getLogger("h2h_pipeline.test").info("from the worker")
+
+
+def test_worker_records_are_written_by_the_parent_only(tmp_path):
+    log_file = configure_logging({"paths": {"log_dir": str(tmp_path)}, "logging": {"format": "json"}})
+    ctx = multiprocessing.get_context("spawn")
+    log_queue = ctx.Queue()
+    listener = ForwardedRecordListener(log_queue)
+    listener.start()
+    worker = ctx.Process(target=_worker, args=(log_queue, str(tmp_path)))
+    worker.start()
+    worker.join(30)
+    listener.stop()
+    flush_logging()
+
+    assert worker.exitcode == 0
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert [r["run_id"] for r in records if r["message"] == "from the worker"] == ["worker-run"]
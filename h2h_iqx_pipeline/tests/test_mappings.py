@@ -0,0 +1,66 @@
+import json
+import os
+import threading
+
+import pytest
+
+from h2h_pipeline.utils.mappings import MappingRegistry, sidecar_path
+
+
+def test_registry_shares_frozen_views_until_the_file_changes(tmp_path):
+    path = tmp_path / "professions.yml"
+    path.write_text('"Ironworkers": "Structural Iron and Steel Workers"\n', encoding="utf-8")
+    registry = MappingRegistry()
+
+    first = registry.get(path)
+    assert registry.get(str(tmp_path / "." / "professions.yml")) is first
+    with pytest.raises(TypeError):
+        first["Ironworkers"] = "changed"
+
+    path.write_text('"Ironworkers": "Iron Workers"\n"Welders": "Welders"\n', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = registry.get(path)
+    assert second is not first and second["Ironworkers"] == "Iron Workers"
+
+    registry.invalidate(path)
+    assert registry.get(path) is not second and registry.get(path) == second
+
+    path.unlink()
+    assert registry.get(path) == {} and registry.get(None) == {}
+
+
+def test_registry_parses_once_for_concurrent_callers(tmp_path):
+    path = tmp_path / "service_branches.yml"
+    path.write_text("".join(f'"Branch {i}": "Service: {i}"\n' for i in range(500)), encoding="utf-8")
+    registry = MappingRegistry()
+    views = []
+
+    threads = [threading.Thread(target=lambda: views.append(registry.get(path))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(views) == 8 and all(view is views[0] for view in views)
+    assert len(views[0]) == 500
+
+
+def test_sidecar_is_used_while_the_yaml_is_unchanged(tmp_path):
+    path = tmp_path / "professions.yml"
+    path.write_text('"Ironworkers": "Structural Iron and Steel Workers"\n', encoding="utf-8")
+
+    assert MappingRegistry().get(path) == {"Ironworkers": "Structural Iron and Steel Workers"}
+    sidecar = sidecar_path(path)
+    payload = json.loads(sidecar.read_text(encoding="utf-8"))
+    assert payload["data"] == {"Ironworkers": "Structural Iron and Steel Workers"}
+
+    # A fresh process (here: a new registry) reads the sidecar instead of the YAML.
+    payload["data"] = {"Ironworkers": "from sidecar"}
+    sidecar.write_text(json.dumps(payload), encoding="utf-8")
+    assert MappingRegistry().get(path) == {"Ironworkers": "from sidecar"}
+
+    # Any edit changes the hash, so the YAML is parsed again and the sidecar rewritten.
+    path.write_text('"Ironworkers": "Iron Workers"\n', encoding="utf-8")
+    assert MappingRegistry().get(path) == {"Ironworkers": "Iron Workers"}
+    assert json.loads(sidecar.read_text(encoding="utf-8"))["data"] == {"Ironworkers": "Iron Workers"}
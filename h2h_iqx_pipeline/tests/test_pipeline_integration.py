@@ -2,9 +2,12 @@ from pathlib import Path
 
 import pandas as pd
 
+from h2h_pipeline.cancellation import CancelToken
 from h2h_pipeline.pipeline import run_pipeline
 from h2h_pipeline.config_loader import load_config
 
+from .conftest import write_source
+
 
 def test_run_pipeline_end_to_end(tmp_path, monkeypatch):
     # Prepare fixtures
@@ -106,7 +109,8 @@ def test_run_pipeline_end_to_end(tmp_path, monkeypatch):
     loaded = load_config(config_path)
 
     # Run pipeline
-    run_pipeline(month="2025-12", input_root=input_root, config=loaded)
+    events = []
+    result = run_pipeline(month="2025-12", input_root=input_root, config=loaded, hooks=[events.append])
 
     out_dir = Path(config["paths"]["output_root"])
     combo_csv = out_dir / "Bulk Import H2H Combo IBEW 4 8 9 Iron 2025-12-04.csv"
@@ -126,3 +130,32 @@ def test_run_pipeline_end_to_end(tmp_path, monkeypatch):
     content = qa_report.read_text(encoding="utf-8")
     assert "Rows in Combo: 2" in content
     assert "Missing profession mappings: none" in content
+
+    stages = [span.stage for span in result.spans]
+    assert stages == ["discovery", "ingestion", "transform", "dedup", "delta", "export", "upload", "qa"]
+    assert len(events) == 2 * len(stages)
+    assert result.report_path == qa_report
+    spans_file = Path(config["paths"]["log_dir"]) / "pipeline_spans.jsonl"
+    assert len(spans_file.read_text(encoding="utf-8").splitlines()) == len(stages)
+
+
+def test_progress_is_reported_within_each_stage(sample_run):
+    rows = 2500
+    write_source(
+        sample_run["input_root"] / "Vet Talents 2025-12" / "Career Seekers Interested in IBEW D4 11052025-12042025.xlsx",
+        [("Jane", f"Doe{idx}", f"jane{idx}@example.com", f"555{idx:07d}") for idx in range(rows)],
+    )
+    config = load_config(sample_run["config_path"])
+    config["instrumentation"] = {"progress_interval": 0, "spans_file": False}
+    events = []
+
+    run_pipeline("2025-12", sample_run["input_root"], config, progress_hooks=[events.append], cancel=CancelToken())
+
+    def reported(stage):
+        return [(e.rows_done, e.rows_total) for e in events if e.stage == stage]
+
+    # One file, but streamed in 2,000-row chunks rather than reported once at the end.
+    assert reported("ingestion") == [(2000, rows), (rows, rows)]
+    for stage in ("transform", "dedup"):
+        done = [done for done, total in reported(stage) if total == rows]
+        assert len(done) > 2 and done == sorted(done) and done[-1] == rows
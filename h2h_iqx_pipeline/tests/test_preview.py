@@ -0,0 +1,53 @@
+import pandas as pd
+
+from h2h_pipeline import export
+from h2h_pipeline.preview import PreviewTable, snapshot_path
+
+
+def _export(tmp_path, combo_df, **export_cfg):
+    config = {
+        "paths": {"output_root": str(tmp_path / "out")},
+        "iqx_import": {"column_order": ["email", "external_source"]},
+        "export": export_cfg,
+    }
+    return export.write_outputs(run_label="2025-12-04", combo_df=combo_df, dedup_df=combo_df.head(2), config=config)
+
+
+def test_export_writes_snapshots_that_page_and_sort(tmp_path):
+    combo_df = pd.DataFrame(
+        {
+            "external_source": ["IBEW D4", "IBEW D8", "IBEW D4", "IBEW D8", "IBEW D4"],
+            "email": ["c@example.com", "a@example.com", None, "e@example.com", "b@example.com"],
+            "zip": [12345, 23456, 34567, 45678, 56789],
+        }
+    )
+
+    result = _export(tmp_path, combo_df)
+
+    assert result.previews["combo"] == snapshot_path(result["combo_excel"])
+    assert set(result.paths) == {"combo_excel", "dedup_excel", "iqx_csv"}
+    table = PreviewTable(result.previews["combo"])
+    assert table.columns == ["email", "external_source", "zip"] and table.total == 5
+
+    page = table.page(page=1, page_size=2)
+    assert page["rows"] == [[None, "IBEW D4", "34567"], ["e@example.com", "IBEW D8", "45678"]]
+    assert (page["page"], page["pages"]) == (1, 3)
+
+    emails = [row[0] for row in table.page(page_size=10, sort_by="email")["rows"]]
+    assert emails == ["a@example.com", "b@example.com", "c@example.com", "e@example.com", None]
+    assert table.page(page=9, page_size=2, sort_by="email", descending=True)["rows"] == [[None, "IBEW D4", "34567"]]
+    table.close()
+
+    assert PreviewTable(result.previews["dedup"]).total == 2
+
+
+def test_unchanged_output_keeps_snapshot_and_preview_can_be_disabled(tmp_path):
+    combo_df = pd.DataFrame({"external_source": ["IBEW D4"], "email": ["a@example.com"]})
+    first = _export(tmp_path, combo_df)
+    written = first.previews["combo"].stat().st_mtime_ns
+
+    second = _export(tmp_path, combo_df)
+    assert "combo_excel" in second.skipped
+    assert second.previews["combo"].stat().st_mtime_ns == written
+
+    assert _export(tmp_path, combo_df, preview=False).previews == {}
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from h2h_pipeline.cancellation import CancelToken, RunCancelled
+from h2h_pipeline.config_loader import load_config
+from h2h_pipeline.logging_config import flush_logging
+from h2h_pipeline.process_runner import WarmWorker, gui_backend, run_in_subprocess
+
+
+def test_run_in_subprocess_relays_events_logs_and_result(sample_run):
+    config = load_config(sample_run["config_path"])
+    stages, progress, logs = [], [], []
+
+    result = run_in_subprocess(
+        "2025-12",
+        sample_run["input_root"],
+        config,
+        hooks=[stages.append],
+        progress_hooks=[progress.append],
+        on_log=logs.append,
+    )
+
+    assert result.run_label == "2025-12-04"
+    assert result.export_paths["iqx_csv"].exists()
+    assert [e.stage for e in stages if e.phase == "end"] == [
+        "discovery",
+        "ingestion",
+        "transform",
+        "dedup",
+        "delta",
+        "export",
+        "upload",
+        "qa",
+    ]
+    assert all(e.phase == "progress" for e in progress)
+    assert any("QA report written to" in line for line in logs)
+    # The child sends its records here instead of writing (and rotating) the log itself.
+    flush_logging()
+    log_text = (Path(config["paths"]["log_dir"]) / "pipeline.log").read_text(encoding="utf-8")
+    assert "QA report written to" in log_text
+
+
+def test_run_in_subprocess_cancel_raises_with_partial_report(sample_run):
+    config = load_config(sample_run["config_path"])
+    token = CancelToken()
+    token.cancel()
+
+    with pytest.raises(RunCancelled) as info:
+        run_in_subprocess("2025-12", sample_run["input_root"], config, cancel=token)
+
+    assert info.value.stage == "discovery"
+    assert info.value.report_path.read_text(encoding="utf-8").startswith("QA report for 2025-12-04 (incomplete)")
+
+
+def test_gui_backend_defaults_to_process():
+    assert gui_backend({}) == "process"
+    assert gui_backend({"execution": {"gui_backend": "Thread"}}) == "thread"
+    with pytest.raises(ValueError):
+        gui_backend({"execution": {"gui_backend": "fork"}})
+
+
+def test_warm_worker_warms_up_then_runs_the_pipeline(sample_run):
+    config = load_config(sample_run["config_path"])
+    worker = WarmWorker(sample_run["config_path"])
+
+    ready = worker.wait_ready()
+    assert ready.error is None and ready.config_path == sample_run["config_path"]
+    assert ready.mappings == len(config["mappings"])
+
+    first = worker.run("2025-12", sample_run["input_root"], config)
+    assert worker.available
+    # The worker keeps parsed source files, so the second run re-reads none of them.
+    logs = []
+    second = worker.run("2025-12", sample_run["input_root"], config, on_log=logs.append)
+    assert second.export_paths["iqx_csv"].exists() and second.run_id != first.run_id
+    assert any("Reusing parsed" in line for line in logs)
+
+    result = run_in_subprocess("2025-12", sample_run["input_root"], config, worker=worker)
+    assert result.export_paths["iqx_csv"].exists()
+    assert not worker.available
+
+    idle = WarmWorker()
+    assert idle.wait_ready().config_path is None
+    idle.close()
+    assert not idle.available
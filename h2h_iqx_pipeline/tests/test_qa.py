@@ -3,7 +3,7 @@ from pathlib import Path
 import pandas as pd
 
 from h2h_pipeline import qa
-from h2h_pipeline.models import DedupResult, ValidationReport, DiscoveryResult
+from h2h_pipeline.models import DedupResult, DiscoveryResult, ExportResult, ValidationReport
 
 
 def test_qa_report_includes_validation(tmp_path):
@@ -48,3 +48,28 @@ def test_qa_report_includes_validation(tmp_path):
     assert "Missing required columns: ['phone_number']" in content
     assert "IBEW D4: 1" in content
     assert "Missing source files for: IBEW D8" in content
+
+
+def test_qa_report_lists_skipped_outputs(tmp_path):
+    combo = pd.DataFrame({"email": ["a@example.com"]})
+    dedup_result = DedupResult(cleaned_df=combo, duplicates_df=combo.iloc[0:0])
+    export_result = ExportResult(
+        paths={"combo_excel": tmp_path / "combo.xlsx", "iqx_csv": tmp_path / "iqx.csv"},
+        skipped=["combo_excel"],
+    )
+    discovery = DiscoveryResult(month="2025-12", input_root=tmp_path)
+
+    report = qa.generate_report(
+        run_label="2025-12-04",
+        combo_df=combo,
+        dedup_result=dedup_result,
+        export_paths=export_result,
+        validation=ValidationReport(),
+        discovery=discovery,
+        counts_before={},
+        counts_after={},
+        config={"paths": {"output_root": str(tmp_path)}},
+    )
+
+    content = Path(report).read_text(encoding="utf-8")
+    assert "Skipped outputs (contents unchanged):\n- combo_excel" in content
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from h2h_pipeline.run_queue import RunQueue
+
+
+def _wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert predicate()
+
+
+def test_jobs_for_one_month_share_a_lane_and_other_months_run_alongside():
+    release = threading.Event()
+    lanes, order = {}, []
+
+    def run_job(job, lane):
+        order.append(job.month)
+        lanes.setdefault(job.month, set()).add(id(lane))
+        if job.month == "2025-11":
+            release.wait(10)
+        return None
+
+    runs = RunQueue(run_job, workers=2)
+    first = runs.submit("a.yml", "in", "", "2025-11")
+    second = runs.submit("b.yml", "in", "", "2025-11")
+    other = runs.submit("a.yml", "in", "", "2025-12")
+
+    # 2025-12 runs on the second worker while 2025-11 still holds the first.
+    _wait_until(lambda: other.status == "succeeded" and first.status == "running")
+    assert second.status == "queued"
+
+    release.set()
+    _wait_until(lambda: not runs.busy)
+    assert [job.status for job in (first, second, other)] == ["succeeded"] * 3
+    assert sorted(order) == ["2025-11", "2025-11", "2025-12"] and order[-1] == "2025-11"
+    assert len(lanes["2025-11"]) == 1
+
+    payload = second.to_dict()
+    assert payload["config_path"] == "b.yml"
+    assert payload["queued_seconds"] >= 0 and payload["run_seconds"] >= 0
+
+
+def test_cancel_drops_queued_jobs_and_records_failures():
+    release = threading.Event()
+    changes = []
+
+    def run_job(job, lane):
+        release.wait(10)
+        raise ValueError("broken config")
+
+    runs = RunQueue(run_job, workers=1, on_change=lambda job: changes.append((job.id, job.status)))
+    running = runs.submit("bad.yml", "in", "", "2025-12")
+    queued = runs.submit("a.yml", "in", "", "2025-12")
+
+    assert runs.cancel(queued.id).status == "cancelled"
+    assert runs.cancel("missing") is None
+    release.set()
+    _wait_until(lambda: not runs.busy)
+
+    assert running.status == "failed" and running.error == "broken config"
+    assert queued.error == "Cancelled by user" and queued.to_dict()["run_seconds"] is None
+    assert (queued.id, "cancelled") in changes and (running.id, "failed") in changes
@@ -0,0 +1,152 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from h2h_pipeline import service as service_module
+from h2h_pipeline.service import PipelineService, ServiceBusy, make_server
+
+
+@pytest.fixture
+def server(sample_run):
+    service = PipelineService(sample_run["config_path"], sample_run["input_root"], workers=1, max_queue=1)
+    httpd = make_server(service, port=0, token="secret")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield service, httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+    service.shutdown()
+
+
+def _request(port, method, path, body=None, token="secret", content_type="application/json"):
+    headers = {"Content-Type": content_type}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, data
+
+
+def test_service_runs_pipeline_and_streams_events(server):
+    service, port = server
+
+    status, body = _request(port, "POST", "/runs", {"month": "2025-12"})
+    assert status == 202
+    job_id = json.loads(body)["id"]
+
+    status, stream = _request(port, "GET", f"/runs/{job_id}/events")
+    events = [json.loads(line) for line in stream.decode("utf-8").splitlines()]
+    stages = [e["stage"] for e in events if e["type"] == "stage" and e["phase"] == "end"]
+    assert stages == ["discovery", "ingestion", "transform", "dedup", "delta", "export", "upload", "qa"]
+    assert events[-1] == {"type": "status", "status": "succeeded", "timestamp": events[-1]["timestamp"]}
+
+    status, body = _request(port, "GET", f"/runs/{job_id}")
+    payload = json.loads(body)
+    assert payload["status"] == "succeeded"
+    assert payload["qa_summary"].startswith("QA report for 2025-12-04")
+    assert payload["export_paths"]["iqx_csv"].endswith(".csv")
+    assert payload["config"] is None and payload["run_seconds"] >= 0 and payload["queued_seconds"] >= 0
+
+    # A second request for the same month, even with its own config file, reuses the warm checkpoints.
+    second = service.submit("2025-12", config_path=service.config_path)
+    assert second.wait(timeout=30)
+    cached = [e["stage"] for e in second.events if e["type"] == "stage" and e["phase"] == "end" and e["cached"]]
+    assert cached == ["ingestion", "transform", "dedup"]
+
+
+def test_service_rejects_bad_requests(server):
+    _service, port = server
+
+    assert _request(port, "POST", "/runs", {"month": "December"})[0] == 400
+    assert _request(port, "POST", "/runs", {"month": "2025-12", "config": "missing.yml"})[0] == 400
+    assert _request(port, "GET", "/runs/missing")[0] == 404
+    assert _request(port, "GET", "/health", token=None)[0] == 200
+
+
+def test_service_requires_token_json_and_safe_overrides(server, sample_run, tmp_path):
+    _service, port = server
+    run = {"month": "2025-12"}
+
+    assert _request(port, "POST", "/runs", run, token=None)[0] == 401
+    assert _request(port, "POST", "/runs", run, token="wrong")[0] == 401
+    assert _request(port, "GET", "/runs", token=None)[0] == 401
+    assert _request(port, "POST", "/runs", run, content_type="text/plain")[0] == 415
+
+    for overrides in (
+        {"upload": {"enabled": True, "url": "http://example.invalid"}},
+        {"paths": {"output_root": str(tmp_path)}},
+        {"mappings": {"professions": "/etc/passwd"}},
+        {"checkpoints": {"enabled": True}},
+        {"run": {"previous_combo": "/tmp/other.xlsx"}},
+        {"run": {"output_date": "../../escape"}},
+    ):
+        status, body = _request(port, "POST", "/runs", {**run, "overrides": overrides})
+        assert status == 400, overrides
+
+    outside = tmp_path.parent / "outside.yml"
+    outside.write_text(sample_run["config_path"].read_text(encoding="utf-8"), encoding="utf-8")
+    assert _request(port, "POST", "/runs", {**run, "config": str(outside)})[0] == 400
+    assert _request(port, "POST", "/runs", {**run, "config": "../outside.yml"})[0] == 400
+
+    with pytest.raises(ValueError):
+        make_server(_service, host="0.0.0.0", port=0)
+
+
+def test_service_queue_is_bounded(sample_run, monkeypatch):
+    service = PipelineService(sample_run["config_path"], sample_run["input_root"], workers=1, max_queue=1)
+    release = threading.Event()
+    run_job = service._run_job
+    monkeypatch.setattr(service, "_run_job", lambda job: (release.wait(10), run_job(job)))
+    try:
+        running = service.submit("2025-12")
+        waiting = service.submit("2025-12")
+        with pytest.raises(ServiceBusy):
+            service.submit("2025-12")
+    finally:
+        release.set()
+        service.shutdown()
+    assert running.status == waiting.status == "succeeded"
+
+
+def test_service_cancels_queued_run(server, monkeypatch):
+    service, port = server
+    release = threading.Event()
+    run_job = service._run_job
+    monkeypatch.setattr(service, "_run_job", lambda job: (release.wait(10), run_job(job)))
+
+    job = service.submit("2025-12")
+    assert _request(port, "POST", f"/runs/{job.id}/cancel")[0] == 202
+    release.set()
+    assert job.wait(timeout=30)
+
+    assert job.status == "cancelled"
+    assert job.error == "Cancelled by request"
+    assert _request(port, "POST", f"/runs/{job.id}/cancel")[0] == 409
+    assert _request(port, "POST", "/runs/missing/cancel")[0] == 404
+
+
+def test_service_keeps_only_recent_months_warm(sample_run, monkeypatch):
+    monkeypatch.setattr(service_module, "MAX_WARM_MONTHS", 2)
+    monkeypatch.setattr(service_module, "MAX_CACHED_CONFIGS", 2)
+    service = PipelineService(sample_run["config_path"], sample_run["input_root"], workers=1)
+    try:
+        for month in ("2025-10", "2025-11", "2025-12"):
+            overrides = {"run": {"output_date": f"{month}-04"}}
+            assert service.submit(month, overrides=overrides).wait(timeout=30)
+
+        root = str(sample_run["input_root"])
+        assert list(service._warm) == [("2025-11", root), ("2025-12", root)]
+        assert len(service._configs) == 2
+
+        # The months still warm keep their checkpoints.
+        again = service.submit("2025-12", overrides={"run": {"output_date": "2025-12-04"}})
+        assert again.wait(timeout=30)
+        cached = [e["stage"] for e in again.events if e["type"] == "stage" and e["phase"] == "end" and e["cached"]]
+        assert cached == ["ingestion", "transform", "dedup"]
+    finally:
+        service.shutdown()
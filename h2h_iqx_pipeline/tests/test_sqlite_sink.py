@@ -0,0 +1,58 @@
+import sqlite3
+
+import pandas as pd
+
+from h2h_pipeline import sqlite_sink
+
+
+def _frame(emails, professions):
+    return pd.DataFrame(
+        {
+            "email": emails,
+            "phone_number": ["555-111-2222", pd.NA][: len(emails)],
+            "last_name": ["Doe", "Roe"][: len(emails)],
+            "first_name": ["Jane", "Sam"][: len(emails)],
+            "location_zip": ["12345", "67890"][: len(emails)],
+            "profession": professions,
+        }
+    )
+
+
+def test_load_frame_per_run_creates_table_and_indexes(tmp_path):
+    db_path = tmp_path / "staging.db"
+    df = _frame(["jane@example.com", "sam@example.com"], ["Electricians", "Electricians"])
+
+    stats = sqlite_sink.load_frame(df, db_path, run_label="2025-12-04", batch_size=1)
+
+    assert stats.table == "run_2025_12_04"
+    assert stats.rows == 2
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        rows = conn.execute('SELECT email, phone_number, _norm_phone FROM "run_2025_12_04" ORDER BY email').fetchall()
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list('run_2025_12_04')")}
+    finally:
+        conn.close()
+    assert rows == [("jane@example.com", "555-111-2222", "5551112222"), ("sam@example.com", None, "")]
+    assert "idx_run_2025_12_04_norm_email" in indexes
+
+
+def test_load_frame_history_upserts_by_record_key(tmp_path):
+    db_path = tmp_path / "staging.db"
+    sqlite_sink.load_frame(_frame(["jane@example.com"], ["Electricians"]), db_path, "2025-11-04", mode="history")
+    sqlite_sink.load_frame(
+        _frame(["JANE@example.com", "sam@example.com"], ["Ironworkers", "Electricians"]),
+        db_path,
+        "2025-12-04",
+        mode="history",
+    )
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT _record_key, profession, _run_label FROM h2h_history ORDER BY _record_key").fetchall()
+    finally:
+        conn.close()
+    assert rows == [
+        ("email:jane@example.com", "Ironworkers", "2025-12-04"),
+        ("email:sam@example.com", "Electricians", "2025-12-04"),
+    ]
@@ -0,0 +1,94 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from h2h_pipeline import upload
+
+
+class _StandInServer:
+    """Local stand-in for the bulk import endpoint."""
+
+    def __init__(self, fail_first: int = 0, reject_parts=()):
+        self.received: list[tuple[int, bytes]] = []
+        self.client_ports: set[int] = set()
+        self.fail_first = fail_first
+        self.reject_parts = set(reject_parts)
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                part = int(self.headers["X-Part-Index"])
+                with server._lock:
+                    server.client_ports.add(self.client_address[1])
+                    if server.fail_first > 0:
+                        server.fail_first -= 1
+                        status = 503
+                    elif part in server.reject_parts:
+                        status = 400
+                    else:
+                        server.received.append((part, body))
+                        status = 200
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/bulk-import"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "Bulk Import 2025-12-04.csv"
+    lines = ["email,phone_number"] + [f"user{i}@example.com,555-000-{i:04d}" for i in range(10)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_upload_csv_posts_parts_over_reused_connections(csv_file):
+    with _StandInServer(fail_first=1) as server:
+        result = upload.upload_csv(
+            csv_file,
+            server.url,
+            {"rows_per_part": 3, "max_concurrency": 2, "backoff_seconds": 0.01},
+        )
+
+    assert result.parts_total == 4
+    assert result.parts_uploaded == 4
+    assert result.failed_parts == []
+    assert sorted(part for part, _ in server.received) == [0, 1, 2, 3]
+    assert all(body.startswith(b"email,phone_number\n") for _, body in server.received)
+    assert len(server.client_ports) <= 3  # two pooled connections plus one replaced after the 503 retry
+    assert result.latency_percentile(95) > 0
+
+
+def test_upload_csv_resumes_from_checkpoint(csv_file):
+    with _StandInServer(reject_parts=[1]) as server:
+        first = upload.upload_csv(csv_file, server.url, {"rows_per_part": 3, "max_retries": 0})
+        server.reject_parts.clear()
+        resumed = upload.upload_csv(csv_file, server.url, {"rows_per_part": 3})
+
+    assert first.failed_parts == [1]
+    assert resumed.parts_resumed == 3
+    assert resumed.parts_uploaded == 1
+    assert [part for part, _ in server.received].count(1) == 1
+
+
+def test_upload_outputs_disabled_returns_none(csv_file):
+    assert upload.upload_outputs({"iqx_csv": csv_file}, config={}) is None
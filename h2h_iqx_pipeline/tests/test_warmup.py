@@ -0,0 +1,19 @@
+from h2h_pipeline.warmup import warm_up
+
+
+def test_warm_up_loads_config_and_mappings(sample_run):
+    result = warm_up(sample_run["config_path"])
+
+    assert result.error is None
+    assert result.mappings == 3
+    assert 0 <= result.import_seconds <= result.seconds
+
+
+def test_warm_up_reports_a_broken_config_instead_of_raising(tmp_path):
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("paths: {}\n", encoding="utf-8")
+
+    result = warm_up(config_path)
+
+    assert "missing required sections" in result.error
+    assert result.mappings == 0
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+from h2h_pipeline.watch import Watcher
+
+from .conftest import write_source
+
+
+def _cached(result):
+    return [span.stage for span in result.spans if span.phase == "end" and span.cached]
+
+
+def _watcher(sample_run):
+    return Watcher(sample_run["config_path"], sample_run["input_root"], month="2025-12", interval=0)
+
+
+def test_watch_reruns_only_stages_after_a_mapping_change(sample_run):
+    watcher = _watcher(sample_run)
+
+    first = watcher.poll_once()
+    assert first is not None and _cached(first) == []
+    assert watcher.poll_once() is None
+
+    with open(watcher.config["mappings"]["source_priority"], "a", encoding="utf-8") as handle:
+        handle.write('"IBEW D8": 80\n')
+    assert watcher.poll_once() is None  # waits one poll for the change to settle
+    second = watcher.poll_once()
+
+    assert _cached(second) == ["ingestion", "transform"]
+    assert watcher.runs == 2
+
+
+def test_watch_picks_up_new_exports_and_reuses_parsed_files(sample_run):
+    config_path = Path(sample_run["config_path"])
+    config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config["sources"].append(
+        {"name": "IBEW D8", "code": "IBEW_8", "file_pattern": "Career Seekers Interested in IBEW D8 *.xlsx"}
+    )
+    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    month_dir = sample_run["input_root"] / "Vet Talents 2025-12"
+    unchanged = month_dir / "Career Seekers Interested in IBEW D8 11052025-12042025.xlsx"
+    write_source(unchanged, [("Bo", "Kim", "bo@example.com", "5557778888")])
+
+    watcher = _watcher(sample_run)
+    watcher.poll_once()
+    parsed = dict(watcher.frame_cache)
+    unchanged_keys = {key for key in parsed if key[0] == str(unchanged)}
+    assert len(unchanged_keys) == 1
+
+    path = next(month_dir.glob("*IBEW D4*.xlsx"))
+    write_source(path, [("Ann", "Lee", "ann@example.com", "5550001111")] * 3)
+    watcher.poll_once()
+    result = watcher.poll_once()
+
+    assert _cached(result) == []
+    assert len(pd.read_csv(result.export_paths["iqx_csv"])) == 2
+    # The rewritten file was parsed again; the unchanged one kept its cache entry.
+    changed_keys = set(watcher.frame_cache) - unchanged_keys
+    assert changed_keys and changed_keys.isdisjoint(parsed)
+    (key,) = unchanged_keys
+    assert watcher.frame_cache[key] is parsed[key]
+
+
+def test_watch_reloads_config_without_restart(sample_run):
+    watcher = _watcher(sample_run)
+    watcher.poll_once()
+    config_path = Path(sample_run["config_path"])
+    original = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+
+    config_path.write_text("paths: [", encoding="utf-8")
+    watcher.poll_once()
+    assert watcher.config["defaults"]["industry"] == "23 Construction"
+
+    original["defaults"]["industry"] = "24 Electrical"
+    config_path.write_text(yaml.safe_dump(original), encoding="utf-8")
+    watcher.poll_once()
+    result = watcher.poll_once()
+
+    assert watcher.config["defaults"]["industry"] == "24 Electrical"
+    assert _cached(result) == ["ingestion"]
+    assert pd.read_csv(result.export_paths["iqx_csv"])["industry"].unique().tolist() == ["24 Electrical"]
@@ -0,0 +1,142 @@
+import json
+import time
+
+import pandas as pd
+
+from h2h_pipeline import export, webview_app
+from h2h_pipeline.models import StageEvent
+from h2h_pipeline.webview_app import PipelineWebAPI
+
+
+def test_get_updates_coalesces_progress_to_the_newest_event():
+    api = PipelineWebAPI()
+    api._enqueue_log("Starting pipeline run...")
+    for done in (10, 20, 30):
+        api._enqueue_progress(
+            StageEvent(run_id="r", stage="ingestion", phase="progress", timestamp=0.0, rows_done=done, rows_total=40)
+        )
+    api._enqueue_status("Running pipeline...")
+
+    updates = api.get_updates()
+
+    assert [u["type"] for u in updates] == ["log", "status", "progress"]
+    assert updates[-1]["rows_done"] == 30 and updates[-1]["fraction"] == 0.75
+    assert updates[-1]["message"] == "Ingestion: 30 / 40 rows"
+    assert api.get_updates() == []
+
+
+class _FakeWindow:
+    def __init__(self):
+        self.scripts = []
+
+    def evaluate_js(self, script):
+        self.scripts.append(script)
+
+
+def test_push_sends_queued_updates_as_one_batch(monkeypatch):
+    monkeypatch.setattr(webview_app, "PUSH_INTERVAL", 0.01)
+    api = PipelineWebAPI()
+    assert api.enable_push() is False
+
+    window = _FakeWindow()
+    api.bind_window(window)
+    api._enqueue_log("stale line")
+    api._put({"type": "log_clear"})
+    for idx in range(500):
+        api._enqueue_log(f"line {idx}")
+    api._enqueue_status("Running pipeline...")
+    assert api.enable_push() is True
+
+    deadline = time.monotonic() + 5
+    while not window.scripts and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(window.scripts) == 1
+    script = window.scripts[0]
+    assert script.startswith("window.receiveUpdates(") and script.endswith(")")
+    updates = json.loads(script[len("window.receiveUpdates(") : -1])
+    assert [u["type"] for u in updates[:2]] == ["log_clear", "log"]
+    assert len(updates) == 502 and updates[-1] == {"type": "status", "message": "Running pipeline..."}
+
+
+def test_preview_pages_come_from_the_last_run_snapshots(tmp_path):
+    combo_df = pd.DataFrame({"email": [f"user{idx:03d}@example.com" for idx in range(250)]})
+    result = export.write_outputs(
+        run_label="2025-12-04", combo_df=combo_df, dedup_df=combo_df, config={"paths": {"output_root": str(tmp_path)}}
+    )
+    api = PipelineWebAPI()
+    assert api.get_preview_page("combo")["ok"] is False
+
+    api._preview_paths = dict(result.previews)
+    assert api.list_previews()["tables"][0] == {"key": "combo", "label": "Combo", "rows": 250}
+
+    page = api.get_preview_page("combo", page=1, page_size=100, sort_by="email", descending=True)
+    assert page["ok"] and len(page["rows"]) == 100
+    assert page["rows"][0] == ["user149@example.com"]
+    json.dumps(page)
+
+    api._close_previews()
+    assert api.list_previews() == {"ok": True, "tables": []}
+
+
+def test_time_to_first_row_is_logged_once():
+    api = PipelineWebAPI()
+    api._run_started = time.perf_counter()
+    for done in (0, 10, 20):
+        api._enqueue_progress(
+            StageEvent(run_id="r", stage="ingestion", phase="progress", timestamp=0.0, rows_done=done, rows_total=40)
+        )
+
+    logs = [u["message"] for u in api.get_updates() if u["type"] == "log"]
+    assert len(logs) == 1 and logs[0].startswith("Time to first row: ")
+
+
+def test_runs_submitted_while_busy_are_queued(sample_run, tmp_path, monkeypatch):
+    monkeypatch.setattr(webview_app, "SETTINGS_PATH", tmp_path / "settings.json")
+    api = PipelineWebAPI()
+    config_path = str(sample_run["config_path"])
+    input_root = str(sample_run["input_root"])
+    try:
+        first = api.run_pipeline(config_path, input_root, "", "2025-12")
+        second = api.run_pipeline(config_path, input_root, "", "2025-12")
+        assert first["ok"] and second["ok"]
+
+        deadline = time.monotonic() + 60
+        while api._running and time.monotonic() < deadline:
+            time.sleep(0.05)
+        jobs = api.list_jobs()["jobs"]
+        assert [job["status"] for job in jobs] == ["succeeded", "succeeded"]
+        assert jobs[0]["run_seconds"] > 0 and jobs[1]["queued_seconds"] > 0
+        # The second job waited for the first on the same lane.
+        first_job, second_job = api._runs.jobs()
+        assert second_job.started >= first_job.finished
+
+        updates = api.get_updates()
+        pushed = [u for u in updates if u["type"] == "jobs"]
+        assert len(pushed) == 1 and [job["status"] for job in pushed[0]["jobs"]] == ["succeeded", "succeeded"]
+        assert any("Reusing parsed" in u["message"] for u in updates if u["type"] == "log")
+    finally:
+        api.close()
+
+
+def test_state_shows_the_tail_of_the_last_runs_log(tmp_path, monkeypatch):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"output_root": str(tmp_path / "out")}), encoding="utf-8")
+    monkeypatch.setattr(webview_app, "SETTINGS_PATH", settings_path)
+    log_file = tmp_path / "out" / "logs" / "pipeline.log"
+    log_file.parent.mkdir(parents=True)
+    log_file.write_text("".join(f"line {i}\n" for i in range(500)), encoding="utf-8")
+
+    state = PipelineWebAPI().get_state()
+
+    assert state["log_ready"] and state["last_log_file"] == str(log_file)
+    assert state["log_tail"][0] == "---- Pipeline log (tail) ----"
+    assert state["log_tail"][1:] == [f"line {i}" for i in range(300, 500)]
+
+
+def test_state_has_no_log_tail_before_any_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(webview_app, "SETTINGS_PATH", tmp_path / "settings.json")
+
+    state = PipelineWebAPI().get_state()
+
+    assert state["log_tail"] == [] and not state["log_ready"]
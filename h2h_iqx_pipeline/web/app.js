@@ -4,37 +4,65 @@ const elements = {
   outputRoot: document.getElementById("outputRoot"),
   month: document.getElementById("month"),
   runButton: document.getElementById("runButton"),
+  cancelButton: document.getElementById("cancelButton"),
   openOutputButton: document.getElementById("openOutputButton"),
   openLogButton: document.getElementById("openLogButton"),
   configBrowse: document.getElementById("configBrowse"),
   inputBrowse: document.getElementById("inputBrowse"),
   outputBrowse: document.getElementById("outputBrowse"),
   statusPill: document.getElementById("statusPill"),
+  progress: document.getElementById("progress"),
+  progressBar: document.getElementById("progressBar"),
+  progressLabel: document.getElementById("progressLabel"),
   logOutput: document.getElementById("logOutput"),
+  logSpacer: document.getElementById("logSpacer"),
+  logWindow: document.getElementById("logWindow"),
   outputPathLabel: document.getElementById("outputPathLabel"),
   logPathLabel: document.getElementById("logPathLabel"),
+  previewPanel: document.getElementById("previewPanel"),
+  previewSelect: document.getElementById("previewSelect"),
+  previewPrev: document.getElementById("previewPrev"),
+  previewNext: document.getElementById("previewNext"),
+  previewRange: document.getElementById("previewRange"),
+  previewGrid: document.getElementById("previewGrid"),
+  jobList: document.getElementById("jobList"),
 };
 
 let api = null;
 let polling = false;
+let pollTimer = null;
 let lastOutputRoot = "";
 let lastLogFile = "";
-const maxLogLines = 500;
+const maxLogLines = 50000;
+
+// The log is virtualized: every line lives in logView.lines, but only the rows
+// inside the viewport (plus a small overscan) are in the DOM, as one text node.
+const logView = {
+  lines: [],
+  lineHeight: 16,
+  padding: 12,
+  overscan: 20,
+  follow: true,
+  frame: 0,
+};
 
 function setRunning(running) {
   document.body.dataset.running = running ? "true" : "false";
-  elements.runButton.disabled = running;
+  // Runs submitted while others are going are queued, so the run button stays enabled.
+  elements.runButton.textContent = running ? "Queue another run" : "Run pipeline";
+  elements.cancelButton.disabled = !running;
   elements.openOutputButton.disabled = running || !lastOutputRoot;
   elements.openLogButton.disabled = running || !lastLogFile;
+  if (!running) resetProgress();
   updateStage(running);
   updatePathLabels();
 }
 
 function statusClass(text) {
   const lower = text.toLowerCase();
-  if (lower.includes("error")) return "error";
+  if (lower.includes("error") || lower.includes("cancel")) return "error";
   if (lower.includes("running")) return "running";
-  if (lower.includes("complete") || lower.includes("done")) return "done";
+  if (lower.includes("complete") || lower.includes("done") || lower.includes("ready")) return "done";
   return "idle";
 }
 
@@ -43,6 +71,20 @@ function setStatus(text) {
   elements.statusPill.className = `pill ${statusClass(text)}`;
 }
 
+function setProgress(event) {
+  if (document.body.dataset.running !== "true") return;
+  const known = typeof event.fraction === "number";
+  elements.progress.classList.toggle("determinate", known);
+  elements.progressBar.style.width = known ? `${Math.round(event.fraction * 100)}%` : "";
+  elements.progressLabel.textContent = event.message || "";
+}
+
+function resetProgress() {
+  elements.progress.classList.remove("determinate");
+  elements.progressBar.style.width = "";
+  elements.progressLabel.textContent = "";
+}
+
 function updateStage(running) {
   const stage = running ? "running" : lastOutputRoot ? "done" : "idle";
   document.body.dataset.stage = stage;
@@ -58,18 +100,219 @@ function updatePathLabels() {
   }
 }
 
-function appendLog(message) {
-  const line = document.createElement("div");
-  line.textContent = message;
-  elements.logOutput.appendChild(line);
-  while (elements.logOutput.children.length > maxLogLines) {
-    elements.logOutput.removeChild(elements.logOutput.firstChild);
+function logAtBottom() {
+  const el = elements.logOutput;
+  return el.scrollHeight - el.scrollTop - el.clientHeight <= logView.lineHeight;
+}
+
+function scheduleLogRender() {
+  if (!logView.frame) {
+    logView.frame = window.requestAnimationFrame(renderLog);
   }
-  elements.logOutput.scrollTop = elements.logOutput.scrollHeight;
+}
+
+function renderLog() {
+  logView.frame = 0;
+  const el = elements.logOutput;
+  const { lines, lineHeight, padding, overscan } = logView;
+  elements.logSpacer.style.height = `${lines.length * lineHeight + padding * 2}px`;
+  if (logView.follow) {
+    el.scrollTop = el.scrollHeight;
+  }
+  const firstVisible = Math.floor(Math.max(0, el.scrollTop - padding) / lineHeight);
+  const first = Math.max(0, firstVisible - overscan);
+  const last = Math.min(lines.length, firstVisible + Math.ceil(el.clientHeight / lineHeight) + overscan);
+  elements.logWindow.style.transform = `translateY(${first * lineHeight}px)`;
+  elements.logWindow.textContent = lines.slice(first, last).join("\n");
+}
+
+function appendLogLines(messages) {
+  if (!messages.length) return;
+  logView.follow = logView.follow || logAtBottom();
+  const lines = logView.lines;
+  for (const message of messages) {
+    lines.push(...String(message).split("\n"));
+  }
+  // Trim in steps so a steady stream does not shift the whole array on every batch.
+  if (lines.length > maxLogLines + 1000) {
+    lines.splice(0, lines.length - maxLogLines);
+  }
+  scheduleLogRender();
+}
+
+function appendLog(message) {
+  appendLogLines([message]);
 }
 
 function clearLog() {
-  elements.logOutput.textContent = "";
+  logView.lines = [];
+  logView.follow = true;
+  scheduleLogRender();
+}
+
+// Pages of the last run's outputs are fetched on demand; Python serializes
+// only the rows of the requested page.
+const preview = {
+  key: "",
+  page: 0,
+  pages: 1,
+  pageSize: 100,
+  sortBy: "",
+  descending: false,
+  columns: [],
+  request: 0,
+};
+
+function hidePreview() {
+  preview.key = "";
+  elements.previewPanel.hidden = true;
+}
+
+async function loadPreviews() {
+  if (!api) return;
+  const result = await api.list_previews();
+  const tables = result?.ok ? result.tables : [];
+  if (!tables.length) {
+    hidePreview();
+    return;
+  }
+  elements.previewSelect.textContent = "";
+  for (const table of tables) {
+    const option = document.createElement("option");
+    option.value = table.key;
+    option.textContent = `${table.label} (${table.rows.toLocaleString()} rows)`;
+    elements.previewSelect.appendChild(option);
+  }
+  elements.previewPanel.hidden = false;
+  selectPreview(tables[0].key);
+}
+
+function selectPreview(key) {
+  elements.previewSelect.value = key;
+  Object.assign(preview, { key, page: 0, sortBy: "", descending: false, columns: [] });
+  loadPreviewPage();
+}
+
+async function loadPreviewPage() {
+  if (!api || !preview.key) return;
+  const request = ++preview.request;
+  const result = await api.get_preview_page(
+    preview.key,
+    preview.page,
+    preview.pageSize,
+    preview.sortBy,
+    preview.descending
+  );
+  if (request !== preview.request) return;
+  if (!result || !result.ok) {
+    appendLog(`ERROR: ${result?.error || "Unable to load the preview."}`);
+    return;
+  }
+  preview.page = result.page;
+  preview.pages = result.pages;
+  renderPreview(result);
+}
+
+function renderPreview(result) {
+  const grid = elements.previewGrid;
+  if (result.columns.join("\u001f") !== preview.columns.join("\u001f")) {
+    preview.columns = result.columns;
+    const row = document.createElement("tr");
+    for (const column of result.columns) {
+      const th = document.createElement("th");
+      th.textContent = column;
+      th.dataset.column = column;
+      row.appendChild(th);
+    }
+    grid.tHead.textContent = "";
+    grid.tHead.appendChild(row);
+  }
+  for (const th of grid.tHead.querySelectorAll("th")) {
+    const sorted = th.dataset.column === result.sort_by;
+    th.dataset.sort = sorted ? (result.descending ? "desc" : "asc") : "";
+  }
+
+  const body = document.createDocumentFragment();
+  for (const values of result.rows) {
+    const row = document.createElement("tr");
+    for (const value of values) {
+      const cell = document.createElement("td");
+      cell.textContent = value ?? "";
+      row.appendChild(cell);
+    }
+    body.appendChild(row);
+  }
+  grid.tBodies[0].textContent = "";
+  grid.tBodies[0].appendChild(body);
+
+  const first = result.total ? result.page * result.page_size + 1 : 0;
+  const last = Math.min(result.total, (result.page + 1) * result.page_size);
+  elements.previewRange.textContent =
+    `${first.toLocaleString()}-${last.toLocaleString()} of ${result.total.toLocaleString()}`;
+  elements.previewPrev.disabled = result.page <= 0;
+  elements.previewNext.disabled = result.page >= result.pages - 1;
+}
+
+function sortPreview(column) {
+  if (preview.sortBy !== column) {
+    Object.assign(preview, { sortBy: column, descending: false });
+  } else if (!preview.descending) {
+    preview.descending = true;
+  } else {
+    Object.assign(preview, { sortBy: "", descending: false });
+  }
+  preview.page = 0;
+  loadPreviewPage();
+}
+
+const jobStatusClass = {
+  queued: "idle",
+  running: "running",
+  succeeded: "done",
+  failed: "error",
+  cancelled: "error",
+};
+
+function formatSeconds(seconds) {
+  if (typeof seconds !== "number") return "";
+  return seconds < 60 ? `${seconds.toFixed(1)}s` : `${Math.floor(seconds / 60)}m ${Math.round(seconds % 60)}s`;
+}
+
+function renderJobs(jobs) {
+  const list = document.createDocumentFragment();
+  for (const job of [...(jobs || [])].reverse()) {
+    const item = document.createElement("li");
+    item.className = "job";
+    const title = document.createElement("span");
+    title.textContent = `${job.month || "Config month"} · ${job.config_path.split(/[\\/]/).pop()}`;
+    const status = document.createElement("span");
+    status.className = `pill ${jobStatusClass[job.status] || "idle"}`;
+    status.textContent = job.status;
+    const meta = document.createElement("span");
+    meta.className = "job-meta";
+    const timings = [`waited ${formatSeconds(job.queued_seconds)}`];
+    if (job.run_seconds !== null) timings.push(`ran ${formatSeconds(job.run_seconds)}`);
+    meta.textContent = job.error ? `${timings.join(", ")} · ${job.error}` : timings.join(", ");
+    item.append(title, status, meta);
+    if (job.status === "queued" || job.status === "running") {
+      const cancel = document.createElement("button");
+      cancel.className = "btn ghost";
+      cancel.textContent = "Cancel";
+      cancel.dataset.job = job.id;
+      item.appendChild(cancel);
+    }
+    list.appendChild(item);
+  }
+  elements.jobList.textContent = "";
+  elements.jobList.appendChild(list);
+}
+
+async function cancelJob(jobId) {
+  if (!api) return;
+  const result = await api.cancel_job(jobId);
+  if (!result || !result.ok) {
+    appendLog(`ERROR: ${result?.error || "Unable to cancel the run."}`);
+  }
 }
 
 function readFormValues() {
@@ -127,12 +370,21 @@ async function runPipeline() {
   if (!result || !result.ok) {
     setStatus("Error");
     appendLog(`ERROR: ${result?.error || "Unable to start pipeline."}`);
-  } else {
+  } else if (document.body.dataset.running !== "true") {
     setRunning(true);
     setStatus("Running...");
   }
 }
 
+async function cancelRun() {
+  if (!api) return;
+  elements.cancelButton.disabled = true;
+  const result = await api.cancel_run();
+  if (!result || !result.ok) {
+    appendLog(`ERROR: ${result?.error || "Unable to cancel the run."}`);
+  }
+}
+
 async function openOutput() {
   if (!api) return;
   const result = await api.open_output();
@@ -149,35 +401,66 @@ async function openLog() {
   }
 }
 
+// Applies one batch in a single pass: log lines are collected and appended
+// together, so a batch costs one render however many lines it carries.
+function applyUpdates(updates) {
+  let pending = [];
+  const flushLog = () => {
+    appendLogLines(pending);
+    pending = [];
+  };
+  for (const event of updates || []) {
+    switch (event.type) {
+      case "log_clear":
+        pending = [];
+        clearLog();
+        break;
+      case "log":
+        pending.push(event.message);
+        break;
+      case "status":
+        setStatus(event.message);
+        break;
+      case "progress":
+        setProgress(event);
+        break;
+      case "state":
+        lastOutputRoot = event.output_root || "";
+        lastLogFile = event.log_file || "";
+        setRunning(event.running);
+        if (event.running) {
+          hidePreview();
+        } else {
+          loadPreviews();
+        }
+        break;
+      case "jobs":
+        renderJobs(event.jobs);
+        break;
+      case "error":
+        setStatus("Error");
+        break;
+      default:
+        break;
+    }
+  }
+  flushLog();
+}
+
+// Called from Python (window.evaluate_js) with each coalesced batch.
+window.receiveUpdates = (updates) => {
+  if (pollTimer) {
+    window.clearInterval(pollTimer);
+    pollTimer = null;
+  }
+  applyUpdates(updates);
+};
+
 async function pollUpdates() {
   if (!api || polling) return;
   polling = true;
   try {
-    const updates = await api.get_updates();
-    updates.forEach((event) => {
-      switch (event.type) {
-        case "log_clear":
-          clearLog();
-          break;
-        case "log":
-          appendLog(event.message);
-          break;
-        case "status":
-          setStatus(event.message);
-          break;
-        case "state":
-          lastOutputRoot = event.output_root || "";
-          lastLogFile = event.log_file || "";
-          setRunning(event.running);
-          break;
-        case "error":
-          setStatus("Error");
-          appendLog(`ERROR: ${event.message}`);
-          break;
-        default:
-          break;
-      }
-    });
+    applyUpdates(await api.get_updates());
   } finally {
     polling = false;
   }
@@ -221,8 +504,30 @@ function attachHandlers() {
   });
 
   elements.runButton.addEventListener("click", runPipeline);
+  elements.cancelButton.addEventListener("click", cancelRun);
   elements.openOutputButton.addEventListener("click", openOutput);
   elements.openLogButton.addEventListener("click", openLog);
+  elements.previewSelect.addEventListener("change", () => selectPreview(elements.previewSelect.value));
+  elements.previewPrev.addEventListener("click", () => {
+    preview.page -= 1;
+    loadPreviewPage();
+  });
+  elements.previewNext.addEventListener("click", () => {
+    preview.page += 1;
+    loadPreviewPage();
+  });
+  elements.previewGrid.tHead.addEventListener("click", (event) => {
+    const th = event.target.closest("th");
+    if (th) sortPreview(th.dataset.column);
+  });
+  elements.jobList.addEventListener("click", (event) => {
+    const button = event.target.closest("button[data-job]");
+    if (button) cancelJob(button.dataset.job);
+  });
+  elements.logOutput.addEventListener("scroll", () => {
+    logView.follow = logAtBottom();
+    scheduleLogRender();
+  });
 }
 
 let initAttempts = 0;
@@ -257,13 +562,19 @@ async function init() {
   elements.month.value = state.month || "";
   lastOutputRoot = state.last_output_root || "";
   lastLogFile = state.last_log_file || "";
+  appendLogLines(state.log_tail || []);
   setStatus(state.status || "Idle");
   setRunning(Boolean(state.running));
+  renderJobs((await api.list_jobs())?.jobs);
   attachHandlers();
   if (elements.configPath.value) {
     await prefillFromConfig();
   }
-  setInterval(pollUpdates, 300);
+  // Python pushes batches once push is enabled; polling stays as the fallback.
+  const pushing = typeof api.enable_push === "function" && (await api.enable_push());
+  if (!pushing) {
+    pollTimer = window.setInterval(pollUpdates, 300);
+  }
 }
 
 function boot() {